@@ -1,12 +1,19 @@
 import streamlit as st
-import pandas as pd
-from datetime import date, datetime
-from dateutil.relativedelta import relativedelta
-import calendar
-import plotly.graph_objects as go
-import plotly.express as px
-import textwrap
-import numpy as np
+from datetime import date
+import logging
+import os
+from saas_model.timing import REGISTRY, current_run, phase, timed_run
+
+# NumPy, pandas, Plotly and the model are imported where the results are drawn,
+# so a cold start paints the input form without loading them
+
+# Optional observability: a Prometheus text file rewritten after every timed run,
+# the in-app performance panel, and JSON timing log lines on stderr
+METRICS_PATH = os.environ.get("SAAS_METRICS_PATH")
+DEBUG_PANEL = os.environ.get("SAAS_DEBUG_PANEL", "") not in ("", "0")
+if os.environ.get("SAAS_TIMING_LOG", "") not in ("", "0") and not logging.getLogger("saas_model.timing").handlers:
+    logging.getLogger("saas_model.timing").setLevel(logging.INFO)
+    logging.getLogger("saas_model.timing").addHandler(logging.StreamHandler())
 
 # Initialize session state form
 if "page" not in st.session_state:
@@ -18,9 +25,23 @@ if "form_data" not in st.session_state:
 if "calculate" not in st.session_state:
     st.session_state.calculate = False
 
+if "risk" not in st.session_state:
+    st.session_state.risk = None
+
+if "goal" not in st.session_state:
+    st.session_state.goal = None
+
+if "sensitivity" not in st.session_state:
+    st.session_state.sensitivity = {}
+
 st.title("📊 SaaS Financial Model")
 
-with st.form("single_page_form", clear_on_submit=False):
+# Live mode recomputes the results as the inputs change instead of on "Calculate Projections"
+st.toggle("Live Mode", key="live", help="Update the results after every input change. Only the inputs and results are redrawn; the analysis sections below refresh on their next run.")
+
+
+def assumption_inputs(inputs):
+    """Draw the assumption widgets, storing their values in ``inputs`` (rates as fractions)."""
     # Core Parameters - Column 1
     st.subheader("Revenue Model Core Parameters")
     col1, col2 = st.columns(2)
@@ -35,15 +56,17 @@ with st.form("single_page_form", clear_on_submit=False):
         kick_off_date = date(int(selected_year), 1, 1)  # Fixed to January (month=1)
         
         # Store in session state
-        st.session_state.form_data['kick_off_date'] = kick_off_date
-        st.session_state.form_data['subscription_price'] = st.number_input("Monthly Subscription Price ($)",min_value=0.0,value=25.5,step=0.5, format="%.2f")
+        inputs['kick_off_date'] = kick_off_date
+        inputs['horizon_years'] = st.number_input("Projection Horizon (Years)", min_value=1, max_value=30, value=5, step=1, help="Years after the fifth keep the Year 5 growth and conversion rates")
+        inputs['subscription_price'] = st.number_input("Monthly Subscription Price ($)",min_value=0.0,value=25.5,step=0.5, format="%.2f")
 
 
     
     with col2:
-        st.session_state.form_data['free_trial_days'] = st.number_input("Subscription Free Trial (Days)", min_value=0, max_value=28,value=7,step=1)
-        st.session_state.form_data['trial_to_paid'] = st.number_input("Monthly Trial To Paid Rate (%)", min_value=0, max_value=100,value=25,step=1) / 100
-        st.session_state.form_data['churn_rate'] = st.number_input("Monthly Churn Rate (%) - Paying users who unsubscribe", min_value=1, max_value=100,value=25,step=1) / 100      
+        inputs['free_trial_days'] = st.number_input("Subscription Free Trial (Days)", min_value=0, max_value=28,value=7,step=1)
+        inputs['daily_trials'] = st.checkbox("Simulate Free Trials Day by Day", value=False, help="Spreads each month's new trials over its days, following traffic growth, and converts each trial on the day it expires")
+        inputs['trial_to_paid'] = st.number_input("Monthly Trial To Paid Rate (%)", min_value=0, max_value=100,value=25,step=1) / 100
+        inputs['churn_rate'] = st.number_input("Monthly Churn Rate (%) - Paying users who unsubscribe", min_value=1, max_value=100,value=25,step=1) / 100      
         
     
     # Traffic Inputs
@@ -52,15 +75,15 @@ with st.form("single_page_form", clear_on_submit=False):
     traffic_col1, traffic_col2, traffic_col3 = st.columns(3)
     
     with traffic_col1:
-        st.session_state.form_data['sem_traffic_m1'] = st.number_input(
+        inputs['sem_traffic_m1'] = st.number_input(
             "Paid Traffic (SEM Traffic) - First Month", min_value=0, 
             value=100000, step=1000, format="%d")
     with traffic_col2:
-        st.session_state.form_data['seo_traffic_m1'] = st.number_input(
+        inputs['seo_traffic_m1'] = st.number_input(
             "Organic Traffic (SEO Traffic) - First Month", min_value=0, 
             value=100000, step=1000, format="%d")
     with traffic_col3:
-        st.session_state.form_data['am_traffic_m1'] = st.number_input(
+        inputs['am_traffic_m1'] = st.number_input(
             "Affiliate Marketing Traffic - First Month (Traffic coming from another website)", min_value=0, 
             value=10000, step=1000, format="%d")    
     
@@ -72,43 +95,43 @@ with st.form("single_page_form", clear_on_submit=False):
     st.markdown("**Web/App Paid Traffic (SEM Traffic) Monthly Growth Rate by Year**")
     _cols = st.columns(5)
     with _cols[0]:
-        st.session_state.form_data['sem_traffic_gr_y1'] = st.number_input("Monthly Growth Rate - Year 1 (%)", 0.0, 100.0, 2.0, 0.5, key="_y1") / 100
+        inputs['sem_traffic_gr_y1'] = st.number_input("Monthly Growth Rate - Year 1 (%)", 0.0, 100.0, 2.0, 0.5, key="_y1") / 100
     with _cols[1]:
-        st.session_state.form_data['sem_traffic_gr_y2'] = st.number_input("Monthly Growth Rate - Year 2 (%)", 0.0, 100.0, 2.0, 0.5, key="_y2") / 100
+        inputs['sem_traffic_gr_y2'] = st.number_input("Monthly Growth Rate - Year 2 (%)", 0.0, 100.0, 2.0, 0.5, key="_y2") / 100
     with _cols[2]:
-        st.session_state.form_data['sem_traffic_gr_y3'] = st.number_input("Monthly Growth Rate - Year 3 (%)", 0.0, 100.0, 2.0, 0.5, key="sem_y3") / 100
+        inputs['sem_traffic_gr_y3'] = st.number_input("Monthly Growth Rate - Year 3 (%)", 0.0, 100.0, 2.0, 0.5, key="sem_y3") / 100
     with _cols[3]:
-        st.session_state.form_data['sem_traffic_gr_y4'] = st.number_input("Monthly Growth Rate - Year 4 (%)", 0.0, 100.0, 2.0, 0.5, key="sem_y4") / 100
+        inputs['sem_traffic_gr_y4'] = st.number_input("Monthly Growth Rate - Year 4 (%)", 0.0, 100.0, 2.0, 0.5, key="sem_y4") / 100
     with _cols[4]:
-        st.session_state.form_data['sem_traffic_gr_y5'] = st.number_input("Monthly Growth Rate - Year 5 (%)", 0.0, 100.0, 2.0, 0.5, key="sem_y5") / 100
+        inputs['sem_traffic_gr_y5'] = st.number_input("Monthly Growth Rate - Year 5 (%)", 0.0, 100.0, 2.0, 0.5, key="sem_y5") / 100
     
     # SEO Growth Rates
     st.markdown("**Web/App Organic Traffic (SEO Traffic) Monthly Growth Rate by Year**")
     seo_cols = st.columns(5)
     with seo_cols[0]:
-        st.session_state.form_data['seo_traffic_gr_y1'] = st.number_input("Monthly Growth Rate - Year 1 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y1") / 100
+        inputs['seo_traffic_gr_y1'] = st.number_input("Monthly Growth Rate - Year 1 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y1") / 100
     with seo_cols[1]:
-        st.session_state.form_data['seo_traffic_gr_y2'] = st.number_input("Monthly Growth Rate - Year 2 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y2") / 100
+        inputs['seo_traffic_gr_y2'] = st.number_input("Monthly Growth Rate - Year 2 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y2") / 100
     with seo_cols[2]:
-        st.session_state.form_data['seo_traffic_gr_y3'] = st.number_input("Monthly Growth Rate - Year 3 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y3") / 100
+        inputs['seo_traffic_gr_y3'] = st.number_input("Monthly Growth Rate - Year 3 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y3") / 100
     with seo_cols[3]:
-        st.session_state.form_data['seo_traffic_gr_y4'] = st.number_input("Monthly Growth Rate - Year 4 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y4") / 100
+        inputs['seo_traffic_gr_y4'] = st.number_input("Monthly Growth Rate - Year 4 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y4") / 100
     with seo_cols[4]:
-        st.session_state.form_data['seo_traffic_gr_y5'] = st.number_input("Monthly Growth Rate - Year 5 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y5") / 100
+        inputs['seo_traffic_gr_y5'] = st.number_input("Monthly Growth Rate - Year 5 (%)", 0.0, 100.0, 2.0, 0.5, key="seo_y5") / 100
     
     # Affiliate Marketing Growth Rates
     st.markdown("**Web/App Affiliate Marketing Traffic Monthly Growth Rate by Year**")
     am_cols = st.columns(5)
     with am_cols[0]:
-        st.session_state.form_data['am_traffic_gr_y1'] = st.number_input("Monthly Growth Rate - Year 1 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y1") / 100
+        inputs['am_traffic_gr_y1'] = st.number_input("Monthly Growth Rate - Year 1 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y1") / 100
     with am_cols[1]:
-        st.session_state.form_data['am_traffic_gr_y2'] = st.number_input("Monthly Growth Rate - Year 2 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y2") / 100
+        inputs['am_traffic_gr_y2'] = st.number_input("Monthly Growth Rate - Year 2 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y2") / 100
     with am_cols[2]:
-        st.session_state.form_data['am_traffic_gr_y3'] = st.number_input("Monthly Growth Rate - Year 3 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y3") / 100
+        inputs['am_traffic_gr_y3'] = st.number_input("Monthly Growth Rate - Year 3 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y3") / 100
     with am_cols[3]:
-        st.session_state.form_data['am_traffic_gr_y4'] = st.number_input("Monthly Growth Rate - Year 4 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y4") / 100
+        inputs['am_traffic_gr_y4'] = st.number_input("Monthly Growth Rate - Year 4 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y4") / 100
     with am_cols[4]:
-        st.session_state.form_data['am_traffic_gr_y5'] = st.number_input("Monthly Growth Rate - Year 5 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y5") / 100
+        inputs['am_traffic_gr_y5'] = st.number_input("Monthly Growth Rate - Year 5 (%)", 0.0, 100.0, 2.0, 0.5, key="am_y5") / 100
     
     # Conversion Rates Section
     st.markdown("")
@@ -118,43 +141,43 @@ with st.form("single_page_form", clear_on_submit=False):
     st.markdown("**Paid Traffic (SEM Traffic) Conversion Rates**")
     sem_cr_cols = st.columns(5)
     with sem_cr_cols[0]:
-        st.session_state.form_data['sem_cr_y1'] = st.number_input("Year 1 (%)", 0.1, 100.0, 4.0, 0.1, key="sem_cr_y1") / 100
+        inputs['sem_cr_y1'] = st.number_input("Year 1 (%)", 0.1, 100.0, 4.0, 0.1, key="sem_cr_y1") / 100
     with sem_cr_cols[1]:
-        st.session_state.form_data['sem_cr_y2'] = st.number_input("Year 2 (%)", 0.1, 100.0, 4.5, 0.1, key="sem_cr_y2") / 100
+        inputs['sem_cr_y2'] = st.number_input("Year 2 (%)", 0.1, 100.0, 4.5, 0.1, key="sem_cr_y2") / 100
     with sem_cr_cols[2]:
-        st.session_state.form_data['sem_cr_y3'] = st.number_input("Year 3 (%)", 0.1, 100.0, 5.0, 0.1, key="sem_cr_y3") / 100
+        inputs['sem_cr_y3'] = st.number_input("Year 3 (%)", 0.1, 100.0, 5.0, 0.1, key="sem_cr_y3") / 100
     with sem_cr_cols[3]:
-        st.session_state.form_data['sem_cr_y4'] = st.number_input("Year 4 (%)", 0.1, 100.0, 5.5, 0.1, key="sem_cr_y4") / 100
+        inputs['sem_cr_y4'] = st.number_input("Year 4 (%)", 0.1, 100.0, 5.5, 0.1, key="sem_cr_y4") / 100
     with sem_cr_cols[4]:
-        st.session_state.form_data['sem_cr_y5'] = st.number_input("Year 5 (%)", 0.1, 100.0, 6.0, 0.1, key="sem_cr_y5") / 100
+        inputs['sem_cr_y5'] = st.number_input("Year 5 (%)", 0.1, 100.0, 6.0, 0.1, key="sem_cr_y5") / 100
     
     # SEO Conversion Rates
     st.markdown("**Organic Tradffic (SEO Traffic) Conversion Rates**")
     seo_cr_cols = st.columns(5)
     with seo_cr_cols[0]:
-        st.session_state.form_data['seo_cr_y1'] = st.number_input("Year 1 (%)", 0.1, 100.0, 4.0, 0.1, key="seo_cr_y1") / 100
+        inputs['seo_cr_y1'] = st.number_input("Year 1 (%)", 0.1, 100.0, 4.0, 0.1, key="seo_cr_y1") / 100
     with seo_cr_cols[1]:
-        st.session_state.form_data['seo_cr_y2'] = st.number_input("Year 2 (%)", 0.1, 100.0, 4.5, 0.1, key="seo_cr_y2") / 100
+        inputs['seo_cr_y2'] = st.number_input("Year 2 (%)", 0.1, 100.0, 4.5, 0.1, key="seo_cr_y2") / 100
     with seo_cr_cols[2]:
-        st.session_state.form_data['seo_cr_y3'] = st.number_input("Year 3 (%)", 0.1, 100.0, 5.0, 0.1, key="seo_cr_y3") / 100
+        inputs['seo_cr_y3'] = st.number_input("Year 3 (%)", 0.1, 100.0, 5.0, 0.1, key="seo_cr_y3") / 100
     with seo_cr_cols[3]:
-        st.session_state.form_data['seo_cr_y4'] = st.number_input("Year 4 (%)", 0.1, 100.0, 5.5, 0.1, key="seo_cr_y4") / 100
+        inputs['seo_cr_y4'] = st.number_input("Year 4 (%)", 0.1, 100.0, 5.5, 0.1, key="seo_cr_y4") / 100
     with seo_cr_cols[4]:
-        st.session_state.form_data['seo_cr_y5'] = st.number_input("Year 5 (%)", 0.1, 100.0, 6.0, 0.1, key="seo_cr_y5") / 100
+        inputs['seo_cr_y5'] = st.number_input("Year 5 (%)", 0.1, 100.0, 6.0, 0.1, key="seo_cr_y5") / 100
 
     # Affiliate Marketing Conversion Rates
     st.markdown("**Affiliate Marketing Traffic Conversion Rates**")
     am_cr_cols = st.columns(5)
     with am_cr_cols[0]:
-        st.session_state.form_data['am_cr_y1'] = st.number_input("Year 1 (%)", 0.1, 100.0, 4.0, 0.1, key="am_cr_y1") / 100
+        inputs['am_cr_y1'] = st.number_input("Year 1 (%)", 0.1, 100.0, 4.0, 0.1, key="am_cr_y1") / 100
     with am_cr_cols[1]:
-        st.session_state.form_data['am_cr_y2'] = st.number_input("Year 2 (%)", 0.1, 100.0, 4.5, 0.1, key="am_cr_y2") / 100
+        inputs['am_cr_y2'] = st.number_input("Year 2 (%)", 0.1, 100.0, 4.5, 0.1, key="am_cr_y2") / 100
     with am_cr_cols[2]:
-        st.session_state.form_data['am_cr_y3'] = st.number_input("Year 3 (%)", 0.1, 100.0, 5.0, 0.1, key="am_cr_y3") / 100
+        inputs['am_cr_y3'] = st.number_input("Year 3 (%)", 0.1, 100.0, 5.0, 0.1, key="am_cr_y3") / 100
     with am_cr_cols[3]:
-        st.session_state.form_data['am_cr_y4'] = st.number_input("Year 4 (%)", 0.1, 100.0, 5.5, 0.1, key="am_cr_y4") / 100
+        inputs['am_cr_y4'] = st.number_input("Year 4 (%)", 0.1, 100.0, 5.5, 0.1, key="am_cr_y4") / 100
     with am_cr_cols[4]:
-        st.session_state.form_data['am_cr_y5'] = st.number_input("Year 5 (%)", 0.1, 100.0, 6.0, 0.1, key="am_cr_y5") / 100
+        inputs['am_cr_y5'] = st.number_input("Year 5 (%)", 0.1, 100.0, 6.0, 0.1, key="am_cr_y5") / 100
 
     
 
@@ -164,17 +187,17 @@ with st.form("single_page_form", clear_on_submit=False):
     cost_col1, cost_col2 = st.columns(2)
     
     with cost_col1:
-        st.session_state.form_data['sem_cpc'] = st.number_input("SEM Cost Per Click - CPC ($)", min_value=0.0, value=1.0, step=0.5, format="%.2f")
-        st.session_state.form_data['affiliate_cpa'] = st.number_input("Affiliate Marketing Customer Acquisition Cost - CAC ($)", min_value=0.0, value=11.0, step=0.5, format="%.2f")
-        st.session_state.form_data['monthly_seo_marketing_cost'] = st.number_input("Monthly SEO Marketing Cost ($)", min_value=0, value=300, step=50)
-        st.session_state.form_data['ccp_rate'] = st.number_input("Credit Card Processing Cost (% of Revenue)", min_value=0.0, value=10.0, step=0.5, format="%.2f") / 100
-        st.session_state.form_data['refund_rate'] = st.number_input("Refund Rate (% of Revenue)", min_value=0.0, value=5.0, step=0.5, format="%.2f") / 100
+        inputs['sem_cpc'] = st.number_input("SEM Cost Per Click - CPC ($)", min_value=0.0, value=1.0, step=0.5, format="%.2f")
+        inputs['affiliate_cpa'] = st.number_input("Affiliate Marketing Customer Acquisition Cost - CAC ($)", min_value=0.0, value=11.0, step=0.5, format="%.2f")
+        inputs['monthly_seo_marketing_cost'] = st.number_input("Monthly SEO Marketing Cost ($)", min_value=0, value=300, step=50)
+        inputs['ccp_rate'] = st.number_input("Credit Card Processing Cost (% of Revenue)", min_value=0.0, value=10.0, step=0.5, format="%.2f") / 100
+        inputs['refund_rate'] = st.number_input("Refund Rate (% of Revenue)", min_value=0.0, value=5.0, step=0.5, format="%.2f") / 100
         
     with cost_col2:
-        st.session_state.form_data['chb_rate'] = st.number_input("Chargeback Rate (% of Revenue)", min_value=0.0, value=0.5, step=0.5, format="%.2f") / 100
-        st.session_state.form_data['monthly_web_hosting_cost'] = st.number_input("Monthly Web Hosting Cost ($)", min_value=0, value=300, step=50)
-        st.session_state.form_data['monthly_techsoft_cost'] = st.number_input("Monthly Technology & Software Cost ($)", min_value=0, value=300, step=50)
-        st.session_state.form_data['monthly_labor_cost'] = st.number_input("Monthly Labor Cost ($)", min_value=0, value=10000, step=1000)
+        inputs['chb_rate'] = st.number_input("Chargeback Rate (% of Revenue)", min_value=0.0, value=0.5, step=0.5, format="%.2f") / 100
+        inputs['monthly_web_hosting_cost'] = st.number_input("Monthly Web Hosting Cost ($)", min_value=0, value=300, step=50)
+        inputs['monthly_techsoft_cost'] = st.number_input("Monthly Technology & Software Cost ($)", min_value=0, value=300, step=50)
+        inputs['monthly_labor_cost'] = st.number_input("Monthly Labor Cost ($)", min_value=0, value=10000, step=1000)
 
     # Other Revenue Sources
     st.markdown("")
@@ -183,10 +206,10 @@ with st.form("single_page_form", clear_on_submit=False):
     AdNet_col1, AdNet_col2 = st.columns(2)
     
     with AdNet_col1:
-        st.session_state.form_data['views per visit'] = st.number_input("Page Views Per Visit", min_value=1, value=1, step=1)
+        inputs['views per visit'] = st.number_input("Page Views Per Visit", min_value=1, value=1, step=1)
         
     with AdNet_col2:
-        st.session_state.form_data['cpm'] = st.number_input("Revenue Per Mile/1,000 Impressions - RPM ($)", min_value=0.0, value=0.0, step=0.5, format="%.2f")
+        inputs['cpm'] = st.number_input("Revenue Per Mile/1,000 Impressions - RPM ($)", min_value=0.0, value=0.0, step=0.5, format="%.2f")
         
 
     # Other Revenue Sources
@@ -196,615 +219,54 @@ with st.form("single_page_form", clear_on_submit=False):
     AdAF_col1, AdAF_col2 = st.columns(2)
     
     with AdAF_col1:
-        st.session_state.form_data['am_ctr'] = st.number_input("Affiliate Ad Click-Trough Rate CTR (%)", min_value=0.0, value=0.0, step=0.5, format="%.2f") / 100
+        inputs['am_ctr'] = st.number_input("Affiliate Ad Click-Trough Rate CTR (%)", min_value=0.0, value=0.0, step=0.5, format="%.2f") / 100
         
  
     with AdAF_col2:
-        st.session_state.form_data['am_ocr'] = st.number_input("Affiliate Offer Conversion Rate (%)", min_value=0.0, value=0.0, step=0.5, format="%.2f") / 100
-        st.session_state.form_data['am_cpa'] = st.number_input("Affiliate Comission Per Action CPA Revenue ($)", min_value=0.0, value=0.0, step=0.5, format="%.2f")
-     
-           
-    # Calculate button - FIXED VERSION
-    if st.form_submit_button("Calculate Projections"):
-        st.session_state.calculate = True
-        st.rerun()
-
+        inputs['am_ocr'] = st.number_input("Affiliate Offer Conversion Rate (%)", min_value=0.0, value=0.0, step=0.5, format="%.2f") / 100
+        inputs['am_cpa'] = st.number_input("Affiliate Comission Per Action CPA Revenue ($)", min_value=0.0, value=0.0, step=0.5, format="%.2f")
 
 
-# Calculations and Results
-if st.session_state.calculate:
-    # Extract all variables from session state
-    form_data = st.session_state.form_data
-    kick_off_date = form_data['kick_off_date']
-    subscription_price = form_data['subscription_price']
-    free_trial_days = form_data['free_trial_days']
-    trial_to_paid = form_data['trial_to_paid']
-    churn_rate = form_data['churn_rate']
+def show_results(form_data):
+    """Draw the charts, the key metrics table, the warnings and the stage timings for ``form_data``."""
+    # Extract the inputs used by the warnings below
     sem_traffic_m1 = form_data['sem_traffic_m1']
-    seo_traffic_m1 = form_data['seo_traffic_m1']
     am_traffic_m1 = form_data['am_traffic_m1']
-    sem_traffic_gr_y1 = form_data['sem_traffic_gr_y1']
-    sem_traffic_gr_y2 = form_data['sem_traffic_gr_y2']
-    sem_traffic_gr_y3 = form_data['sem_traffic_gr_y3']
-    sem_traffic_gr_y4 = form_data['sem_traffic_gr_y4']
-    sem_traffic_gr_y5 = form_data['sem_traffic_gr_y5']
-    seo_traffic_gr_y1 = form_data['seo_traffic_gr_y1']
-    seo_traffic_gr_y2 = form_data['seo_traffic_gr_y2']
-    seo_traffic_gr_y3 = form_data['seo_traffic_gr_y3']
-    seo_traffic_gr_y4 = form_data['seo_traffic_gr_y4']
-    seo_traffic_gr_y5 = form_data['seo_traffic_gr_y5']
-    am_traffic_gr_y1 = form_data['am_traffic_gr_y1']
-    am_traffic_gr_y2 = form_data['am_traffic_gr_y2']
-    am_traffic_gr_y3 = form_data['am_traffic_gr_y3']
-    am_traffic_gr_y4 = form_data['am_traffic_gr_y4']
-    am_traffic_gr_y5 = form_data['am_traffic_gr_y5']
-    sem_cr_y1 = form_data['sem_cr_y1']
-    sem_cr_y2 = form_data['sem_cr_y2']
-    sem_cr_y3 = form_data['sem_cr_y3']
-    sem_cr_y4 = form_data['sem_cr_y4']
-    sem_cr_y5 = form_data['sem_cr_y5']
-    seo_cr_y1 = form_data['seo_cr_y1']
-    seo_cr_y2 = form_data['seo_cr_y2']
-    seo_cr_y3 = form_data['seo_cr_y3']
-    seo_cr_y4 = form_data['seo_cr_y4']
-    seo_cr_y5 = form_data['seo_cr_y5']
-    am_cr_y1 = form_data['am_cr_y1']
-    am_cr_y2 = form_data['am_cr_y2']
-    am_cr_y3 = form_data['am_cr_y3']
-    am_cr_y4 = form_data['am_cr_y4']
-    am_cr_y5 = form_data['am_cr_y5']
     sem_cpc = form_data['sem_cpc']
     affiliate_cpa = form_data['affiliate_cpa']
-    ccp_rate = form_data['ccp_rate']
-    refund_rate = form_data['refund_rate']
-    chb_rate = form_data['chb_rate']
-    monthly_web_hosting_cost = form_data['monthly_web_hosting_cost']
-    monthly_techsoft_cost = form_data['monthly_techsoft_cost']
-    monthly_labor_cost = form_data['monthly_labor_cost']
-    monthly_seo_marketing_cost=form_data['monthly_seo_marketing_cost']
-    views_per_visit=0.000000001 if form_data['views per visit'] == 0 else form_data['views per visit']
-    cpm=0 if form_data['views per visit'] == 0 else form_data['cpm']
-    
-    
-    am_ctr=form_data['am_ctr']
-    am_cpa=form_data['am_cpa']
-    am_ocr=form_data['am_ocr']
-    renewal_rate = 1 - churn_rate
-    LTV = (subscription_price * trial_to_paid) / (1 - renewal_rate)
-
-    affiliate_marketing_roi=LTV-affiliate_cpa
-    
-    if affiliate_cpa == 0:
-        affiliate_marketing_roi_percent = None 
-    else: 
-        affiliate_marketing_roi_percent = affiliate_marketing_roi/affiliate_cpa
-
-    # First, let's create a function to determine the growth rate based on the month index
-    def get_sem_growth_rate(month_idx):
-        if month_idx <= 11:  # Year 1
-            return 1 + sem_traffic_gr_y1 if sem_traffic_gr_y1 != 0 else 1
-        elif month_idx <= 23:  # Year 2
-            return 1 + sem_traffic_gr_y2 if sem_traffic_gr_y2 != 0 else 1
-        elif month_idx <= 35:  # Year 3
-            return 1 + sem_traffic_gr_y3 if sem_traffic_gr_y3 != 0 else 1
-        elif month_idx <= 47:  # Year 4
-            return 1 + sem_traffic_gr_y4 if sem_traffic_gr_y4 != 0 else 1
-        else:  # Year 5
-            return 1 + sem_traffic_gr_y5 if sem_traffic_gr_y5 != 0 else 1
-
-    def get_sem_cr(month_idx):
-        if month_idx <= 11:    # Year 1
-            return sem_cr_y1 
-        elif month_idx <= 23:  # Year 2
-            return sem_cr_y2
-        elif month_idx <= 35:  # Year 3
-            return sem_cr_y3
-        elif month_idx <= 47:  # Year 4
-            return sem_cr_y4
-        else:                  # Year 5
-            return sem_cr_y5  
-
-    def get_seo_growth_rate(month_idx):
-        if month_idx <= 11:  # Year 1
-            return 1 + seo_traffic_gr_y1
-        elif month_idx <= 23:  # Year 2
-            return 1 + seo_traffic_gr_y2
-        elif month_idx <= 35:  # Year 3
-            return 1 + seo_traffic_gr_y3
-        elif month_idx <= 47:  # Year 4
-            return 1 + seo_traffic_gr_y4
-        else:  # Year 5
-            return 1 + seo_traffic_gr_y5
-
-    def get_seo_cr(month_idx):
-        if month_idx <= 11:    # Year 1
-            return seo_cr_y1
-        elif month_idx <= 23:  # Year 2
-            return seo_cr_y2
-        elif month_idx <= 35:  # Year 3
-            return seo_cr_y3
-        elif month_idx <= 47:  # Year 4
-            return seo_cr_y4
-        else:                  # Year 5
-            return seo_cr_y5      
-
-    def get_am_growth_rate(month_idx):
-        if month_idx <= 11:  # Year 1
-            return 1 + am_traffic_gr_y1
-        elif month_idx <= 23:  # Year 2
-            return 1 + am_traffic_gr_y2
-        elif month_idx <= 35:  # Year 3
-            return 1 + am_traffic_gr_y3
-        elif month_idx <= 47:  # Year 4
-            return 1 + am_traffic_gr_y4
-        else:  # Year 5
-            return 1 + am_traffic_gr_y5
-
-    def get_am_cr(month_idx):
-        if month_idx <= 11:    # Year 1
-            return am_cr_y1
-        elif month_idx <= 23:  # Year 2
-            return am_cr_y2
-        elif month_idx <= 35:  # Year 3
-            return am_cr_y3
-        elif month_idx <= 47:  # Year 4
-            return am_cr_y4
-        else:                  # Year 5
-            return am_cr_y5
-            
-
-
-    # Recurring revenue and financials dataframe
-    months = [kick_off_date + relativedelta(months=i) for i in range(60)]
-    # Create DataFrame
-    df = pd.DataFrame({
-        "Month": [kick_off_date + relativedelta(months=i) for i in range(60)],
-        "Year": [month.year for month in months],  # Extract year from each date
-        "Days Count": [calendar.monthrange(month.year, month.month)[1] for month in months],
-    })
-    df["Cross-Over Month Trial-To-Paid"] = free_trial_days / df["Days Count"]
-    df["Trial-To-Paid Within Month"] = 1 - df["Cross-Over Month Trial-To-Paid"]
-    
-    df["SEM - Paid Traffic"] = 0.0
-    df.at[0, "SEM - Paid Traffic"] = sem_traffic_m1  # Set first month value
-
-    # Calculate subsequent months
-    for i in range(1, 60):
-        sem_growth_rate = get_sem_growth_rate(i)
-        df.at[i, "SEM - Paid Traffic"] = df.at[i-1, "SEM - Paid Traffic"] * sem_growth_rate
-
-    df["SEO - Organic Traffic"] = 0.0
-    df.at[0, "SEO - Organic Traffic"] = seo_traffic_m1  # Set first month value
 
-    # Calculate subsequent months
-    for i in range(1, 60):
-        seo_growth_rate = get_seo_growth_rate(i)
-        df.at[i, "SEO - Organic Traffic"] = df.at[i-1, "SEO - Organic Traffic"] * seo_growth_rate
+    with phase("imports"):
+        import numpy as np
+        import plotly.io as pio
+        from results import export_tables, format_metrics_table, get_results
+        from saas_model import sem_cac_exceeds_ltv
+        from saas_model.arrowio import MIME_TYPES, table_bytes
 
-    df["AM - Paid Traffic"] = 0.0
-    df.at[0, "AM - Paid Traffic"] = am_traffic_m1  # Set first month value
-
-    # Calculate subsequent months
-    for i in range(1, 60):
-        am_growth_rate = get_am_growth_rate(i)
-        df.at[i, "AM - Paid Traffic"] = df.at[i-1, "AM - Paid Traffic"] * am_growth_rate
-        
-    df["SEM Subscriptions"] = df["SEM - Paid Traffic"] * df.index.map(get_sem_cr)
-    df["SEO Subscriptions"] = df["SEO - Organic Traffic"] * df.index.map(get_seo_cr)
-    df["AM Subscriptions"] = df["AM - Paid Traffic"] * df.index.map(get_am_cr)
-    df["Total Monthly Subscriptions"] = df["SEM Subscriptions"] + df["SEO Subscriptions"] + df["AM Subscriptions"]
-    df["Website Views"]= (df["SEM - Paid Traffic"]+df["SEO - Organic Traffic"]+df["AM - Paid Traffic"])*views_per_visit
-
-    # Initialize the new column
-    df["Trial To Paid Transactions Count"] = 0.0
-
-    # First row calculation
-    df.at[0, "Trial To Paid Transactions Count"] = (
-        df.at[0, "Total Monthly Subscriptions"] * 
-        df.at[0, "Trial-To-Paid Within Month"] * 
-        trial_to_paid
-    )
-
-    # Subsequent rows calculation
-    for i in range(1, len(df)):
-        df.at[i, "Trial To Paid Transactions Count"] = (
-            (df.at[i, "Total Monthly Subscriptions"] * df.at[i, "Trial-To-Paid Within Month"] * trial_to_paid) +
-            (df.at[i-1, "Total Monthly Subscriptions"] * df.at[i-1, "Cross-Over Month Trial-To-Paid"] * trial_to_paid)
-        )
-
-    df["Monthly Renewal Transactions Count"] = 0.0
-    for i in range(1, len(df)):
-        prev_ttp = df.loc[i - 1, "Trial To Paid Transactions Count"]
-        renewal_prev = df.loc[i - 1, "Monthly Renewal Transactions Count"]
-        df.loc[i, "Monthly Renewal Transactions Count"] = (prev_ttp + renewal_prev) * (1 - churn_rate)  
-
-    df['New Monthly Recurring Revenue MRR'] = df["Trial To Paid Transactions Count"] * subscription_price
-    df['Renewal Recurring Revenue MRR'] = df["Monthly Renewal Transactions Count"] * subscription_price
-    df["Ad Network Revenue"]=(df["Website Views"]*(cpm/1000)) if views_per_visit > 0 else 0
-    df['Ad Affiliate Revenue']=df["Website Views"]*am_ctr*am_ocr*am_cpa/views_per_visit
-    df['Revenue'] = df['Renewal Recurring Revenue MRR'] + df['New Monthly Recurring Revenue MRR'] +df["Ad Network Revenue"]+df['Ad Affiliate Revenue']
-    df['Chargebacks'] = df['Revenue'] * chb_rate
-    df['Refunds'] = df['Revenue'] * refund_rate
-    df['Income'] = df['Revenue'] - df['Refunds'] - df['Chargebacks']
-    df['Credit Card Processing'] = df['Revenue'] * ccp_rate
-    df['Web Hosting'] = monthly_web_hosting_cost
-    df['Cost of Goods/Services Sold'] = df['Credit Card Processing'] + df['Web Hosting']
-    df['Gross Income'] = df['Income'] - df['Cost of Goods/Services Sold']
-    df['Labor Cost'] = monthly_labor_cost
-    df['SEM Marketing'] = df["SEM - Paid Traffic"] * sem_cpc
-    df["am_cpa_month_cost"]=affiliate_cpa
-    df['Affiliate Marketing'] = df["AM Subscriptions"] * affiliate_cpa
-    df['SEO Marketing Cost'] = monthly_seo_marketing_cost
-    df['Internet Marketing Cost'] = df['Affiliate Marketing'] + df['SEM Marketing']+df['SEO Marketing Cost']
-    df['Technology & Software'] = monthly_techsoft_cost
-    df['Earnings Before Taxes'] = df['Gross Income'] - df['Labor Cost'] - df['Internet Marketing Cost'] - df['Technology & Software']
-    df['Cash Flow Accumulation'] = df['Earnings Before Taxes']  # Initialize with first month's value
-
-    for i in range(1, len(df)):
-        prev_cf = df.loc[i - 1, 'Cash Flow Accumulation']
-        current_earnings = df.loc[i, 'Earnings Before Taxes']
-        df.loc[i, 'Cash Flow Accumulation'] = prev_cf + current_earnings
-
-    df["sem_cpa"]=df["SEM - Paid Traffic"]*sem_cpc/df["SEM Subscriptions"]
-
-    df["Internet Marketing CAC Weighted average"] = ((df["SEM Subscriptions"] * df["sem_cpa"]) + (df["AM Subscriptions"] * affiliate_cpa)) / (df["SEM Subscriptions"] + df["AM Subscriptions"])
-    
-    df["sem_roi"] = LTV - df["sem_cpa"]
-    df["sem_roi_percent"] = np.where(df["sem_cpa"] > 0, df["sem_roi"] / df["sem_cpa"], None)
-        
-    # dataframe for cac payback period
-    first_value = subscription_price * trial_to_paid
-    ltv_threshold = LTV * 0.999  # 99% of LTV
-
-    # Initialize list with the first period value
-    period_values = [first_value]
-
-    # Generate values until the cumulative sum reaches 99% of LTV
-    while sum(period_values) < ltv_threshold:
-        next_value = period_values[-1] * renewal_rate
-        period_values.append(next_value)
-
-    cumulative_ltv = pd.DataFrame({"Period Value": period_values})
-    cumulative_ltv["Accumulated Value"] = cumulative_ltv["Period Value"].cumsum()
-    start_month = free_trial_days / 30
-    months = [start_month + i for i in range(len(cumulative_ltv))]
-    cumulative_ltv["Months"] = months
-    
-
-        
-
-    def lookup_payback_period_am(am_cac_value):
-        if LTV < am_cac_value:
-            return "No Pay Back"
-        match_row = cumulative_ltv[cumulative_ltv["Accumulated Value"] >= am_cac_value].head(1)
-        if not match_row.empty:
-            return match_row["Months"].values[0]
-        else:
-            return "No Pay Back"
-    
-    def lookup_payback_period_sem(sem_cac_value):
-        if LTV < sem_cac_value:
-            return "No Pay Back"
-        match_row = cumulative_ltv[cumulative_ltv["Accumulated Value"] >= sem_cac_value].head(1)
-        if not match_row.empty:
-            return match_row["Months"].values[0]
-        else:
-            return "No Pay Back"
-    
-
-
-    df["time_to_recover_AM_cac"] = df["am_cpa_month_cost"].apply(lookup_payback_period_am)
-    df["time_to_recover_SEM_cac"] = df["sem_cpa"].apply(lookup_payback_period_sem)
-
-
-
-    # Financials dataframe consolidation
-    df_financials = df[[
-        'Month',
-        'Year',
-        'Revenue',
-        'Chargebacks',
-        'Refunds',
-        'Income',
-        'Credit Card Processing',
-        'Web Hosting',
-        'Cost of Goods/Services Sold',
-        'Gross Income',
-        'Labor Cost',
-        'SEM Marketing',
-        'Affiliate Marketing',
-        'Internet Marketing Cost',
-        'Technology & Software',
-        'Earnings Before Taxes',
-        'Cash Flow Accumulation'
-    ]]
-    df_financials_by_year = df_financials.groupby("Year", as_index=False).sum(numeric_only=True)
+    # Projection, yearly aggregates, charts and metrics table (cached on the inputs)
+    with phase("results"):
+        results = get_results(form_data)
+    metrics = results.key_metrics
 
     # Show charts
     st.title("📈 Financial Projections Results")
-
-    # Traffic Sources Chart
-    st.subheader("Web/App Monthly Traffic")
-    df_traffic = df[[
-        'Month',
-        'SEM - Paid Traffic',
-        'SEO - Organic Traffic',
-        'AM - Paid Traffic'
-    ]]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df_traffic["Month"],
-        y=df_traffic["SEM - Paid Traffic"],
-        mode='lines',
-        name='Paid(SEM)<br>Traffic',
-        line=dict(color='#1f77b4', width=2),
-        hovertemplate='SEM: %{y:,.0f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_traffic["Month"],
-        y=df_traffic["SEO - Organic Traffic"],
-        mode='lines',
-        name='Organic(SEO)<br>Traffic',
-        line=dict(color='#ff7f0e', width=2),
-        hovertemplate='SEO: %{y:,.0f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_traffic["Month"],
-        y=df_traffic["AM - Paid Traffic"],
-        mode='lines',
-        name='Affiliate<br>Marketing',
-        line=dict(color='#2ca02c', width=2),
-        hovertemplate='Affiliate: %{y:,.0f}<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        xaxis_title="Month",
-        yaxis_title="Traffic Volume",
-        xaxis=dict(
-            type='date',
-            tickformat='%b-%Y', 
-            tickmode='auto',
-            nticks=30,
-            tickangle=-45  # Optional: rotates labels for better readability
-        ),
-        yaxis=dict(tickformat=","),
-        hovermode="x unified",
-        legend=dict(title="Traffic Source"),
-        plot_bgcolor="white",
-        yaxis_gridcolor="lightgray",
-        margin=dict(t=25)
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)    
-
-    # Monthly Subscriptions
-    st.subheader("New Monthly Subscriptions & New Monthly Paying Users ")
-    df_subscriptions = df[[
-        'Month',
-        'Total Monthly Subscriptions',
-        'Trial To Paid Transactions Count'
-    ]]
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df_subscriptions["Month"],
-        y=df_subscriptions["Total Monthly Subscriptions"],
-        mode='lines',
-        name='New Monthly<br>Subscriptions',
-        line=dict(color='#4E79A7', width=2),
-        hovertemplate='Total Subs: %{y:,.0f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_subscriptions["Month"],
-        y=df_subscriptions["Trial To Paid Transactions Count"],
-        mode='lines',
-        name='Trial To Paid<br>New Users',
-        line=dict(color='#F28E2B', width=2),
-        hovertemplate='Trial To Paid: %{y:,.0f}<extra></extra>'
-    ))
-    
-    fig.update_layout(
-        xaxis_title="Month",
-        yaxis_title="Count",
-        xaxis=dict(
-            type='date',
-            tickformat='%b-%Y',
-            tickmode='auto',
-            nticks=30,
-            tickangle=-45
-        ),
-        yaxis=dict(tickformat=","),
-        hovermode="x unified",
-        legend=dict(title="Subscription Type"),
-        plot_bgcolor="white",
-        yaxis_gridcolor="lightgray",
-        margin=dict(t=25)
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Revenue split chart
-    st.subheader("Monthly Recurring Revenue MRR Split")
-    df_rev_split = df[[
-        'Month',
-        'New Monthly Recurring Revenue MRR',
-        'Renewal Recurring Revenue MRR' ,
-        'Ad Network Revenue',
-        'Ad Affiliate Revenue'
-    ]]
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df_rev_split["Month"],
-        y=df_rev_split["New Monthly Recurring Revenue MRR"],
-        mode='lines',
-        name='Trial To Paid<br>(New Users)',
-        stackgroup='one',
-        hovertemplate='Trial To Paid: $%{y:,.2f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_rev_split["Month"],
-        y=df_rev_split["Renewal Recurring Revenue MRR"],
-        mode='lines',
-        name='Recurring<br>Renewals',
-        stackgroup='one',
-        hovertemplate='Recurring Renewal: $%{y:,.2f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_rev_split["Month"],
-        y=df_rev_split["Ad Network Revenue"],
-        mode='lines',
-        name='Ad Network',
-        stackgroup='one',
-        hovertemplate='Ad Network: $%{y:,.2f}<extra></extra>'
-    ))
-    fig.add_trace(go.Scatter(
-        x=df_rev_split["Month"],
-        y=df_rev_split["Ad Affiliate Revenue"],
-        mode='lines',
-        name='Ad Affiliate<br>Marketing',
-        stackgroup='one',
-        hovertemplate='Ad Affiliate: $%{y:,.2f}<extra></extra>'
-    ))
-    fig.update_layout(
-        xaxis_title="Month",
-        yaxis_title="MRR ($)",
-        xaxis=dict(
-            type='date',
-            tickformat='%b-%Y',
-            tickmode='auto',
-            nticks=30,
-            tickangle=-45,
-            dtick='M2'# Optional: rotates labels for better readability
-        ),
-        yaxis=dict(tickformat="$,.2f"),
-        margin=dict(t=25)
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Financial performance by year chart
-    st.subheader("Financial Performance (Annual Income Statement Output)")
-    
-    fig = go.Figure()
-    colors = ['#006400','#2E8B57','#3CB371','#90EE90']
-    fig.add_trace(go.Scatter(x=df_financials_by_year["Year"], y=df_financials_by_year["Revenue"],
-                             mode='lines+markers', name='Revenue',line=dict(color=colors[0], width=3),hovertemplate='$%{y:,.2f}<extra></extra>'))
-    fig.add_trace(go.Scatter(x=df_financials_by_year["Year"], y=df_financials_by_year["Income"],
-                             mode='lines+markers', name='Income',line=dict(color=colors[1], width=3),hovertemplate='$%{y:,.2f}<extra></extra>'))
-    fig.add_trace(go.Scatter(x=df_financials_by_year["Year"], y=df_financials_by_year["Gross Income"],
-                             mode='lines+markers', name='Gross<br>Income',line=dict(color=colors[2], width=3),hovertemplate='$%{y:,.2f}<extra></extra>'))
-    fig.add_trace(go.Scatter(x=df_financials_by_year["Year"], y=df_financials_by_year["Earnings Before Taxes"],
-                             mode='lines+markers', name='Earnings<br>EBITDA',line=dict(color=colors[3], width=3),hovertemplate='$%{y:,.2f}<extra></extra>'))
-    fig.update_layout(
-        xaxis_title="Year",
-        yaxis_title="Amount ($)",
-        plot_bgcolor="white",
-        hovermode="x unified",
-        legend=dict(title=""),
-        yaxis=dict(gridcolor="lightgray"),
-        margin=dict(t=25)
-    )
-    st.plotly_chart(fig, use_container_width=True)
-
-    # Cashflow accumulation chart
-    st.subheader("Cash Flow Accumulation Over The Years")
-    df_cashflow = df_financials.groupby("Year", as_index=False)["Earnings Before Taxes"].sum()
-    df_cashflow["Cash Flow Accumulation"] = df_cashflow["Earnings Before Taxes"].cumsum()
-    fig = px.bar(
-        df_cashflow,
-        x="Year",
-        y="Cash Flow Accumulation",
-        labels={"Cash Flow Accumulation": "Cash Flow Accumulation ($)"},
-        text_auto='.2f',
-        color_discrete_sequence=["skyblue"]
-    )
-    fig.update_traces(
-        hovertemplate='$%{y:,.2f}<extra></extra>',
-        texttemplate='$%{y:,.2f}',
-        textposition='outside',
-        textfont_color='darkgray'
-    )
-    fig.update_layout(
-        xaxis_title="Year",
-        yaxis_title="Cash Flow Accumulation ($)",
-        bargap=0.3,
-        plot_bgcolor="white",
-        yaxis_gridcolor="lightgray",
-        margin=dict(t=30)
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    for title, figure_json in results.figures:
+        st.subheader(title)
+        with phase(f"chart:{title.strip()}"):
+            st.plotly_chart(pio.from_json(figure_json), use_container_width=True)
 
     # Key Metrics Summary Table - Yearly View (January values)
     st.subheader("Key Metrics Summary")
     st.write("Note: The figures in the table below do not consider revenue generated from displaying ads")
 
-    # First ensure Month column is datetime
-    df['Month'] = pd.to_datetime(df['Month'])
-
-    # Get January data for each year
-    january_data = df[df['Month'].dt.month == 1].copy()
-
-    # Prepare metrics data - using a list of dicts approach for cleaner construction
-    metrics = [
-        {"Metric": "Average Monthly Renewal Rate (%)", "Type": "constant", "Value": f"{renewal_rate:.1%}"},
-        {"Metric": "User Subscription Life Time Value - LTV ($)", "Type": "constant", "Value": f"${LTV:,.2f}"},
-        {"Metric": "SEM Paid Customer Acquisition<br>Cost - CAC ($)", "Type": "constant", "Value": "N/A"} if sem_cpc == 0 or sem_traffic_m1==0 else {"Metric": "SEM Paid Customer Acquisition<br>Cost - CAC ($)", "Type": "january", "Col": "sem_cpa"},
-        {"Metric": "SEM Paid Customer Acquisition<br>Cost ROI ($)", "Type": "constant", "Value": "N/A"} if sem_cpc == 0 or sem_traffic_m1==0 else {"Metric": "SEM Paid Customer Acquisition<br>Cost ROI ($)", "Type": "january", "Col": "sem_roi"},
-        {"Metric": "SEM Paid Customer Acquisition<br>Cost ROI (%)", "Type": "constant", "Value": "N/A"} if sem_cpc == 0 or sem_traffic_m1==0 else {"Metric": "SEM Paid Customer Acquisition<br>Cost ROI (%)", "Type": "january", "Col": "sem_roi_percent"},
-        {"Metric": "Affiliate Marketing Customer<br>Acquisition Cost - CAC ($)", "Type": "constant", "Value": f"${affiliate_cpa:,.2f}" if am_traffic_m1 != 0 else "N/A"},
-        {"Metric": "Affiliate Marketing Customer<br>Acquisition Cost ROI ($)", "Type": "constant", "Value": f"${affiliate_marketing_roi:,.2f}" if (affiliate_marketing_roi_percent is not None and am_traffic_m1 != 0) else "N/A"},
-        {"Metric": "Affiliate Marketing Customer<br>Acquisition Cost ROI (%)", "Type": "constant", "Value": f"{affiliate_marketing_roi_percent:.2%}" if (affiliate_marketing_roi_percent is not None and am_traffic_m1 != 0) else "N/A"},
-        {"Metric": "Average Time to Recover<br>SEM CAC (months)", "Type": "constant", "Value": "N/A"} if sem_cpc == 0 or sem_traffic_m1 == 0 else {"Metric": "Average Time to Recover<br>SEM CAC (months)", "Type": "january", "Col": "time_to_recover_SEM_cac"},
-        {"Metric": "Average Time to Recover Affiliate<br>Marketing CAC (months)", "Type": "constant", "Value": "N/A"} if affiliate_cpa == 0 or am_traffic_m1 ==0 else {"Metric": "Average Time to Recover<br>Affiliate Marketing CAC (months)", "Type": "january", "Col": "time_to_recover_AM_cac"}
-    ]
-
-    # Create the metrics dataframe
-    metrics_data = {"Metric": [m["Metric"] for m in metrics]}
-
-    # Add yearly columns
-    years = sorted(df['Year'].unique())
-    for year in years:
-        year_data = january_data[january_data['Year'] == year]
-    
-        if not year_data.empty:
-            jan_row = year_data.iloc[0]
-        
-            year_values = []
-            for m in metrics:
-                if m["Type"] == "constant":
-                    year_values.append(m["Value"])
-                else:  # january type
-                    val = jan_row[m["Col"]]
-                
-                    if "time_to_recover" in m["Col"]:
-                        # Handle payback period formatting
-                        if val == 0.0:
-                            year_values.append("Immediately")
-                        elif isinstance(val, str) or val > 1200:
-                            year_values.append("Not Profitable. CAC>LTV")
-                        else:
-                            year_values.append(f"{val:,.2f}")
-                    else:
-                        # Handle numeric values
-                        if pd.isna(val):
-                            year_values.append("N/A")
-                        elif "percent" in m["Col"].lower() or "roi (%)" in m["Metric"].lower():
-                            year_values.append(f"{val:.2%}")
-                        else:
-                            year_values.append(f"${val:,.2f}" if isinstance(val, (int, float)) else str(val))
-        
-            metrics_data[year] = year_values
-
-    metrics_df = pd.DataFrame(metrics_data)
-
     # Convert to HTML and render
     def convert_df_to_html(df):
         return df.to_html(escape=False, index=False)
 
-    st.markdown(
-        convert_df_to_html(metrics_df),
-        unsafe_allow_html=True
-    )
+    with phase("metrics_html"):
+        st.markdown(
+            convert_df_to_html(format_metrics_table(metrics)),
+            unsafe_allow_html=True
+        )
     if sem_traffic_m1 > 0 and sem_cpc == 0:
         st.warning("⚠️ **Warning (Verify your SEM CPC input):** You input SEM traffic, but also input $0 SEM CPC, which makes the SEM Customer Acquisition Cost CAC not applicable. SEM traffic always has SEM Customer Acquisition Cost CAC.")
     
@@ -813,61 +275,310 @@ if st.session_state.calculate:
   
 
     
+    LTV = metrics.ltv
     if affiliate_cpa > 0 and LTV < affiliate_cpa:
         st.warning("⚠️ **Warning:** Your Affiliate Marketing CAC ($" + f"{affiliate_cpa:,.2f}) "  
                   f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on customers acquired through Affiliate Marketing channel. Things you can do to achieve profitability with this user segment: Reduce customer acquisition cost, increase subscription price, increase trial to paid rate or reduce monthly churn.")
         # Still allow calculations, but warn the user t
-    row_index = metrics_df[metrics_df['Metric'] == "SEM Paid Customer Acquisition<br>Cost - CAC ($)"].index[0]
-    first_year = years[0]
-    second_year = years[1]
-    third_year = years[2]
-    fourth_year = years[3]
-    fifth_year = years[4]
-    
-    sem_cac_y1 = metrics_df.iloc[row_index, metrics_df.columns.get_loc(first_year)]
-    sem_cac_y2 = metrics_df.iloc[row_index, metrics_df.columns.get_loc(second_year)]
-    sem_cac_y3 = metrics_df.iloc[row_index, metrics_df.columns.get_loc(third_year)]
-    sem_cac_y4 = metrics_df.iloc[row_index, metrics_df.columns.get_loc(fourth_year)]
-    sem_cac_y5 = metrics_df.iloc[row_index, metrics_df.columns.get_loc(fifth_year)]
 
     # Check if SEM CAC exceeds LTV for each year
-    if sem_cpc > 0:  # Only show these warnings if SEM CPC is > 0
-        try:
-            sem_cac_y1_val = float(sem_cac_y1.replace('$', '').replace(',', '')) if '$' in sem_cac_y1 else 0
-            if sem_cac_y1_val > 0 and LTV < sem_cac_y1_val:
-                st.warning(f"⚠️ **Warning (Year 1):** Your SEM CAC (${sem_cac_y1_val:,.2f}) "  
-                          f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on SEM-acquired customers. Things you can do to achieve profitability with this user segment: Reduce sem cost per click, increase traffic conversion rate, increase subscription price, increase trial to paid rate or reduce monthly churn.")
-        except:
-            pass
-        
-        try:
-            sem_cac_y2_val = float(sem_cac_y2.replace('$', '').replace(',', '')) if '$' in sem_cac_y2 else 0
-            if sem_cac_y2_val > 0 and LTV < sem_cac_y2_val:
-                st.warning(f"⚠️ **Warning (Year 2):** Your SEM CAC (${sem_cac_y2_val:,.2f}) "  
-                          f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on SEM-acquired customers. Things you can do to achieve profitability with this user segment: Reduce sem cost per click, increase traffic conversion rate, increase subscription price, increase trial to paid rate or reduce monthly churn.")
-        except:
-            pass
-        
-        try:
-            sem_cac_y3_val = float(sem_cac_y3.replace('$', '').replace(',', '')) if '$' in sem_cac_y3 else 0
-            if sem_cac_y3_val > 0 and LTV < sem_cac_y3_val:
-                st.warning(f"⚠️ **Warning (Year 3):** Your SEM CAC (${sem_cac_y3_val:,.2f}) "  
-                          f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on SEM-acquired customers. Things you can do to achieve profitability with this user segment: Reduce sem cost per click, increase traffic conversion rate, increase subscription price, increase trial to paid rate or reduce monthly churn.")
-        except:
-            pass
-        
-        try:
-            sem_cac_y4_val = float(sem_cac_y4.replace('$', '').replace(',', '')) if '$' in sem_cac_y4 else 0
-            if sem_cac_y4_val > 0 and LTV < sem_cac_y4_val:
-                st.warning(f"⚠️ **Warning (Year 4):** Your SEM CAC (${sem_cac_y4_val:,.2f}) "  
-                          f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on SEM-acquired customers. Things you can do to achieve profitability with this user segment: Reduce sem cost per click, increase traffic conversion rate, increase subscription price, increase trial to paid rate or reduce monthly churn.")
-        except:
-            pass
-        
-        try:
-            sem_cac_y5_val = float(sem_cac_y5.replace('$', '').replace(',', '')) if '$' in sem_cac_y5 else 0
-            if sem_cac_y5_val > 0 and LTV < sem_cac_y5_val:
-                st.warning(f"⚠️ **Warning (Year 5):** Your SEM CAC (${sem_cac_y5_val:,.2f}) "  
-                          f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on SEM-acquired customers. Things you can do to achieve profitability with this user segment: Reduce sem cost per click, increase traffic conversion rate, increase subscription price, increase trial to paid rate or reduce monthly churn.")
-        except:
-            pass
+    for year_index in np.flatnonzero(sem_cac_exceeds_ltv(metrics)):
+        st.warning(f"⚠️ **Warning (Year {year_index + 1}):** Your SEM CAC (${metrics.sem_cac[year_index]:,.2f}) "  
+                  f"exceeds Customer LTV (${LTV:,.2f}). You'll lose money on SEM-acquired customers. Things you can do to achieve profitability with this user segment: Reduce sem cost per click, increase traffic conversion rate, increase subscription price, increase trial to paid rate or reduce monthly churn.")
+
+    # Which model stages were recomputed for these inputs and which were reused from earlier runs
+    with st.expander("⚙️ Computation Stages"):
+        if results.stage_runs:
+            st.table({
+                "Stage": [run.name for run in results.stage_runs],
+                "Status": ["Reused" if run.reused else "Computed" for run in results.stage_runs],
+                "Time (ms)": [f"{run.seconds * 1000:,.2f}" for run in results.stage_runs],
+            })
+        else:
+            st.write("Loaded from the disk cache: no stages were run for these results.")
+
+    # Typed tables for BI tools: months as timestamps, numeric payback values
+    with st.expander("📦 Export Data"):
+        export_format = st.radio(
+            "Format", ["arrow", "parquet"], horizontal=True, key="export_format",
+            format_func=lambda name: {"arrow": "Arrow IPC (Feather)", "parquet": "Parquet"}[name],
+        )
+        with phase("export"):
+            tables = export_tables(results)
+            for name, label in (
+                ("projection", "Download Monthly Projection"),
+                ("financials_by_year", "Download Yearly Financials"),
+                ("key_metrics", "Download Key Metrics"),
+            ):
+                st.download_button(
+                    label, table_bytes(tables[name], export_format), file_name=f"saas_{name}.{export_format}",
+                    mime=MIME_TYPES[export_format], key=f"export_{name}",
+                )
+    if DEBUG_PANEL:
+        performance_panel(current_run())
+    return results
+
+
+def performance_panel(run):
+    """Debug panel: the phase timings of the current run, so far, and the process metrics."""
+    timings = run.ordered()
+    elapsed = max((timing.start + timing.seconds for timing in timings), default=0.0)
+    with st.expander("🛠️ Performance"):
+        st.write(f"Run **{run.name}**: {elapsed * 1000:,.1f} ms timed so far")
+        requests = REGISTRY.request_counts()
+        st.write(
+            f"Results requests in this process: {requests.get('cached', 0):,} cached, {requests.get('computed', 0):,} computed, "
+            f"{requests.get('shared', 0):,} shared with a concurrent session's computation"
+        )
+        st.table({
+            "Phase": ["\u2003" * timing.depth + timing.name for timing in timings],
+            "Time (ms)": [f"{timing.seconds * 1000:,.2f}" for timing in timings],
+            "Share": [f"{timing.seconds / elapsed:.0%}" if elapsed else "" for timing in timings],
+        })
+        st.download_button("Download Prometheus Metrics", REGISTRY.prometheus_text(), file_name="saas_metrics.prom", mime="text/plain")
+
+
+@st.cache_resource
+def risk_pool():
+    """One process pool shared by every risk simulation in this server; None on a single CPU (run in-process).
+
+    Workers are spawned rather than forked: a fork would copy the server's
+    running threads and any locks they hold.
+    """
+    if (os.cpu_count() or 1) <= 1:
+        return None
+    import atexit
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    atexit.register(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+@st.fragment
+def model_inputs():
+    # Outside live mode the inputs are a form, sent together by "Calculate Projections".
+    # In live mode they are bare widgets: inside a fragment an edit reruns only the
+    # fragment, not the analysis sections. An edit made while a run is still
+    # computing interrupts it at its next element, so bursts of edits compute the last.
+    # A fragment rerun is its own timed run; in a full run it joins the script's
+    with timed_run("live", METRICS_PATH):
+        inputs = {}
+        if not st.session_state.live:
+            with st.form("single_page_form", clear_on_submit=False):
+                with phase("form_capture"):
+                    assumption_inputs(inputs)
+                submitted = st.form_submit_button("Calculate Projections")
+            if submitted:
+                st.session_state.form_data = inputs
+                st.session_state.calculate = True
+                st.rerun()
+            return
+
+        with phase("form_capture"):
+            assumption_inputs(inputs)
+        st.session_state.form_data = inputs
+        st.session_state.calculate = True
+        st.caption("Live mode: results update as you edit the inputs.")
+        show_results(inputs)
+
+
+with timed_run("app", METRICS_PATH):
+    model_inputs()
+    if st.session_state.calculate and not st.session_state.live:
+        show_results(st.session_state.form_data)
+
+# Calculations and Results
+if st.session_state.calculate:
+    with phase("imports"):
+        import numpy as np
+        import plotly.graph_objects as go
+        from results import get_results
+        from saas_model import ASSUMPTION_KEYS
+        from saas_model.montecarlo import Distribution, simulate
+        from saas_model.sensitivity import METRICS, tornado, two_way_grid
+        from saas_model.solver import break_even_by, sem_cac_below_ltv, solve, year_ebt_at_least
+
+    form_data = st.session_state.form_data
+    # Drawn above; the analysis sections below only need the cached results
+    df = get_results(form_data).df
+
+    # Risk analysis - Monte Carlo simulation around the current assumptions
+    st.title("🎲 Risk Analysis")
+    st.write("Each simulation samples the assumptions below around the values entered above. The bands show the 5th to 95th percentile range of outcomes and the median (P50).")
+    risk_groups = {
+        "Churn Rate": ["churn_rate"],
+        "Trial To Paid Rate": ["trial_to_paid"],
+        "Conversion Rates": [f"{channel}_cr_y{year}" for channel in ("sem", "seo", "am") for year in range(1, 6)],
+        "SEM CPC": ["sem_cpc"],
+        "Traffic Growth Rates": [f"{channel}_traffic_gr_y{year}" for channel in ("sem", "seo", "am") for year in range(1, 6)],
+    }
+
+    with st.form("risk_form", clear_on_submit=False):
+        risk_col1, risk_col2 = st.columns(2)
+        with risk_col1:
+            risk_distribution = st.selectbox("Distribution", ["normal", "lognormal", "uniform", "triangular"])
+        with risk_col2:
+            risk_runs = st.number_input("Number of Simulations", min_value=1000, max_value=1000000, value=100000, step=10000)
+        st.write("Uncertainty (%): standard deviation for normal/lognormal, +/- range for uniform/triangular")
+        risk_spreads = {}
+        for risk_col, group in zip(st.columns(len(risk_groups)), risk_groups):
+            with risk_col:
+                risk_spreads[group] = st.number_input(group, min_value=0.0, max_value=100.0, value=10.0, step=1.0, key=f"risk_{group}") / 100
+
+        if st.form_submit_button("Run Risk Simulation"):
+            distributions = {
+                key: Distribution(risk_distribution, risk_spreads[group])
+                for group, keys in risk_groups.items()
+                for key in keys
+            }
+            with st.spinner("Running simulations..."):
+                st.session_state.risk = (dict(form_data), simulate(form_data, distributions, n_runs=int(risk_runs), pool=risk_pool()))
+
+    # Only show simulations that were run on the current assumptions
+    if st.session_state.risk is not None and st.session_state.risk[0] == form_data:
+        risk = st.session_state.risk[1]
+        risk_months = risk.months.astype("datetime64[D]")
+        st.write(f"Based on {risk.n_runs:,} simulations")
+        st.metric("Probability of Negative Cash Flow Accumulation at End of Projection", f"{risk.prob_negative_cash_flow[-1]:.1%}")
+        for series, color in [("Revenue", "31,119,180"), ("Cash Flow Accumulation", "44,160,44")]:
+            p5, p50, p95 = risk.percentiles[series]
+            st.subheader(f"Monthly {series} - Risk Range")
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=risk_months, y=p95, mode='lines', line=dict(width=0), name='P95', hovertemplate='P95: $%{y:,.2f}<extra></extra>'))
+            fig.add_trace(go.Scatter(x=risk_months, y=p5, mode='lines', line=dict(width=0), fill='tonexty', fillcolor=f'rgba({color},0.2)', name='P5 - P95', hovertemplate='P5: $%{y:,.2f}<extra></extra>'))
+            fig.add_trace(go.Scatter(x=risk_months, y=p50, mode='lines', line=dict(color=f'rgb({color})', width=2), name='Median<br>(P50)', hovertemplate='P50: $%{y:,.2f}<extra></extra>'))
+            fig.add_trace(go.Scatter(x=df["Month"], y=df[series], mode='lines', line=dict(color='gray', width=2, dash='dash'), name='Current<br>Inputs', hovertemplate='Current: $%{y:,.2f}<extra></extra>'))
+            fig.update_layout(
+                xaxis_title="Month",
+                yaxis_title=f"{series} ($)",
+                xaxis=dict(
+                    type='date',
+                    tickformat='%b-%Y',
+                    tickmode='auto',
+                    nticks=30,
+                    tickangle=-45
+                ),
+                yaxis=dict(tickformat="$,.2f"),
+                hovermode="x unified",
+                plot_bgcolor="white",
+                yaxis_gridcolor="lightgray",
+                margin=dict(t=25)
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
+    # Goal seek - solve for the input value that reaches a target
+    st.title("🎯 Goal Seek")
+    st.write("Find the value of one or more inputs that just reaches a target, keeping every other input as entered above. Several inputs move together by the same factor.")
+    goal_variables = {
+        "Subscription Price": ["subscription_price"],
+        "SEM CPC": ["sem_cpc"],
+        "Churn Rate": ["churn_rate"],
+        "Trial To Paid Rate": ["trial_to_paid"],
+        "SEM Conversion Rates (All Years)": ["sem_cr_y*"],
+        "All Conversion Rates": ["*_cr_y*"],
+        "Affiliate Marketing CAC": ["affiliate_cpa"],
+        "Monthly Labor Cost": ["monthly_labor_cost"],
+    }
+    horizon_years = int(form_data['horizon_years'])
+
+    with st.form("goal_form", clear_on_submit=False):
+        goal_col1, goal_col2 = st.columns(2)
+        with goal_col1:
+            goal_kind = st.selectbox("Target", ["Break-even by month", "Yearly EBT of at least", "SEM CAC at or below LTV"])
+            goal_inputs = st.multiselect("Inputs to solve for", list(goal_variables), default=["Subscription Price"])
+        with goal_col2:
+            goal_month = st.number_input("Break-even month", min_value=1, max_value=12 * horizon_years, value=min(24, 12 * horizon_years), step=1)
+            goal_year = st.number_input("Year (EBT / SEM CAC)", min_value=1, max_value=horizon_years, value=1, step=1)
+            goal_amount = st.number_input("EBT amount ($)", value=1000000.0, step=100000.0, format="%.2f")
+
+        if st.form_submit_button("Solve") and goal_inputs:
+            if goal_kind == "Break-even by month":
+                target = break_even_by(int(goal_month))
+            elif goal_kind == "Yearly EBT of at least":
+                target = year_ebt_at_least(int(goal_year), goal_amount)
+            else:
+                target = sem_cac_below_ltv(int(goal_year))
+            patterns = [pattern for name in goal_inputs for pattern in goal_variables[name]]
+            st.session_state.goal = (dict(form_data), target.description, solve(form_data, target, patterns))
+
+    # Only show a solution computed from the current assumptions
+    if st.session_state.goal is not None and st.session_state.goal[0] == form_data:
+        _, goal_description, solution = st.session_state.goal
+        if solution.met:
+            st.success(f"**{goal_description}** is reached with:")
+            if solution.current_score >= 0:
+                st.info("The current inputs already reach this target; the required values are the limit before it is missed.")
+            st.table([
+                {"Input": key, "Current": form_data[key], "Required": value}
+                for key, value in solution.values.items()
+            ])
+        else:
+            st.warning(f"⚠️ No value of the selected inputs within their valid range reaches: **{goal_description}**.")
+
+    # Sensitivity - every grid point / tornado bar is one scenario of a single batched projection
+    st.title("🔀 Sensitivity")
+    grid_tab, tornado_tab = st.tabs(["Two-Way Grid", "Tornado"])
+    sensitivity_keys = list(ASSUMPTION_KEYS)
+
+    with grid_tab:
+        with st.form("grid_form", clear_on_submit=False):
+            grid_col1, grid_col2 = st.columns(2)
+            with grid_col1:
+                grid_x = st.selectbox("X axis input", sensitivity_keys, index=sensitivity_keys.index("subscription_price"))
+                grid_x_range = st.slider("X axis range (% of current value)", 0, 300, (50, 150), step=5)
+            with grid_col2:
+                grid_y = st.selectbox("Y axis input", sensitivity_keys, index=sensitivity_keys.index("churn_rate"))
+                grid_y_range = st.slider("Y axis range (% of current value)", 0, 300, (50, 150), step=5)
+            grid_points = st.slider("Grid points per axis", 10, 100, 50, step=5)
+            if st.form_submit_button("Compute Grid"):
+                if grid_x == grid_y:
+                    st.error("⚠️ Pick two different inputs for the X and Y axes.")
+                else:
+                    x_values = np.linspace(*grid_x_range, grid_points) / 100 * form_data[grid_x]
+                    y_values = np.linspace(*grid_y_range, grid_points) / 100 * form_data[grid_y]
+                    st.session_state.sensitivity["grid"] = (dict(form_data), two_way_grid(form_data, grid_x, x_values, grid_y, y_values))
+
+        if "grid" in st.session_state.sensitivity and st.session_state.sensitivity["grid"][0] == form_data:
+            grid = st.session_state.sensitivity["grid"][1]
+            for metric in METRICS:
+                value_format = ",.0f" if metric == "Break-even Month" else "$,.2f"
+                st.subheader(metric)
+                fig = go.Figure(go.Heatmap(
+                    x=grid.x_values,
+                    y=grid.y_values,
+                    z=grid.metrics[metric],
+                    colorscale="RdYlGn_r" if metric == "Break-even Month" else "RdYlGn",
+                    hovertemplate=f"{grid.x_key}: %{{x:,.4g}}<br>{grid.y_key}: %{{y:,.4g}}<br>{metric}: %{{z:{value_format}}}<extra></extra>"
+                ))
+                fig.update_layout(xaxis_title=grid.x_key, yaxis_title=grid.y_key, margin=dict(t=25))
+                st.plotly_chart(fig, use_container_width=True)
+            st.caption("Blank break-even cells never reach a non-negative cash flow accumulation within the projection.")
+
+    with tornado_tab:
+        with st.form("tornado_form", clear_on_submit=False):
+            tornado_col1, tornado_col2 = st.columns(2)
+            with tornado_col1:
+                tornado_change = st.number_input("Change on every input (+/- %)", min_value=1.0, max_value=100.0, value=10.0, step=1.0) / 100
+            with tornado_col2:
+                tornado_metric = st.selectbox("Metric", METRICS)
+            if st.form_submit_button("Compute Tornado"):
+                st.session_state.sensitivity["tornado"] = (dict(form_data), tornado(form_data, change=tornado_change, metric=tornado_metric))
+
+        if "tornado" in st.session_state.sensitivity and st.session_state.sensitivity["tornado"][0] == form_data:
+            result = st.session_state.sensitivity["tornado"][1]
+            bars = result.bars[::-1]  # Widest swing on top
+            labels = [bar.key for bar in bars]
+            st.subheader(f"{result.metric} - Input Sensitivity")
+            fig = go.Figure()
+            fig.add_trace(go.Bar(y=labels, x=[bar.low_metric - result.base_value for bar in bars], base=result.base_value, orientation='h', name='Input -', marker_color='#E15759', customdata=[[bar.low_value, bar.low_metric] for bar in bars], hovertemplate='%{customdata[0]:,.4g}: %{customdata[1]:,.2f}<extra></extra>'))
+            fig.add_trace(go.Bar(y=labels, x=[bar.high_metric - result.base_value for bar in bars], base=result.base_value, orientation='h', name='Input +', marker_color='#59A14F', customdata=[[bar.high_value, bar.high_metric] for bar in bars], hovertemplate='%{customdata[0]:,.4g}: %{customdata[1]:,.2f}<extra></extra>'))
+            fig.update_layout(
+                barmode='overlay',
+                xaxis_title=result.metric,
+                height=max(400, 22 * len(bars)),
+                plot_bgcolor="white",
+                xaxis_gridcolor="lightgray",
+                margin=dict(t=25)
+            )
+            st.plotly_chart(fig, use_container_width=True)
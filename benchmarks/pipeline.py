@@ -0,0 +1,227 @@
+"""Time each stage of the projection pipeline across horizons and scenario counts.
+
+Run from the repository root::
+
+    python -m benchmarks.pipeline -o benchmark.json
+    python -m benchmarks.pipeline -o new.json --compare benchmark.json
+
+Engine stages (calendar, recurrences, payback, yearly groupby) run at every
+scenario count, in chunks of ``--chunk-size`` scenarios so memory stays
+bounded; each timing is the total over all chunks. The UI stages (metrics
+table, Plotly figures) render a single scenario, so they only run at 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import plotly
+
+import results
+from saas_model import FINANCIAL_COLUMNS, default_assumptions, key_metrics, month_calendar, payback_months, project, project_months
+from saas_model.montecarlo import Distribution, sample_assumptions
+
+HORIZONS = (60, 120, 600)
+SCENARIO_COUNTS = (1, 1_000, 100_000)
+ENGINE_STAGES = ("calendar", "recurrences", "payback", "yearly_groupby")
+
+# Spread the batch scenarios around the form defaults so they are not all identical
+SCENARIO_SPREAD = {
+    key: Distribution("uniform", 0.2)
+    for key in ("churn_rate", "trial_to_paid", "subscription_price", "sem_cpc", "sem_cr_y1", "sem_traffic_gr_y1")
+}
+
+
+def _measure(func, repeat, setup=None):
+    """Return ``repeat`` wall-clock timings of ``func(setup())`` in seconds."""
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(argument)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _chunk_inputs(n_scenarios, rng):
+    if n_scenarios == 1:
+        assumptions = default_assumptions()
+        kick_off_date = assumptions["kick_off_date"]
+    else:
+        defaults = default_assumptions()
+        assumptions = sample_assumptions(defaults, SCENARIO_SPREAD, n_scenarios, rng)
+        kick_off_date = np.full(n_scenarios, np.datetime64(defaults["kick_off_date"], "M"))
+    return assumptions, kick_off_date
+
+
+def _yearly_groupby(n_scenarios, months, years, columns):
+    if n_scenarios == 1:
+        df = pd.DataFrame({"Month": months, "Year": years, **columns})
+        return lambda _: results.yearly_financials(df)
+    shape = columns["Revenue"].shape
+    df = pd.DataFrame({
+        "Scenario": np.repeat(np.arange(shape[0]), shape[1]),
+        "Year": np.broadcast_to(years, shape).ravel(),
+        **{name: np.broadcast_to(columns[name], shape).ravel() for name in FINANCIAL_COLUMNS},
+    })
+    return lambda _: df.groupby(["Scenario", "Year"], as_index=False).sum()
+
+
+def time_engine(horizon, n_scenarios, repeat, chunk_size, rng):
+    """Return ``{stage: [total seconds per repeat]}`` summed over every chunk of scenarios."""
+    totals = {stage: [0.0] * repeat for stage in ENGINE_STAGES}
+    remaining = n_scenarios
+    while remaining:
+        size = min(chunk_size, remaining)
+        remaining -= size
+        assumptions, kick_off_date = _chunk_inputs(size, rng)
+        months, years, days_count = month_calendar(kick_off_date, horizon)
+        columns = project_months(assumptions, days_count)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sem_cpa = columns["SEM - Paid Traffic"] * np.asarray(assumptions["sem_cpc"])[..., np.newaxis] / columns["SEM Subscriptions"]
+        payback_args = (
+            np.asarray(assumptions["subscription_price"])[..., np.newaxis],
+            np.asarray(assumptions["trial_to_paid"])[..., np.newaxis],
+            np.asarray(assumptions["churn_rate"])[..., np.newaxis],
+            np.asarray(assumptions["free_trial_days"])[..., np.newaxis],
+        )
+        stages = {
+            "calendar": lambda _: month_calendar(kick_off_date, horizon),
+            "recurrences": lambda _: project_months(assumptions, days_count),
+            "payback": lambda _: (
+                payback_months(columns["am_cpa_month_cost"], *payback_args),
+                payback_months(sem_cpa, *payback_args),
+            ),
+            "yearly_groupby": _yearly_groupby(size, months, years, columns),
+        }
+        for stage, func in stages.items():
+            for run, seconds in enumerate(_measure(func, repeat)):
+                totals[stage][run] += seconds
+    return totals
+
+
+def time_ui(horizon, repeat):
+    """Return ``{stage: [seconds per repeat]}`` for rendering one scenario."""
+    projection = project(default_assumptions(), horizon)
+    df = results.projection_frame(projection)
+    df_financials, df_financials_by_year = results.yearly_financials(df)
+    return {
+        "metrics_table": _measure(lambda _: results.format_metrics_table(key_metrics(projection)), repeat),
+        "figures": _measure(lambda _: results.build_figures(df, df_financials, df_financials_by_year), repeat),
+    }
+
+
+def _record(stage, horizon, n_scenarios, timings):
+    best = min(timings)
+    return {
+        "stage": stage,
+        "horizon": horizon,
+        "scenarios": n_scenarios,
+        "repeat": len(timings),
+        "min_s": best,
+        "median_s": statistics.median(timings),
+        "ns_per_scenario_month": best / (horizon * n_scenarios) * 1e9,
+    }
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def environment(args):
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "plotly": plotly.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "chunk_size": args.chunk_size,
+        "seed": args.seed,
+    }
+
+
+def run(args, out=sys.stdout):
+    rng = np.random.default_rng(args.seed)
+    records = []
+    for horizon in args.horizons:
+        for n_scenarios in args.scenarios:
+            timings = time_engine(horizon, n_scenarios, args.repeat, args.chunk_size, rng)
+            if n_scenarios == 1:
+                timings.update(time_ui(horizon, args.repeat))
+            for stage, stage_timings in timings.items():
+                record = _record(stage, horizon, n_scenarios, stage_timings)
+                records.append(record)
+                print(f"{stage:16} {horizon:>5} months {n_scenarios:>8} scenarios {record['min_s'] * 1e3:>12.3f} ms", file=out)
+    return records
+
+
+def compare(records, baseline, tolerance, out=sys.stdout):
+    """Print each stage's time relative to ``baseline`` and return the regressed records."""
+    previous = {(r["stage"], r["horizon"], r["scenarios"]): r for r in baseline["results"]}
+    regressions = []
+    for record in records:
+        before = previous.get((record["stage"], record["horizon"], record["scenarios"]))
+        if before is None:
+            continue
+        ratio = record["min_s"] / before["min_s"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESSION"
+            regressions.append(record)
+        print(
+            f"{record['stage']:16} {record['horizon']:>5} months {record['scenarios']:>8} scenarios "
+            f"{before['min_s'] * 1e3:>12.3f} -> {record['min_s'] * 1e3:>12.3f} ms  x{ratio:.2f}{flag}",
+            file=out,
+        )
+    return regressions
+
+
+def _int_list(text):
+    return [int(value) for value in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="benchmarks.pipeline", description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="benchmark.json", help="JSON file for the results (default: %(default)s)")
+    parser.add_argument("--horizons", type=_int_list, default=list(HORIZONS), help="comma-separated month counts")
+    parser.add_argument("--scenarios", type=_int_list, default=list(SCENARIO_COUNTS), help="comma-separated scenario counts")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per measurement; the minimum is reported")
+    parser.add_argument("--chunk-size", type=int, default=1_000, help="scenarios per engine call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compare", metavar="BASELINE", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="slowdown ratio flagged as a regression")
+    args = parser.parse_args(argv)
+
+    records = run(args)
+    with open(args.output, "w") as f:
+        json.dump({"environment": environment(args), "results": records}, f, indent=2)
+    print(f"Wrote {len(records)} timings to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        if compare(records, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Check the cold-start budget of the Streamlit app: how fast the input form paints.
+
+Run from the repository root::
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget-ms 400 --repeat 7
+
+Each repeat starts a fresh interpreter and runs ``app.py`` with Streamlit's
+AppTest: once as a first page load (only the input form), then after pressing
+"Calculate Projections". The exit status is 1 when the median first load takes
+longer than ``--budget-ms`` or loads one of ``DEFERRED_MODULES``, which the app
+only needs for the results.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Imported only once results are requested (unless Streamlit itself loads them)
+DEFERRED_MODULES = ("numpy", "pandas", "plotly.graph_objects", "results", "saas_model.model")
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+preloaded = set(sys.modules)
+app = AppTest.from_file(sys.argv[1], default_timeout=300)
+app.run()
+painted = time.perf_counter()
+loaded = sorted(set(sys.modules) - preloaded)
+next(button for button in app.button if button.label == "Calculate Projections").click().run()
+calculated = time.perf_counter()
+print(json.dumps({
+    "streamlit_s": imported - started,
+    "form_s": painted - imported,
+    "results_s": calculated - painted,
+    "loaded": loaded,
+    "exception": [str(error.value) for error in app.exception],
+}))
+"""
+
+
+def probe(app_path):
+    """Time one cold start of ``app_path`` in a fresh interpreter."""
+    out = subprocess.run([sys.executable, "-c", _PROBE, app_path], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="benchmarks.startup", description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="app.py", help="Streamlit script to start (default: app.py)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters to start; the median is reported")
+    parser.add_argument("--budget-ms", type=float, default=500.0, help="maximum median time to paint the input form")
+    args = parser.parse_args(argv)
+
+    runs = [probe(args.app) for _ in range(args.repeat)]
+    errors = sorted({error for run in runs for error in run["exception"]})
+    form_ms = statistics.median(run["form_s"] for run in runs) * 1e3
+    deferred = sorted({name for run in runs for name in run["loaded"] if name in DEFERRED_MODULES})
+    print(f"{'import streamlit':24} {statistics.median(run['streamlit_s'] for run in runs) * 1e3:>10.1f} ms")
+    print(f"{'first paint (form)':24} {form_ms:>10.1f} ms   budget {args.budget_ms:,.0f} ms")
+    print(f"{'calculate projections':24} {statistics.median(run['results_s'] for run in runs) * 1e3:>10.1f} ms")
+
+    failed = False
+    if errors:
+        print("App raised: " + "; ".join(errors))
+        failed = True
+    if form_ms > args.budget_ms:
+        print(f"Over budget by {form_ms - args.budget_ms:,.1f} ms")
+        failed = True
+    if deferred:
+        print(f"Loaded before results were requested: {', '.join(deferred)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
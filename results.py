@@ -0,0 +1,440 @@
+"""Projection results for the Streamlit app: DataFrames, charts and the key metrics.
+
+Results are cached process-wide on a hash of the assumptions, so reruns and
+other sessions with the same inputs skip the computation entirely; sessions
+asking for the same inputs while they are being computed wait and share them.
+"""
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from saas_model import FINANCIAL_COLUMNS, KeyMetrics, key_metrics, project
+from saas_model.arrowio import key_metrics_table, monthly_table, yearly_table
+from saas_model.cache import LRUCache, SingleFlight, assumptions_key
+from saas_model.diskcache import DiskCache, pack_columns, unpack_columns
+from saas_model.frame import CompactFrame, compact, expand
+from saas_model.timing import REGISTRY, phase
+
+logger = logging.getLogger(__name__)
+
+# Shared by every session served by this process
+RESULTS_CACHE = LRUCache(maxsize=128)
+# Sessions requesting the same uncached inputs at once wait for one computation
+IN_FLIGHT = SingleFlight()
+
+# Optional cache shared by every worker process on this machine, kept across restarts.
+# Bump RESULTS_FORMAT_VERSION whenever ProjectionResults or its contents change.
+RESULTS_FORMAT_VERSION = 8
+_disk_cache = None
+_disk_cache_opened = False
+_disk_cache_lock = threading.Lock()
+
+
+def disk_cache():
+    """The ``DiskCache`` at ``SAAS_CACHE_PATH``, opened on first use; None when unset or it cannot be opened."""
+    global _disk_cache, _disk_cache_opened
+    with _disk_cache_lock:
+        if not _disk_cache_opened:
+            _disk_cache_opened = True
+            path = os.environ.get("SAAS_CACHE_PATH")
+            if path:
+                try:
+                    _disk_cache = DiskCache(
+                        path,
+                        ttl_seconds=float(os.environ.get("SAAS_CACHE_TTL_SECONDS", 7 * 24 * 3600)),
+                        max_bytes=int(float(os.environ.get("SAAS_CACHE_MAX_MB", 256)) * 1024 * 1024),
+                    )
+                except (sqlite3.Error, OSError, ValueError) as error:
+                    logger.warning("Disk cache at %s is disabled: %s", path, error)
+        return _disk_cache
+
+
+# Key metrics table entry for a CAC that is never recovered
+NOT_PROFITABLE = "Not Profitable. CAC>LTV"
+
+
+class ProjectionResults(NamedTuple):
+    df: pd.DataFrame
+    df_financials_by_year: pd.DataFrame
+    figures: list  # (subheader, Plotly figure JSON) in display order
+    key_metrics: KeyMetrics  # numeric; format_metrics_table renders it
+    stage_runs: list  # StageRun of the projection that produced these results; empty when loaded from the disk cache
+
+
+def get_results(form_data):
+    """Return the (possibly cached) results for ``form_data``.
+
+    Concurrent calls with the same uncached inputs compute once and share the
+    result; each call is counted in ``saas_results_requests_total``.
+    """
+    key = assumptions_key(form_data)
+    results = RESULTS_CACHE.get(key)
+    if results is not None:
+        REGISTRY.count_request("cached")
+        return results
+    (results, cached), shared = IN_FLIGHT.do(key, lambda: _compute_and_store(key, form_data))
+    REGISTRY.count_request("shared" if shared else "cached" if cached else "computed")
+    return results
+
+
+def _compute_and_store(key, form_data):
+    """Return ``(results, cached)``; ``cached`` is True when they were already in the memory cache."""
+    # A computation of this key may have been stored and released between the
+    # caller's cache lookup and its entering the in-flight table
+    results = RESULTS_CACHE.get(key)
+    if results is not None:
+        return results, True
+    # Stored before the in-flight entry is released, so later callers find it in the cache
+    results = _load_or_compute(key, form_data)
+    RESULTS_CACHE.put(key, results)
+    return results, False
+
+
+def _load_or_compute(key, form_data):
+    cache = disk_cache()
+    if cache is None:
+        return compute_results(form_data)
+    disk_key = f"results-v{RESULTS_FORMAT_VERSION}:{key}"
+    try:
+        blob = cache.get(disk_key)
+    except sqlite3.Error as error:
+        logger.warning("Disk cache read failed: %s", error)
+        blob = None
+    if blob is not None:
+        return unpack_results(blob)
+    results = compute_results(form_data)
+    try:
+        cache.put(disk_key, pack_results(results))
+    except sqlite3.Error as error:
+        logger.warning("Disk cache write failed: %s", error)
+    return results
+
+
+def _json_value(value):
+    if value is None or isinstance(value, str):
+        return value
+    return float(value)
+
+
+def pack_results(results):
+    """Serialize results into one compressed columnar blob.
+
+    Numeric and datetime columns and the per-year key metrics are stored as
+    arrays; object columns, month-constant columns (see
+    ``saas_model.frame.compact``), the figures and the scalar values go into a
+    JSON metadata entry.
+    """
+    arrays = {}
+    meta = {
+        "figures": results.figures,
+        "key_metrics": {},
+    }
+    for field, value in results.key_metrics._asdict().items():
+        if isinstance(value, np.ndarray):
+            arrays[f"key_metrics.{field}"] = value
+        else:
+            meta["key_metrics"][field] = value
+    # Month-constant columns of the monthly frame go into the metadata as one value each
+    monthly = compact(results.df["Month"].to_numpy(), {name: results.df[name].to_numpy() for name in results.df.columns[1:]})
+    arrays["df.Month"] = monthly.months
+    for position, name in enumerate(monthly.names):
+        if name in monthly.columns:
+            arrays[f"df.{position}"] = monthly.columns[name]
+    meta["df"] = {"names": list(monthly.names), "constants": monthly.constants}
+    frame = results.df_financials_by_year
+    columns = []
+    for position, column in enumerate(frame.columns):
+        label = column if isinstance(column, str) else int(column)
+        values = frame[column].to_numpy()
+        if values.dtype == object:
+            columns.append([label, [_json_value(value) for value in values]])
+        else:
+            arrays[f"df_financials_by_year.{position}"] = values
+            columns.append([label, None])
+    meta["df_financials_by_year"] = columns
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+    return pack_columns(arrays)
+
+
+def unpack_results(blob):
+    arrays = unpack_columns(blob)
+    meta = json.loads(arrays.pop("meta").tobytes())
+    names = meta["df"]["names"]
+    monthly = CompactFrame(
+        arrays["df.Month"],
+        {name: arrays[f"df.{position}"] for position, name in enumerate(names) if name not in meta["df"]["constants"]},
+        meta["df"]["constants"],
+        tuple(names),
+    )
+    df = pd.DataFrame({"Month": monthly.months, **expand(monthly)})
+    df_financials_by_year = pd.DataFrame({
+        label: arrays[f"df_financials_by_year.{position}"] if values is None else np.array(values, dtype=object)
+        for position, (label, values) in enumerate(meta["df_financials_by_year"])
+    })
+    figures = [tuple(figure) for figure in meta["figures"]]
+    metrics = KeyMetrics(**{
+        field: meta["key_metrics"][field] if field in meta["key_metrics"] else arrays[f"key_metrics.{field}"]
+        for field in KeyMetrics._fields
+    })
+    # Stage timings belong to the run that computed the results, not to this one
+    return ProjectionResults(df, df_financials_by_year, figures, metrics, [])
+
+
+def compute_results(form_data):
+    # Headless projection; everything below reshapes it for display
+    with phase("projection"):
+        projection = project(form_data)
+    with phase("projection_frame"):
+        df = projection_frame(projection)
+    with phase("yearly_groupby"):
+        df_financials, df_financials_by_year = yearly_financials(df)
+    with phase("figures"):
+        figures = build_figures(df, df_financials, df_financials_by_year)
+    with phase("key_metrics"):
+        metrics = key_metrics(projection)
+    return ProjectionResults(df, df_financials_by_year, figures, metrics, projection.stage_runs)
+
+
+def export_tables(results):
+    """Arrow tables of ``results`` for download: the monthly projection, the yearly financials and the key metrics."""
+    df = results.df
+    by_year = results.df_financials_by_year
+    return {
+        "projection": monthly_table(df["Month"].to_numpy(), {name: df[name].to_numpy() for name in df.columns}),
+        "financials_by_year": yearly_table(by_year["Year"].to_numpy(), {name: by_year[name].to_numpy() for name in FINANCIAL_COLUMNS}),
+        "key_metrics": key_metrics_table(results.key_metrics),
+    }
+
+
+def projection_frame(projection):
+    """Monthly DataFrame of a ``saas_model.Result``, in the app's column order."""
+    return pd.DataFrame({"Month": projection.months, **projection.columns})
+
+
+def yearly_financials(df):
+    """Return the income statement columns of ``df`` and their sums per calendar year."""
+    # Financials dataframe consolidation
+    df_financials = df[[
+        'Month',
+        'Year',
+        'Revenue',
+        'Chargebacks',
+        'Refunds',
+        'Income',
+        'Credit Card Processing',
+        'Web Hosting',
+        'Cost of Goods/Services Sold',
+        'Gross Income',
+        'Labor Cost',
+        'SEM Marketing',
+        'Affiliate Marketing',
+        'Internet Marketing Cost',
+        'Technology & Software',
+        'Earnings Before Taxes',
+        'Cash Flow Accumulation'
+    ]]
+    df_financials_by_year = df_financials.groupby("Year", as_index=False).sum(numeric_only=True)
+    return df_financials, df_financials_by_year
+
+
+def build_figures(df, df_financials, df_financials_by_year):
+    """Build the results charts as (subheader, Plotly figure JSON) pairs in display order.
+
+    Figures are plain dicts serialized without validation, which is several
+    times faster than building ``go.Figure`` objects; ``pio.from_json``
+    validates them (and applies the default template) when they are drawn.
+    """
+    figures = []
+
+    # Traffic Sources Chart
+    title = "Web/App Monthly Traffic"
+    fig = {
+        "data": [
+            _line(df["Month"], df["SEM - Paid Traffic"], 'Paid(SEM)<br>Traffic', '#1f77b4', 'SEM: %{y:,.0f}<extra></extra>'),
+            _line(df["Month"], df["SEO - Organic Traffic"], 'Organic(SEO)<br>Traffic', '#ff7f0e', 'SEO: %{y:,.0f}<extra></extra>'),
+            _line(df["Month"], df["AM - Paid Traffic"], 'Affiliate<br>Marketing', '#2ca02c', 'Affiliate: %{y:,.0f}<extra></extra>'),
+        ],
+        "layout": {
+            "xaxis": _month_axis(),
+            "yaxis": {"title": {"text": "Traffic Volume"}, "tickformat": ",", "gridcolor": "lightgray"},
+            "hovermode": "x unified",
+            "legend": {"title": {"text": "Traffic Source"}},
+            "plot_bgcolor": "white",
+            "margin": {"t": 25},
+        },
+    }
+    figures.append((title, _figure_json(title, fig)))
+
+    # Monthly Subscriptions
+    title = "New Monthly Subscriptions & New Monthly Paying Users "
+    fig = {
+        "data": [
+            _line(df["Month"], df["Total Monthly Subscriptions"], 'New Monthly<br>Subscriptions', '#4E79A7', 'Total Subs: %{y:,.0f}<extra></extra>'),
+            _line(df["Month"], df["Trial To Paid Transactions Count"], 'Trial To Paid<br>New Users', '#F28E2B', 'Trial To Paid: %{y:,.0f}<extra></extra>'),
+        ],
+        "layout": {
+            "xaxis": _month_axis(),
+            "yaxis": {"title": {"text": "Count"}, "tickformat": ",", "gridcolor": "lightgray"},
+            "hovermode": "x unified",
+            "legend": {"title": {"text": "Subscription Type"}},
+            "plot_bgcolor": "white",
+            "margin": {"t": 25},
+        },
+    }
+    figures.append((title, _figure_json(title, fig)))
+
+    # Revenue split chart
+    title = "Monthly Recurring Revenue MRR Split"
+    revenue_split = [
+        ("New Monthly Recurring Revenue MRR", 'Trial To Paid<br>(New Users)', 'Trial To Paid: $%{y:,.2f}<extra></extra>'),
+        ("Renewal Recurring Revenue MRR", 'Recurring<br>Renewals', 'Recurring Renewal: $%{y:,.2f}<extra></extra>'),
+        ("Ad Network Revenue", 'Ad Network', 'Ad Network: $%{y:,.2f}<extra></extra>'),
+        ("Ad Affiliate Revenue", 'Ad Affiliate<br>Marketing', 'Ad Affiliate: $%{y:,.2f}<extra></extra>'),
+    ]
+    fig = {
+        "data": [
+            {"type": "scatter", "x": df["Month"], "y": df[column], "mode": "lines", "name": name, "stackgroup": "one", "hovertemplate": hover}
+            for column, name, hover in revenue_split
+        ],
+        "layout": {
+            # Every 2 months per 5 years of horizon
+            "xaxis": _month_axis(dtick=f'M{2 * math.ceil(len(df) / 60)}'),
+            "yaxis": {"title": {"text": "MRR ($)"}, "tickformat": "$,.2f"},
+            "margin": {"t": 25},
+        },
+    }
+    figures.append((title, _figure_json(title, fig)))
+
+    # Financial performance by year chart
+    title = "Financial Performance (Annual Income Statement Output)"
+    colors = ['#006400','#2E8B57','#3CB371','#90EE90']
+    performance = [("Revenue", 'Revenue'), ("Income", 'Income'), ("Gross Income", 'Gross<br>Income'), ("Earnings Before Taxes", 'Earnings<br>EBITDA')]
+    fig = {
+        "data": [
+            {
+                "type": "scatter", "x": df_financials_by_year["Year"], "y": df_financials_by_year[column],
+                "mode": "lines+markers", "name": name, "line": {"color": color, "width": 3}, "hovertemplate": '$%{y:,.2f}<extra></extra>',
+            }
+            for (column, name), color in zip(performance, colors)
+        ],
+        "layout": {
+            "xaxis": {"title": {"text": "Year"}},
+            "yaxis": {"title": {"text": "Amount ($)"}, "gridcolor": "lightgray"},
+            "plot_bgcolor": "white",
+            "hovermode": "x unified",
+            "legend": {"title": {"text": ""}},
+            "margin": {"t": 25},
+        },
+    }
+    figures.append((title, _figure_json(title, fig)))
+
+    # Cashflow accumulation chart
+    title = "Cash Flow Accumulation Over The Years"
+    df_cashflow = df_financials.groupby("Year", as_index=False)["Earnings Before Taxes"].sum()
+    df_cashflow["Cash Flow Accumulation"] = df_cashflow["Earnings Before Taxes"].cumsum()
+    fig = {
+        "data": [{
+            "type": "bar",
+            "x": df_cashflow["Year"],
+            "y": df_cashflow["Cash Flow Accumulation"],
+            "name": "",
+            "showlegend": False,
+            "marker": {"color": "skyblue"},
+            "hovertemplate": '$%{y:,.2f}<extra></extra>',
+            "texttemplate": '$%{y:,.2f}',
+            "textposition": 'outside',
+            "textfont": {"color": 'darkgray'},
+        }],
+        "layout": {
+            "xaxis": {"title": {"text": "Year"}},
+            "yaxis": {"title": {"text": "Cash Flow Accumulation ($)"}, "gridcolor": "lightgray"},
+            "barmode": "relative",
+            "bargap": 0.3,
+            "plot_bgcolor": "white",
+            "margin": {"t": 30},
+        },
+    }
+    figures.append((title, _figure_json(title, fig)))
+    return figures
+
+
+def _line(x, y, name, color, hovertemplate):
+    return {"type": "scatter", "x": x, "y": y, "mode": "lines", "name": name, "line": {"color": color, "width": 2}, "hovertemplate": hovertemplate}
+
+
+def _month_axis(**settings):
+    return {"title": {"text": "Month"}, "type": "date", "tickformat": "%b-%Y", "tickmode": "auto", "nticks": 30, "tickangle": -45, **settings}
+
+
+def _figure_json(title, fig):
+    with phase(f"figure:{title.strip()}"):
+        return pio.to_json(fig, validate=False)
+
+
+def format_metrics_table(metrics):
+    """Render ``saas_model.KeyMetrics`` as the key metrics table: one row per metric, one column per year."""
+
+    def money(value):
+        return f"${value:,.2f}"
+
+    def percent(value):
+        return f"{value:.2%}"
+
+    def payback(value):
+        if value == 0.0:
+            return "Immediately"
+        if value > 1200:
+            return NOT_PROFITABLE
+        return f"{value:,.2f}"
+
+    def yearly(values, fmt, applicable, nan="N/A"):
+        # The January value of each year, "N/A" for every year where the metric does not apply
+        if not applicable:
+            return ["N/A"] * len(metrics.years)
+        return [nan if np.isnan(value) else fmt(value) for value in values.tolist()]
+
+    def constant(value):
+        return [value] * len(metrics.years)
+
+    affiliate_roi_applicable = metrics.affiliate_applicable and not np.isnan(metrics.affiliate_roi_percent)
+    affiliate_payback_applicable = metrics.affiliate_applicable and metrics.affiliate_cac != 0
+    rows = [
+        ("Average Monthly Renewal Rate (%)", constant(f"{metrics.renewal_rate:.1%}")),
+        ("User Subscription Life Time Value - LTV ($)", constant(money(metrics.ltv))),
+        ("SEM Paid Customer Acquisition<br>Cost - CAC ($)", yearly(metrics.sem_cac, money, metrics.sem_applicable)),
+        ("SEM Paid Customer Acquisition<br>Cost ROI ($)", yearly(metrics.sem_roi, money, metrics.sem_applicable)),
+        ("SEM Paid Customer Acquisition<br>Cost ROI (%)", yearly(metrics.sem_roi_percent, percent, metrics.sem_applicable)),
+        (
+            "Affiliate Marketing Customer<br>Acquisition Cost - CAC ($)",
+            constant(money(metrics.affiliate_cac) if metrics.affiliate_applicable else "N/A"),
+        ),
+        (
+            "Affiliate Marketing Customer<br>Acquisition Cost ROI ($)",
+            constant(money(metrics.affiliate_roi) if affiliate_roi_applicable else "N/A"),
+        ),
+        (
+            "Affiliate Marketing Customer<br>Acquisition Cost ROI (%)",
+            constant(percent(metrics.affiliate_roi_percent) if affiliate_roi_applicable else "N/A"),
+        ),
+        ("Average Time to Recover<br>SEM CAC (months)", yearly(metrics.sem_payback_months, payback, metrics.sem_applicable, NOT_PROFITABLE)),
+        (
+            # The label wraps differently when the metric does not apply
+            "Average Time to Recover<br>Affiliate Marketing CAC (months)"
+            if affiliate_payback_applicable
+            else "Average Time to Recover Affiliate<br>Marketing CAC (months)",
+            yearly(metrics.affiliate_payback_months, payback, affiliate_payback_applicable, NOT_PROFITABLE),
+        ),
+    ]
+    table = {"Metric": [label for label, _ in rows]}
+    for position, year in enumerate(metrics.years):
+        table[year] = [values[position] for _, values in rows]
+    return pd.DataFrame(table)
@@ -0,0 +1,82 @@
+"""Computation core of the SaaS financial model, independent of the Streamlit UI.
+
+Names are imported from their submodules on first use, so importing a light
+submodule such as ``saas_model.timing`` does not load NumPy.
+"""
+
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "project_batch": "batch",
+    "scenario_columns": "batch",
+    "CohortMatrix": "cohorts",
+    "build_cohorts": "cohorts",
+    "calendar_totals": "cohorts",
+    "headline_series": "cohorts",
+    "ASSUMPTION_KEYS": "engine",
+    "DEFAULT_CHANNELS": "engine",
+    "RATE_PREFIXES": "engine",
+    "Channel": "engine",
+    "channel": "engine",
+    "horizon_months": "engine",
+    "linear_recurrence": "engine",
+    "month_calendar": "engine",
+    "project_months": "engine",
+    "rate_vector": "engine",
+    "yearly_to_monthly": "engine",
+    "DEFAULT_ASSUMPTIONS": "model",
+    "FINANCIAL_COLUMNS": "model",
+    "KeyMetrics": "model",
+    "Result": "model",
+    "default_assumptions": "model",
+    "default_kick_off_date": "model",
+    "key_metrics": "model",
+    "project": "model",
+    "sem_cac_exceeds_ltv": "model",
+    "lifetime_value": "payback",
+    "payback_months": "payback",
+}
+
+__all__ = [
+    "ASSUMPTION_KEYS",
+    "Channel",
+    "CohortMatrix",
+    "DEFAULT_ASSUMPTIONS",
+    "DEFAULT_CHANNELS",
+    "FINANCIAL_COLUMNS",
+    "KeyMetrics",
+    "RATE_PREFIXES",
+    "Result",
+    "build_cohorts",
+    "calendar_totals",
+    "channel",
+    "default_assumptions",
+    "default_kick_off_date",
+    "headline_series",
+    "horizon_months",
+    "key_metrics",
+    "lifetime_value",
+    "linear_recurrence",
+    "month_calendar",
+    "payback_months",
+    "project",
+    "project_batch",
+    "project_months",
+    "rate_vector",
+    "scenario_columns",
+    "sem_cac_exceeds_ltv",
+    "yearly_to_monthly",
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,137 @@
+"""Arrow tables of projections, written as Arrow IPC (Feather) or Parquet files for analytics tools.
+
+Months become ``timestamp[s]`` columns (datetime64 in pandas), values stay
+float64 (or float32) and payback months stay numeric, with ``inf`` for a CAC
+that is never recovered. Columns are built from the NumPy arrays directly, so
+large batches are exported without going through pandas. Arrow IPC files are
+written uncompressed and can be memory-mapped: ``read_table(path)`` opens one
+without reading it into memory. Needs pyarrow.
+"""
+
+import json
+
+import numpy as np
+
+from .model import FINANCIAL_COLUMNS, key_metrics
+
+# File suffix -> format
+FORMATS = {".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow", ".parquet": "parquet", ".pq": "parquet"}
+MIME_TYPES = {"arrow": "application/vnd.apache.arrow.file", "parquet": "application/vnd.apache.parquet"}
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("Arrow and Parquet export requires pyarrow (pip install pyarrow)") from None
+    return pa
+
+
+def column_array(values):
+    """Arrow array of a 1-D column; datetime64 months become ``timestamp[s]``."""
+    pa = _pyarrow()
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        values = values.astype("datetime64[s]")
+    # Broadcast (zero-stride) columns are copied once; contiguous ones are wrapped without a copy
+    return pa.array(np.ascontiguousarray(values))
+
+
+def monthly_table(months, columns, metadata=None):
+    """Table of the monthly ``columns`` with a leading "Month" column.
+
+    ``months`` and each column are ``(n_months,)`` arrays, or
+    ``(n_scenarios, n_months)`` for a batch; a batch table has one row per
+    scenario and month and a leading "scenario" index column.
+    """
+    pa = _pyarrow()
+    months = np.asarray(months)
+    arrays = {}
+    if months.ndim == 2:
+        n_scenarios, n_months = months.shape
+        arrays["scenario"] = pa.array(np.repeat(np.arange(n_scenarios, dtype=np.int32), n_months))
+    arrays["Month"] = column_array(months.reshape(-1))
+    for name, values in columns.items():
+        if name != "Month":
+            arrays[name] = column_array(np.broadcast_to(values, months.shape).reshape(-1))
+    return pa.table(arrays, metadata=metadata)
+
+
+def batch_table(batch):
+    """Table of a ``project_batch`` result, one row per scenario and month."""
+    return monthly_table(batch["Month"], batch)
+
+
+def yearly_table(years, yearly):
+    """Table of the annual income statement: "Year" and the ``FINANCIAL_COLUMNS`` sums."""
+    return _pyarrow().table({"Year": column_array(np.asarray(years, dtype=np.int64)), **{
+        name: column_array(yearly[name]) for name in FINANCIAL_COLUMNS
+    }})
+
+
+def key_metrics_table(metrics):
+    """Table of ``KeyMetrics``, one row per "Year"; the scalar metrics are repeated on every row."""
+    values = metrics._asdict()
+    years = np.asarray(values.pop("years"), dtype=np.int64)
+    return _pyarrow().table({
+        "Year": column_array(years),
+        **{name: column_array(np.broadcast_to(value, years.shape)) for name, value in values.items()},
+    })
+
+
+def result_tables(result):
+    """``{"monthly", "yearly", "key_metrics"}`` tables of a ``saas_model.Result``.
+
+    The scalar KPIs are stored as JSON in the monthly table's schema metadata
+    under "kpis".
+    """
+    kpis = {name: float(value) for name, value in result.kpis.items()}
+    return {
+        "monthly": monthly_table(result.months, result.columns, metadata={"kpis": json.dumps(kpis)}),
+        "yearly": yearly_table(result.years, result.yearly),
+        "key_metrics": key_metrics_table(key_metrics(result)),
+    }
+
+
+def table_format(path):
+    """The format ("arrow" or "parquet") of ``path`` from its suffix."""
+    for suffix, format_name in FORMATS.items():
+        if path.endswith(suffix):
+            return format_name
+    raise ValueError(f"Unknown table format for {path!r}; use one of {', '.join(FORMATS)}")
+
+
+def _write(table, sink, format_name):
+    pa = _pyarrow()
+    if format_name == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    elif format_name == "arrow":
+        # The IPC file format (Feather v2), uncompressed so it can be memory-mapped
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"Unknown table format {format_name!r}; use arrow or parquet")
+
+
+def write_table(table, path, format_name=None):
+    """Write ``table`` to ``path`` as Arrow IPC or Parquet (by default from the suffix)."""
+    _write(table, path, format_name or table_format(path))
+
+
+def table_bytes(table, format_name):
+    """The ``table`` serialized as an Arrow IPC ("arrow") or Parquet ("parquet") file."""
+    sink = _pyarrow().BufferOutputStream()
+    _write(table, sink, format_name)
+    return sink.getvalue().to_pybytes()
+
+
+def read_table(path):
+    """Read an Arrow IPC file memory-mapped (its buffers stay on disk until used), or a Parquet file."""
+    pa = _pyarrow()
+    if table_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, memory_map=True)
+    return pa.ipc.open_file(pa.memory_map(path)).read_all()
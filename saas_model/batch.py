@@ -0,0 +1,106 @@
+"""Evaluate many assumption sets at once as a scenarios x months array."""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+from .engine import (
+    ASSUMPTION_KEYS,
+    DEFAULT_CHANNELS,
+    HORIZON_MONTHS,
+    RATE_PREFIXES,
+    channel_keys,
+    channels,
+    month_calendar,
+    project_months,
+)
+from .frame import cast
+
+
+def scenario_columns(scenarios):
+    """Return ``{form_data key: 1-D array}`` for a batch of scenarios.
+
+    ``scenarios`` may be a NumPy structured array, a DataFrame with one row per
+    scenario, a mapping of column arrays, or a sequence of ``form_data`` dicts.
+    """
+    if isinstance(scenarios, np.ndarray) and scenarios.dtype.names:
+        return {name: scenarios[name] for name in scenarios.dtype.names}
+    if hasattr(scenarios, "columns"):
+        return {column: scenarios[column].to_numpy() for column in scenarios.columns}
+    if isinstance(scenarios, Mapping):
+        return {key: np.asarray(values) for key, values in scenarios.items()}
+    scenarios = list(scenarios)
+    return {key: np.asarray([scenario[key] for scenario in scenarios]) for key in scenarios[0]}
+
+
+def _has_rate_vector(columns, key, rate_prefixes=RATE_PREFIXES):
+    # sem_cr_y1 etc. are not needed when sem_cr_yearly or sem_cr_monthly is given
+    prefix = key.rpartition("_y")[0]
+    return prefix in rate_prefixes and (f"{prefix}_yearly" in columns or f"{prefix}_monthly" in columns)
+
+
+def _engine_keys(extra_channels):
+    # Exact keys and rate prefixes the engine reads, including those of the extra channels
+    keys, rate_prefixes = channel_keys(channels({"extra_channels": extra_channels})[len(DEFAULT_CHANNELS):])
+    return ASSUMPTION_KEYS + keys, RATE_PREFIXES + rate_prefixes
+
+
+def project_batch(scenarios, kick_off_date=None, horizon=HORIZON_MONTHS, dtype=None, extra_channels=None):
+    """Project every scenario in one vectorized pass.
+
+    Returns a dict with "Month", "Year", "Days Count" and every column of
+    ``project_months``, each as an ``(n_scenarios, n_months)`` array. A
+    ``kick_off_date`` column, when present, takes precedence over the argument.
+    Growth and conversion rates may also be given as ``{prefix}_yearly`` or
+    ``{prefix}_monthly`` arrays of shape ``(n_scenarios, n_periods)``.
+    With ``dtype`` (e.g. ``np.float32``) the float columns are returned as
+    that type; columns that are constant over the months stay broadcast.
+    ``extra_channels`` adds channels as the "extra_channels" assumption does
+    for ``project``; their keys are then read from the scenarios too.
+    """
+    columns = scenario_columns(scenarios)
+    keys, rate_prefixes = _engine_keys(extra_channels)
+    required = keys + tuple(f"{prefix}_y1" for prefix in rate_prefixes[len(RATE_PREFIXES):])
+    missing = [key for key in required if key not in columns and not _has_rate_vector(columns, key, rate_prefixes)]
+    if missing:
+        raise KeyError(f"Scenarios are missing assumption columns: {', '.join(missing)}")
+
+    assumptions = {
+        key: np.asarray(values, dtype=float)
+        for key, values in columns.items()
+        if key in keys or key.startswith(rate_prefixes)
+    }
+    assumptions["extra_channels"] = extra_channels
+    n_scenarios = len(assumptions["subscription_price"])
+
+    kick_off_date = columns.get("kick_off_date", kick_off_date)
+    if kick_off_date is None:
+        raise KeyError("Scenarios need a kick_off_date column or a kick_off_date argument")
+    months, years, days_count = month_calendar(kick_off_date, horizon)
+
+    shape = (n_scenarios, months.shape[-1])
+    result = {
+        "Month": np.broadcast_to(months, shape),
+        "Year": np.broadcast_to(years, shape),
+        "Days Count": np.broadcast_to(days_count, shape),
+    }
+    for name, values in project_months(assumptions, days_count).items():
+        values = np.broadcast_to(values, shape)
+        result[name] = cast(values, dtype) if dtype is not None and values.dtype.kind == "f" else values
+    return result
+
+
+def base_scenarios(assumptions, size, overrides=None):
+    """Columns for ``size`` copies of one scenario, with ``overrides`` (``{key: (size,) array}``) applied.
+
+    Keeps the keys ``project_batch`` reads (with the assumptions' extra
+    channels); vector-valued rates are shared by every copy.
+    """
+    keys, rate_prefixes = _engine_keys(assumptions.get("extra_channels"))
+    columns = {
+        key: np.full(size, float(value)) if np.ndim(value) == 0 else value
+        for key, value in assumptions.items()
+        if key in keys or key.startswith(rate_prefixes)
+    }
+    columns.update(overrides or {})
+    return columns
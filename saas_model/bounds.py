@@ -0,0 +1,28 @@
+"""Valid ranges of the numeric assumptions, mirroring the input form's number_input limits.
+
+Shared by the Monte Carlo sampler (which clips sampled values to them), the
+goal seek's default search ranges and the HTTP API's request validation.
+"""
+
+import re
+
+import numpy as np
+
+BOUNDS = {
+    "churn_rate": (0.01, 1.0),
+    "trial_to_paid": (0.0, 1.0),
+    "free_trial_days": (0.0, 28.0),
+    "views per visit": (1.0, np.inf),
+}
+# Growth and conversion rates, per month, of every channel: per year, or as yearly or monthly vectors
+RATE_BOUNDS = (0.0, 1.0)
+_RATE_KEY = re.compile(r"_(cr|traffic_gr)_(y\d+|yearly|monthly)$")
+
+
+def input_bounds(key):
+    """``(low, high)`` of an assumption; amounts and costs default to ``(0, inf)``."""
+    if key in BOUNDS:
+        return BOUNDS[key]
+    if _RATE_KEY.search(key):
+        return RATE_BOUNDS
+    return (0.0, np.inf)
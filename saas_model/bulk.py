@@ -0,0 +1,323 @@
+"""Project scenario tables in chunks: ``python -m saas_model.bulk scenarios.csv -o results.parquet``.
+
+Each row of the input (CSV, or Parquet with pyarrow) is one scenario, with
+columns named after the ``form_data`` keys (rates as fractions); headers are
+matched ignoring case, spaces and dashes, and ``rename`` maps any others.
+Missing keys take the form defaults. Rows are read ``chunk_rows`` at a time,
+projected with ``project_batch`` and written out before the next chunk is
+read, so memory stays bounded by the chunk size however long the input is.
+The output has one row per scenario and year (the income statement) or per
+scenario and month.
+"""
+
+import argparse
+import csv
+import itertools
+import sys
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from .arrowio import column_array
+from .batch import _engine_keys, base_scenarios, project_batch
+from .engine import horizon_months
+from .model import FINANCIAL_COLUMNS, default_assumptions
+from .timing import phase
+
+DEFAULT_CHUNK_ROWS = 10_000
+OUTPUTS = ("yearly", "monthly")
+
+
+class BulkStats(NamedTuple):
+    rows: int  # scenarios read and projected
+    output_rows: int
+    seconds: float
+    read_seconds: float
+    project_seconds: float
+    write_seconds: float
+    ignored: tuple  # input columns that are not assumptions (nor the id column)
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _normalize(name):
+    return name.strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def column_keys(names, rename=None, extra_channels=None):
+    """Map input column names to assumption keys; names that match none are left out."""
+    keys, rate_prefixes = _engine_keys(extra_channels)
+    known = {_normalize(key): key for key in (*keys, "kick_off_date")}
+    mapping = {}
+    for name in names:
+        if rename and name in rename:
+            mapping[name] = rename[name]
+        elif name in keys or name == "kick_off_date" or name.startswith(rate_prefixes):
+            mapping[name] = name
+        elif _normalize(name) in known:
+            mapping[name] = known[_normalize(name)]
+        elif _normalize(name).startswith(rate_prefixes):
+            mapping[name] = _normalize(name)
+    return mapping
+
+
+def _csv_column(values):
+    # Numbers as floats, with empty cells as NaN; anything else (dates, ids) stays text
+    try:
+        return np.asarray(values, dtype=float)
+    except ValueError:
+        text = np.asarray(values)
+    try:
+        return np.asarray(np.where(np.char.strip(text) == "", "nan", text), dtype=float)
+    except ValueError:
+        return text
+
+
+def _read_csv(path, chunk_rows):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        while True:
+            rows = list(itertools.islice(reader, chunk_rows))
+            if not rows:
+                return
+            yield {name: _csv_column(values) for name, values in zip(header, zip(*rows))}
+
+
+def _read_parquet(path, chunk_rows):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Reading Parquet requires pyarrow (pip install pyarrow)")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+        yield {name: column.to_numpy(zero_copy_only=False) for name, column in zip(batch.schema.names, batch.columns)}
+
+
+def read_scenarios(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Yield ``{column name: (rows,) array}`` chunks of a .csv or .parquet file."""
+    reader = _read_parquet if path.endswith((".parquet", ".pq")) else _read_csv
+    return reader(path, chunk_rows)
+
+
+def _yearly_table(ids, result):
+    # Scenarios with the same kick-off month share their calendar years, so each group is summed at once
+    first_months = result["Month"][:, 0]
+    parts = []
+    for first_month in np.unique(first_months):
+        rows = np.flatnonzero(first_months == first_month)
+        years = result["Year"][rows[0]]
+        year_starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+        n_years = len(year_starts)
+        part = {"scenario": np.repeat(ids[rows], n_years), "Year": np.tile(years[year_starts], len(rows))}
+        for name in FINANCIAL_COLUMNS:
+            part[name] = np.add.reduceat(result[name][rows], year_starts, axis=1).reshape(-1)
+        parts.append((rows, part))
+    if len(parts) == 1:
+        return parts[0][1]
+    # Back to input order: by scenario, then year
+    order = np.argsort(np.concatenate([np.repeat(rows, len(part["Year"]) // len(rows)) for rows, part in parts]), kind="stable")
+    return {name: np.concatenate([part[name] for _, part in parts])[order] for name in parts[0][1]}
+
+
+def _monthly_table(ids, result, columns=None):
+    _, n_months = result["Month"].shape
+    names = [name for name in result if name not in ("Month", "Year")] if columns is None else columns
+    table = {"scenario": np.repeat(ids, n_months), "Month": result["Month"].reshape(-1)}
+    table.update((name, np.asarray(result[name]).reshape(-1)) for name in names)
+    return table
+
+
+class CsvSink:
+    """Append tables to a CSV file; the header is written with the first table."""
+
+    def __init__(self, path):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._header = None
+
+    def write(self, table):
+        if self._header is None:
+            self._header = list(table)
+            self._writer.writerow(self._header)
+        # Python floats are written by repr; months and float32 values are formatted by NumPy instead
+        values = [np.asarray(table[name]) for name in self._header]
+        self._writer.writerows(zip(*(
+            column.tolist() if column.dtype.kind in "iub" or column.dtype == np.float64 else column.astype(str).tolist()
+            for column in values
+        )))
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSink:
+    """Append tables to a Parquet file, one row group per table."""
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Writing Parquet requires pyarrow (pip install pyarrow)")
+        self._pa, self._pq = pa, pq
+        self._path = path
+        self._writer = None
+
+    def write(self, table):
+        batch = self._pa.table({name: column_array(values) for name, values in table.items()})
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, batch.schema)
+        self._writer.write_table(batch.cast(self._writer.schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_sink(path):
+    """Return a ``CsvSink`` or, for .parquet/.pq paths, a ``ParquetSink``."""
+    return ParquetSink(path) if path.endswith((".parquet", ".pq")) else CsvSink(path)
+
+
+def project_file(
+    source,
+    output_path,
+    output="yearly",
+    chunk_rows=DEFAULT_CHUNK_ROWS,
+    rename=None,
+    id_column=None,
+    columns=None,
+    horizon=None,
+    dtype=None,
+    extra_channels=None,
+    progress=None,
+):
+    """Project every scenario row of ``source`` and write the ``output`` table to ``output_path``.
+
+    ``source`` is a .csv/.parquet path or an iterable of column chunks (as
+    from ``read_scenarios``). ``id_column`` labels the output rows (default:
+    the row number); ``columns`` picks the monthly columns. ``progress`` is
+    called with the running ``BulkStats`` after each chunk.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"output must be one of {', '.join(OUTPUTS)}")
+    chunks = read_scenarios(source, chunk_rows) if isinstance(source, str) else iter(source)
+    defaults = {**default_assumptions(), "extra_channels": extra_channels}
+    horizon = horizon or horizon_months(defaults)
+    rows = output_rows = 0
+    timings = {"read": 0.0, "project": 0.0, "write": 0.0}
+    ignored = ()
+    started = time.perf_counter()
+    sink = open_sink(output_path)
+    try:
+        while True:
+            with phase("bulk:read"):
+                step = time.perf_counter()
+                chunk = next(chunks, None)
+                timings["read"] += time.perf_counter() - step
+            if chunk is None:
+                break
+            n_rows = len(next(iter(chunk.values())))
+
+            with phase("bulk:project"):
+                step = time.perf_counter()
+                mapping = column_keys([name for name in chunk if name != id_column], rename, extra_channels)
+                ignored = tuple(name for name in chunk if name not in mapping and name != id_column)
+                given = {mapping[name]: values for name, values in chunk.items() if name in mapping}
+                _check_missing(chunk, mapping, rows)
+                kick_off_date = given.pop("kick_off_date", defaults["kick_off_date"])
+                result = project_batch(
+                    base_scenarios(defaults, n_rows, given),
+                    kick_off_date=kick_off_date,
+                    horizon=horizon,
+                    dtype=dtype,
+                    extra_channels=extra_channels,
+                )
+                ids = np.asarray(chunk[id_column]) if id_column else np.arange(rows, rows + n_rows)
+                table = _yearly_table(ids, result) if output == "yearly" else _monthly_table(ids, result, columns)
+                timings["project"] += time.perf_counter() - step
+
+            with phase("bulk:write"):
+                step = time.perf_counter()
+                sink.write(table)
+                timings["write"] += time.perf_counter() - step
+
+            rows += n_rows
+            output_rows += len(table["scenario"])
+            if progress is not None:
+                progress(_stats(rows, output_rows, started, timings, ignored))
+    finally:
+        sink.close()
+    return _stats(rows, output_rows, started, timings, ignored)
+
+
+def _check_missing(chunk, mapping, first_row):
+    # Empty CSV cells and Parquet nulls arrive as NaN; a scenario without a value cannot be projected
+    for name, values in chunk.items():
+        values = np.asarray(values)
+        if name in mapping and values.dtype.kind == "f":
+            missing = np.flatnonzero(np.isnan(values))
+            if missing.size:
+                raise ValueError(f"Column {name!r} has no value in row {first_row + missing[0] + 1:,} (1 is the first scenario)")
+
+
+def _stats(rows, output_rows, started, timings, ignored):
+    return BulkStats(
+        rows, output_rows, time.perf_counter() - started, timings["read"], timings["project"], timings["write"], ignored
+    )
+
+
+def _parse_rename(pairs):
+    rename = {}
+    for pair in pairs:
+        name, sep, key = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"--rename takes COLUMN=KEY, got {pair!r}")
+        rename[name] = key
+    return rename
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="saas_model.bulk", description="Project every scenario row of a CSV or Parquet file.")
+    parser.add_argument("scenarios", help=".csv or .parquet file, one scenario per row, columns named after form_data keys")
+    parser.add_argument("-o", "--output", required=True, help="write the results to this .csv or .parquet file")
+    parser.add_argument("--monthly", action="store_true", help="one output row per scenario and month instead of per year")
+    parser.add_argument("--columns", help="comma-separated monthly columns to write (default: all)")
+    parser.add_argument("--id-column", help="input column that labels the scenarios (default: the row number)")
+    parser.add_argument("--rename", action="append", default=[], metavar="COLUMN=KEY", help="map an input column to a form_data key")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help=f"scenarios per batch (default: {DEFAULT_CHUNK_ROWS:,})")
+    parser.add_argument("--horizon-years", type=float, help="projection length for every scenario (default: 5)")
+    parser.add_argument("--float32", action="store_true", help="round the projected values to float32 before they are aggregated and written (the projection runs in float64)")
+    parser.add_argument("--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args(argv)
+
+    def progress(stats):
+        print(f"{stats.rows:>12,} scenarios  {stats.rows_per_second:>10,.0f} scenarios/s", file=sys.stderr)
+
+    stats = project_file(
+        args.scenarios,
+        args.output,
+        output="monthly" if args.monthly else "yearly",
+        chunk_rows=args.chunk_rows,
+        rename=_parse_rename(args.rename),
+        id_column=args.id_column,
+        columns=args.columns.split(",") if args.columns else None,
+        horizon=horizon_months({"horizon_years": args.horizon_years}) if args.horizon_years is not None else None,
+        dtype=np.float32 if args.float32 else None,
+        progress=None if args.quiet else progress,
+    )
+    if stats.ignored:
+        print(f"Ignored columns: {', '.join(stats.ignored)}", file=sys.stderr)
+    print(
+        f"{stats.rows:,} scenarios -> {stats.output_rows:,} rows in {stats.seconds:.2f} s "
+        f"({stats.rows_per_second:,.0f} scenarios/s; read {stats.read_seconds:.2f} s, "
+        f"project {stats.project_seconds:.2f} s, write {stats.write_seconds:.2f} s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Command line interface: ``python -m saas_model assumptions.json``.
+
+Assumption files use the ``form_data`` keys and units (rates as fractions);
+missing keys take the form defaults. Only NumPy is imported, so the CLI
+starts without Streamlit, pandas or Plotly.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+
+from .arrowio import FORMATS, result_tables, write_table
+from .model import FINANCIAL_COLUMNS, key_metrics, project
+
+
+def load_assumptions(path):
+    """Read assumptions from a JSON or YAML file, or JSON on stdin when ``path`` is "-"."""
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("Reading YAML assumptions requires PyYAML (pip install pyyaml)")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def _json_number(value):
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def monthly_report(months, columns):
+    """Return the ``{name: monthly values}`` columns as a JSON-ready dict, with "Month" first."""
+    return {
+        "Month": [str(month) for month in months],
+        **{name: [_json_number(v) for v in values] for name, values in columns.items()},
+    }
+
+
+def write_monthly(result, path):
+    """Write the monthly columns to CSV, or to JSON, Arrow IPC or Parquet by the suffix of ``path``."""
+    if path.endswith(tuple(FORMATS)):
+        try:
+            write_table(result_tables(result)["monthly"], path)
+        except ImportError as error:
+            raise SystemExit(str(error))
+        return
+    if path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(monthly_report(result.months, result.columns), f)
+        return
+    names = list(result.columns)
+    months = [str(month) for month in result.months]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Month", *names])
+        for row, month in enumerate(months):
+            writer.writerow([month, *(result.columns[name][row] for name in names)])
+
+
+def kpi_report(result):
+    """Return the KPIs, the key metrics and the annual income statement as a JSON-ready dict."""
+    metrics = key_metrics(result)._asdict()
+    years = metrics.pop("years")
+    return {
+        "kpis": {name: _json_number(value) for name, value in result.kpis.items()},
+        "key_metrics": {
+            "years": [int(year) for year in years],
+            **{
+                name: (
+                    value if isinstance(value, bool)
+                    else [_json_number(v) for v in value] if isinstance(value, np.ndarray)
+                    else _json_number(value)
+                )
+                for name, value in metrics.items()
+            },
+        },
+        "yearly": {
+            "Year": [int(year) for year in result.years],
+            **{name: [_json_number(v) for v in result.yearly[name]] for name in FINANCIAL_COLUMNS},
+        },
+    }
+
+
+def print_report(result, out=sys.stdout):
+    for name, value in result.kpis.items():
+        print(f"{name:32} {value:>18,.2f}", file=out)
+    print(file=out)
+    print(f"{'':32}" + "".join(f"{int(year):>18}" for year in result.years), file=out)
+    for name in FINANCIAL_COLUMNS:
+        print(f"{name:32}" + "".join(f"{value:>18,.2f}" for value in result.yearly[name]), file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="saas_model", description="Project the SaaS financial model from an assumptions file.")
+    parser.add_argument("assumptions", help="JSON or YAML file with form_data keys, or - for JSON on stdin")
+    parser.add_argument("-o", "--output", help="write the monthly projection to this .csv, .json, .arrow or .parquet file")
+    parser.add_argument("--json", action="store_true", help="print KPIs and the yearly income statement as JSON")
+    args = parser.parse_args(argv)
+
+    result = project(load_assumptions(args.assumptions))
+    if args.output:
+        write_monthly(result, args.output)
+    if args.json:
+        json.dump(kpi_report(result), sys.stdout, indent=2)
+        print()
+    else:
+        print_report(result)
+    return 0
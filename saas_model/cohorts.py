@@ -0,0 +1,140 @@
+"""Cohort view of the subscription model: one row per acquisition month.
+
+Cohort ``c`` holds the trials started in month ``c``. Its paying users are
+kept by age (months since acquisition) in banded ``(channels, cohorts, ages)``
+arrays, so memory is O(horizon x window) rather than O(horizon ** 2). The
+window ends at the age past which the renewals still to come can no longer
+change a calendar month's MRR by ``tolerance`` (half a cent, the rounding of
+the displayed amounts); it depends on the churn rate and the size of the
+largest cohort, not on the horizon. Summing a band along its anti-diagonals
+(``calendar_totals``) gives calendar-month series, which reproduce the
+engine's trial-to-paid and renewal transaction counts to within that bound.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .engine import channels, horizon_months, month_calendar, project_months
+from .model import default_assumptions
+
+# Most MRR (in currency) the window may drop from any calendar month: half a displayed cent
+COHORT_TOLERANCE = 0.005
+
+
+class CohortMatrix(NamedTuple):
+    months: np.ndarray  # (n_months,) datetime64[M]; cohort c is acquired in months[c]
+    channels: tuple
+    conversions: np.ndarray  # (channels, cohorts, 2): trial-to-paid conversions at ages 0 and 1
+    renewals: np.ndarray  # (channels, cohorts, window): renewing users at each age
+    acquisition_cost: np.ndarray  # (channels, cohorts): marketing spend in the acquisition month
+    subscription_price: float
+
+
+def cohort_window(renewal_rate, horizon, peak_value=1.0, tolerance=COHORT_TOLERANCE):
+    """Number of ages to keep, at most ``horizon``.
+
+    ``peak_value`` is the largest monthly value of any cohort's conversions
+    (e.g. users times price). A user converted at age 0 or 1 is still paying
+    at age ``a`` with probability at most ``renewal_rate ** (a - 1)``, so the
+    ages dropped from a calendar month add up to at most
+    ``peak_value * renewal_rate ** (window - 1) / (1 - renewal_rate)``; the
+    window is the smallest one that keeps this within ``tolerance``.
+    """
+    if renewal_rate >= 1:
+        return horizon
+    if renewal_rate <= 0 or peak_value <= 0:
+        return min(horizon, 2)
+    ages = np.log(tolerance * (1 - renewal_rate) / peak_value) / np.log(renewal_rate)
+    return int(min(horizon, max(2, np.ceil(ages) + 1)))
+
+
+def build_cohorts(assumptions, horizon=None, tolerance=COHORT_TOLERANCE):
+    """Build the acquisition-month x age matrices for one scenario, split by channel.
+
+    Keys missing from ``assumptions`` take their form defaults, as in ``project``.
+    """
+    a = {**default_assumptions(), **assumptions}
+    months, _, days_count = month_calendar(a["kick_off_date"], horizon or horizon_months(a))
+    columns = project_months(a, days_count)
+    channel_list = channels(a)
+
+    subscriptions = np.stack([columns[spec.subscriptions_column] for spec in channel_list])
+    trial_to_paid = float(a["trial_to_paid"])
+    within = subscriptions * columns["Trial-To-Paid Within Month"] * trial_to_paid
+    crossover = subscriptions * columns["Cross-Over Month Trial-To-Paid"] * trial_to_paid
+
+    # Users converting in the acquisition month renew from age 1, cross-over conversions from age 2
+    renewal_rate = 1 - float(a["churn_rate"])
+    # Bounds the dropped MRR by ``tolerance``, and the dropped users by ``tolerance`` below a price of 1
+    peak_value = float((within + crossover).sum(axis=0).max()) * max(float(a["subscription_price"]), 1.0)
+    ages = np.arange(cohort_window(renewal_rate, len(months), peak_value, tolerance))
+    renew_within = np.where(ages >= 1, renewal_rate ** ages, 0.0)
+    renew_crossover = np.where(ages >= 2, renewal_rate ** np.maximum(ages - 1.0, 0.0), 0.0)
+    renewals = within[..., np.newaxis] * renew_within + crossover[..., np.newaxis] * renew_crossover
+
+    return CohortMatrix(
+        months=months,
+        channels=tuple(spec.key for spec in channel_list),
+        conversions=np.stack([within, crossover], axis=-1),
+        renewals=renewals,
+        acquisition_cost=np.stack([np.broadcast_to(columns[spec.cost_column], months.shape) for spec in channel_list]),
+        subscription_price=float(a["subscription_price"]),
+    )
+
+
+def calendar_totals(band, n_months=None):
+    """Sum a ``(..., cohorts, ages)`` band by calendar month: ``total[t]`` adds every ``c + age == t``.
+
+    Ages past the last cohort's month (``n_months``, the number of cohorts by
+    default) are dropped.
+    """
+    n_cohorts, window = band.shape[-2:]
+    n_months = n_months or n_cohorts
+    totals = np.zeros(band.shape[:-2] + (n_months,))
+    for age in range(min(window, n_months)):
+        totals[..., age:] += band[..., : n_months - age, age]
+    return totals
+
+
+def paying_users(cohorts):
+    """Paying users of each cohort at each age, ``(channels, cohorts, window)``."""
+    users = cohorts.renewals.copy()
+    width = min(2, users.shape[-1])
+    users[..., :width] += cohorts.conversions[..., :width]
+    return users
+
+
+def headline_series(cohorts):
+    """The engine's transaction count and MRR columns, as column sums of the cohort matrix."""
+    new = calendar_totals(cohorts.conversions).sum(axis=0)
+    renewals = calendar_totals(cohorts.renewals).sum(axis=0)
+    return {
+        "Trial To Paid Transactions Count": new,
+        "Monthly Renewal Transactions Count": renewals,
+        "New Monthly Recurring Revenue MRR": new * cohorts.subscription_price,
+        "Renewal Recurring Revenue MRR": renewals * cohorts.subscription_price,
+    }
+
+
+def cohort_retention(cohorts):
+    """Share of each cohort's converted users still paying at each age, ``(cohorts, window)``."""
+    converted = cohorts.conversions.sum(axis=(0, -1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return paying_users(cohorts).sum(axis=0) / converted[:, np.newaxis]
+
+
+def cohort_revenue(cohorts):
+    """Subscription revenue of each cohort at each age, ``(channels, cohorts, window)``."""
+    return paying_users(cohorts) * cohorts.subscription_price
+
+
+def cohort_payback(cohorts):
+    """Age in months at which each cohort's cumulative revenue covers its acquisition cost.
+
+    Returns ``(channels, cohorts)``; 0 means the acquisition month itself pays
+    it back and ``inf`` that it is not recovered within the window.
+    """
+    cumulative = np.cumsum(cohort_revenue(cohorts), axis=-1)
+    covered = cumulative >= cohorts.acquisition_cost[..., np.newaxis]
+    return np.where(covered.any(axis=-1), covered.argmax(axis=-1), np.inf)
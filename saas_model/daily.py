@@ -0,0 +1,57 @@
+"""Daily-resolution free trials, rolled up to monthly trial-to-paid counts.
+
+The monthly engine splits each month's trials into "within month" and
+"cross-over" shares using ``free_trial_days / Days Count``, which assumes
+trial starts are spread evenly and that no trial outlasts the next month.
+Here every month's new subscriptions are spread over its days, following
+each channel's traffic growth within the month, and each trial converts
+exactly ``free_trial_days`` later (a convolution of daily trial starts
+with the conversion kernel). Conversions are then summed back per month.
+"""
+
+import numpy as np
+
+
+def day_calendar(days_count):
+    """Return ``(month_index, day_in_month)`` for every day of consecutive months of ``days_count`` days."""
+    days_count = np.asarray(days_count, dtype=np.int64)
+    month_index = np.repeat(np.arange(len(days_count)), days_count)
+    month_starts = np.cumsum(days_count) - days_count
+    day_in_month = np.arange(month_index.size) - month_starts[month_index]
+    return month_index, day_in_month
+
+
+def daily_trials(monthly_subscriptions, monthly_growth, days_count):
+    """Spread each month's new subscriptions over its days.
+
+    ``monthly_subscriptions`` and ``monthly_growth`` are 1-D or ``(channels,
+    months)``; channels are summed. Within a month, daily starts grow
+    geometrically at that month's traffic growth rate, so a growing month has
+    more trials near its end, and the month total is preserved.
+    """
+    days_count = np.asarray(days_count, dtype=np.int64)
+    month_index, day_in_month = day_calendar(days_count)
+    subscriptions = np.atleast_2d(np.asarray(monthly_subscriptions, dtype=float))
+    growth = np.atleast_2d(1 + np.asarray(monthly_growth, dtype=float))
+    weights = growth[:, month_index] ** (day_in_month / days_count[month_index])
+    month_totals = np.stack([np.bincount(month_index, weights=row) for row in weights])
+    return (subscriptions[:, month_index] * weights / month_totals[:, month_index]).sum(axis=0)
+
+
+def trial_conversions(trials, free_trial_days, trial_to_paid):
+    """Daily trial-to-paid conversions: trials convert on the day they expire, ``free_trial_days`` after starting."""
+    kernel = np.zeros(int(free_trial_days) + 1)
+    kernel[-1] = trial_to_paid
+    return np.convolve(trials, kernel)[: len(trials)]
+
+
+def daily_trial_to_paid(monthly_subscriptions, monthly_growth, days_count, free_trial_days, trial_to_paid):
+    """Monthly trial-to-paid transaction counts with trial expiry simulated day by day.
+
+    Trials still running at the end of the horizon are not counted, as in the
+    monthly engine.
+    """
+    month_index, _ = day_calendar(days_count)
+    trials = daily_trials(monthly_subscriptions, monthly_growth, days_count)
+    conversions = trial_conversions(trials, free_trial_days, trial_to_paid)
+    return np.bincount(month_index, weights=conversions, minlength=len(days_count))
@@ -0,0 +1,105 @@
+"""Persistent projection cache in a local SQLite file, shared by every worker process.
+
+Values are opaque blobs; ``pack_columns``/``unpack_columns`` turn a dict of
+NumPy arrays into a compact, compressed columnar blob. SQLite's WAL mode and
+``BEGIN IMMEDIATE`` transactions make concurrent readers and writers safe.
+"""
+
+import io
+import sqlite3
+import time
+from contextlib import closing
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+def pack_columns(columns):
+    """Serialize ``{name: ndarray}`` (numeric or datetime64) into a compressed ``.npz`` blob."""
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **columns)
+    return buffer.getvalue()
+
+
+def unpack_columns(blob):
+    with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+
+class DiskCache:
+    """Key/blob store with a time-to-live and a total size limit (least recently used evicted first)."""
+
+    def __init__(self, path, ttl_seconds=7 * 24 * 3600, max_bytes=256 * 1024 * 1024, timeout=10.0):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connect(self):
+        # One short-lived connection per call keeps this safe across threads and processes
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return closing(conn)
+
+    def get(self, key):
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM entries WHERE key = ? AND created >= ?", (key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                return None
+            try:
+                conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            except sqlite3.OperationalError:
+                pass  # Another writer holds the lock; the access time is only an eviction hint
+            return row[0]
+
+    def put(self, key, value):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, sqlite3.Binary(value), len(value), now, now),
+                )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM entries WHERE created < ?", (now - self.ttl_seconds,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def stats(self):
+        with self._connect() as conn:
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": count, "bytes": size, "max_bytes": self.max_bytes, "ttl_seconds": self.ttl_seconds}
+
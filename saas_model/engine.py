@@ -0,0 +1,340 @@
+"""Pure-NumPy projection engine.
+
+Every series is computed along a trailing month axis. Assumption values may be
+plain scalars (one scenario) or 1-D arrays (one value per scenario); in the
+latter case every returned series has shape ``(n_scenarios, n_months)``.
+Acquisition channels (see ``Channel``) are one more axis before the months:
+every channel's traffic, subscriptions and cost are computed together as
+``(..., n_channels, n_months)`` tensors and then split into the named columns.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .daily import daily_trial_to_paid
+
+HORIZON_MONTHS = 60
+
+
+class Channel(NamedTuple):
+    """An acquisition channel; its traffic, conversions and cost are one row of the channel axis."""
+
+    key: str  # assumption key prefix: {key}_traffic_m1, {key}_traffic_gr_y1.., {key}_cr_y1..
+    cost_model: str  # "cpc" (per visit), "cpa" (per subscription) or "fixed" (per month)
+    cost_key: str  # assumption with the cost per click, per acquisition or per month
+    traffic_column: str
+    subscriptions_column: str
+    cost_column: str
+
+
+COST_MODELS = ("cpc", "cpa", "fixed")
+
+# The form's channels; more can be added with the "extra_channels" assumption (see channel)
+DEFAULT_CHANNELS = (
+    Channel("sem", "cpc", "sem_cpc", "SEM - Paid Traffic", "SEM Subscriptions", "SEM Marketing"),
+    Channel("seo", "fixed", "monthly_seo_marketing_cost", "SEO - Organic Traffic", "SEO Subscriptions", "SEO Marketing Cost"),
+    Channel("am", "cpa", "affiliate_cpa", "AM - Paid Traffic", "AM Subscriptions", "Affiliate Marketing"),
+)
+CHANNELS = tuple(channel.key for channel in DEFAULT_CHANNELS)
+
+# Rates that vary over time: each may be given per year or per month (see rate_vector)
+RATE_PREFIXES = (*(f"{channel}_traffic_gr" for channel in CHANNELS), *(f"{channel}_cr" for channel in CHANNELS))
+
+# Numeric form_data keys the engine reads (kick_off_date is handled by the calendar)
+ASSUMPTION_KEYS = (
+    "subscription_price", "free_trial_days", "trial_to_paid", "churn_rate",
+    "sem_traffic_m1", "seo_traffic_m1", "am_traffic_m1",
+    *(f"{channel}_traffic_gr_y{year}" for channel in CHANNELS for year in range(1, 6)),
+    *(f"{channel}_cr_y{year}" for channel in CHANNELS for year in range(1, 6)),
+    "sem_cpc", "affiliate_cpa", "monthly_seo_marketing_cost", "ccp_rate", "refund_rate", "chb_rate",
+    "monthly_web_hosting_cost", "monthly_techsoft_cost", "monthly_labor_cost",
+    "views per visit", "cpm", "am_ctr", "am_ocr", "am_cpa",
+)
+
+
+def channel(key, cost_model, cost_key=None, name=None):
+    """Define an extra channel; its assumptions are ``{key}_traffic_m1``, ``{key}_traffic_gr_y1``..,
+    ``{key}_cr_y1``.. and ``cost_key`` (default ``{key}_{cost_model}``).
+
+    Columns are named "{name} Traffic", "{name} Subscriptions" and "{name}
+    Marketing", with ``name`` defaulting to the upper-cased key.
+    """
+    if cost_model not in COST_MODELS:
+        raise ValueError(f"Unknown cost model {cost_model!r}: expected one of {', '.join(COST_MODELS)}")
+    name = name or key.upper()
+    return Channel(key, cost_model, cost_key or f"{key}_{cost_model}", f"{name} Traffic", f"{name} Subscriptions", f"{name} Marketing")
+
+
+def channels(assumptions):
+    """The form's channels followed by the assumptions' ``extra_channels`` (``Channel``s or ``channel`` keyword dicts)."""
+    extra = assumptions.get("extra_channels") or ()
+    return DEFAULT_CHANNELS + tuple(spec if isinstance(spec, Channel) else channel(**spec) for spec in extra)
+
+
+def channel_keys(channel_list):
+    """Return ``(keys, rate_prefixes)``: the assumption keys and rate prefixes read for ``channel_list``."""
+    keys = tuple(key for spec in channel_list for key in (f"{spec.key}_traffic_m1", spec.cost_key))
+    rate_prefixes = tuple(f"{spec.key}_{rate}" for spec in channel_list for rate in ("traffic_gr", "cr"))
+    return keys, rate_prefixes
+
+
+def horizon_months(assumptions):
+    """Projection length in months: ``horizon_years`` from the assumptions, 5 years by default."""
+    if "horizon_years" not in assumptions:
+        return HORIZON_MONTHS
+    horizon = int(round(float(assumptions["horizon_years"]) * 12))
+    if horizon < 1:
+        raise ValueError("horizon must be at least one month")
+    return horizon
+
+
+def month_calendar(kick_off_date, horizon=HORIZON_MONTHS):
+    """Return ``(months, years, days_count)`` for ``horizon`` months from kick-off.
+
+    ``kick_off_date`` may also be an array of dates, one per scenario.
+    """
+    months = np.asarray(kick_off_date, dtype="datetime64[M]")[..., np.newaxis] + np.arange(horizon)
+    years = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    days_count = ((months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")).astype(np.int64)
+    return months, years, days_count
+
+
+def _fit(monthly, horizon):
+    # Truncate to the horizon, or hold the last value for the remaining months
+    if monthly.shape[-1] < horizon:
+        tail = np.repeat(monthly[..., -1:], horizon - monthly.shape[-1], axis=-1)
+        monthly = np.concatenate([monthly, tail], axis=-1)
+    return monthly[..., :horizon]
+
+
+def yearly_to_monthly(yearly_values, horizon=HORIZON_MONTHS):
+    """Expand per-year values (last axis) to per-month values by repeating each year 12 times.
+
+    Months past the last given year keep that year's value.
+    """
+    return _fit(np.repeat(np.asarray(yearly_values, dtype=float), 12, axis=-1), horizon)
+
+
+def rate_vector(assumptions, prefix, horizon=HORIZON_MONTHS):
+    """Monthly values of a time-varying rate such as ``"sem_cr"``, over ``horizon`` months.
+
+    Read from ``{prefix}_monthly`` (one value per month), else ``{prefix}_yearly``
+    (one per year), else the form's ``{prefix}_y1``, ``{prefix}_y2``, ... keys.
+    Periods past the last given value, and years without a key, keep the
+    previous value.
+    """
+    if f"{prefix}_monthly" in assumptions:
+        return _fit(np.asarray(assumptions[f"{prefix}_monthly"], dtype=float), horizon)
+    if f"{prefix}_yearly" in assumptions:
+        return yearly_to_monthly(assumptions[f"{prefix}_yearly"], horizon)
+    if f"{prefix}_y1" not in assumptions:
+        raise KeyError(f"No values for {prefix}: expected {prefix}_monthly, {prefix}_yearly or {prefix}_y1")
+    key_prefix = f"{prefix}_y"
+    last_year = max(int(key[len(key_prefix):]) for key in assumptions if key.startswith(key_prefix) and key[len(key_prefix):].isdigit())
+    # A year without its own key keeps the previous year's value
+    values = [np.asarray(assumptions[f"{prefix}_y1"], dtype=float)]
+    for year in range(2, last_year + 1):
+        values.append(np.asarray(assumptions.get(f"{key_prefix}{year}", values[-1]), dtype=float))
+    return yearly_to_monthly(np.stack(np.broadcast_arrays(*values), axis=-1), horizon)
+
+
+def linear_recurrence(a, b):
+    """Solve ``x[t] = a[t] * x[t-1] + b[t]`` with ``x[-1] = 0`` along the last axis.
+
+    Uses a log-depth prefix scan over (multiplier, offset) pairs, so a horizon of
+    ``n`` months costs ``log2(n)`` array operations instead of ``n`` scalar steps.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a = a.copy()
+    x = b.copy()
+    n = x.shape[-1]
+    step = 1
+    while step < n:
+        x[..., step:] = a[..., step:] * x[..., :-step] + x[..., step:]
+        a[..., step:] = a[..., step:] * a[..., :-step]
+        step *= 2
+    return x
+
+
+def _shift(series):
+    # Previous month's value, with zero before the first month
+    shifted = np.zeros_like(series)
+    shifted[..., 1:] = series[..., :-1]
+    return shifted
+
+
+def _col(value):
+    # Scalar or per-scenario value -> broadcastable against (..., months)
+    return np.asarray(value, dtype=float)[..., np.newaxis]
+
+
+def _traffic(initial, monthly_growth):
+    # First month is the initial value; every later month compounds that year's growth rate
+    factors = (1 + monthly_growth) * np.ones_like(initial)
+    factors[..., 0] = initial[..., 0]
+    return np.cumprod(factors, axis=-1)
+
+
+# Column order of the app's monthly DataFrame (after Month, Year and Days Count)
+MONTHLY_COLUMNS = (
+    "Cross-Over Month Trial-To-Paid", "Trial-To-Paid Within Month",
+    "SEM - Paid Traffic", "SEO - Organic Traffic", "AM - Paid Traffic",
+    "SEM Subscriptions", "SEO Subscriptions", "AM Subscriptions", "Total Monthly Subscriptions", "Website Views",
+    "Trial To Paid Transactions Count", "Monthly Renewal Transactions Count",
+    "New Monthly Recurring Revenue MRR", "Renewal Recurring Revenue MRR", "Ad Network Revenue", "Ad Affiliate Revenue",
+    "Revenue", "Chargebacks", "Refunds", "Income", "Credit Card Processing", "Web Hosting",
+    "Cost of Goods/Services Sold", "Gross Income", "Labor Cost", "SEM Marketing", "am_cpa_month_cost",
+    "Affiliate Marketing", "SEO Marketing Cost", "Internet Marketing Cost", "Technology & Software",
+    "Earnings Before Taxes", "Cash Flow Accumulation",
+)
+
+
+def monthly_columns(channel_list=DEFAULT_CHANNELS):
+    """``MONTHLY_COLUMNS`` with the columns of any extra channels after the form channels' ones."""
+    extra = channel_list[len(DEFAULT_CHANNELS):]
+    if not extra:
+        return MONTHLY_COLUMNS
+    after = {
+        "AM - Paid Traffic": [spec.traffic_column for spec in extra],
+        "AM Subscriptions": [spec.subscriptions_column for spec in extra],
+        "SEO Marketing Cost": [spec.cost_column for spec in extra],
+    }
+    return tuple(name for column in MONTHLY_COLUMNS for name in (column, *after.get(column, ())))
+
+
+def _stack_channels(values):
+    # Per-channel arrays -> (..., n_channels, n_months)
+    return np.stack(np.broadcast_arrays(*values), axis=-2)
+
+
+def traffic_columns(a, horizon):
+    """Traffic of every channel; "channel_traffic" holds them as one ``(..., n_channels, n_months)`` tensor."""
+    channel_list = channels(a)
+    initial = _stack_channels([_col(a[f"{spec.key}_traffic_m1"]) for spec in channel_list])
+    growth = _stack_channels([rate_vector(a, f"{spec.key}_traffic_gr", horizon) for spec in channel_list])
+    traffic = _traffic(initial, growth)
+    return {"channel_traffic": traffic, **{spec.traffic_column: traffic[..., row, :] for row, spec in enumerate(channel_list)}}
+
+
+def subscription_columns(a, traffic, horizon):
+    channel_list = channels(a)
+    conversion = _stack_channels([rate_vector(a, f"{spec.key}_cr", horizon) for spec in channel_list])
+    subscriptions = traffic["channel_traffic"] * conversion
+    cols = {"channel_subscriptions": subscriptions}
+    cols.update((spec.subscriptions_column, subscriptions[..., row, :]) for row, spec in enumerate(channel_list))
+    cols["Total Monthly Subscriptions"] = subscriptions.sum(axis=-2)
+    return cols
+
+
+def transaction_columns(a, subscriptions, days_count):
+    """Trial-to-paid conversions and renewals. With ``daily_trials`` set (single
+    scenario only), conversions come from the daily simulation in ``saas_model.daily``.
+    """
+    days_count = np.asarray(days_count, dtype=float)
+    trial_to_paid = _col(a["trial_to_paid"])
+    renewal_rate = 1 - _col(a["churn_rate"])
+
+    cols = {}
+    cols["Cross-Over Month Trial-To-Paid"] = _col(a["free_trial_days"]) / days_count
+    cols["Trial-To-Paid Within Month"] = 1 - cols["Cross-Over Month Trial-To-Paid"]
+
+    # Trials convert within the month they start, except the ones crossing over into the next month
+    subs = subscriptions["Total Monthly Subscriptions"]
+    if a.get("daily_trials"):
+        if subs.ndim != 1:
+            raise ValueError("daily_trials supports a single scenario")
+        horizon = days_count.shape[-1]
+        cols["Trial To Paid Transactions Count"] = daily_trial_to_paid(
+            subscriptions["channel_subscriptions"],
+            np.stack([rate_vector(a, f"{spec.key}_traffic_gr", horizon) for spec in channels(a)]),
+            days_count.astype(np.int64),
+            a["free_trial_days"],
+            a["trial_to_paid"],
+        )
+    else:
+        cols["Trial To Paid Transactions Count"] = (
+            subs * cols["Trial-To-Paid Within Month"] * trial_to_paid
+            + _shift(subs * cols["Cross-Over Month Trial-To-Paid"]) * trial_to_paid
+        )
+
+    # Renewals: (previous new payers + previous renewals) * renewal rate
+    cols["Monthly Renewal Transactions Count"] = linear_recurrence(
+        renewal_rate, _shift(cols["Trial To Paid Transactions Count"]) * renewal_rate
+    )
+    return cols
+
+
+def revenue_columns(a, traffic, transactions):
+    subscription_price = _col(a["subscription_price"])
+    raw_views_per_visit = _col(a["views per visit"])
+    views_per_visit = np.where(raw_views_per_visit == 0, 0.000000001, raw_views_per_visit)
+    cpm = np.where(raw_views_per_visit == 0, 0.0, _col(a["cpm"]))
+
+    cols = {}
+    cols["Website Views"] = traffic["channel_traffic"].sum(axis=-2) * views_per_visit
+    cols["New Monthly Recurring Revenue MRR"] = transactions["Trial To Paid Transactions Count"] * subscription_price
+    cols["Renewal Recurring Revenue MRR"] = transactions["Monthly Renewal Transactions Count"] * subscription_price
+    cols["Ad Network Revenue"] = cols["Website Views"] * (cpm / 1000)
+    cols["Ad Affiliate Revenue"] = cols["Website Views"] * _col(a["am_ctr"]) * _col(a["am_ocr"]) * _col(a["am_cpa"]) / views_per_visit
+    cols["Revenue"] = (
+        cols["Renewal Recurring Revenue MRR"] + cols["New Monthly Recurring Revenue MRR"]
+        + cols["Ad Network Revenue"] + cols["Ad Affiliate Revenue"]
+    )
+    return cols
+
+
+def channel_costs(a, traffic, subscriptions):
+    """Marketing cost of every channel as a ``(..., n_channels, n_months)`` tensor."""
+    channel_list = channels(a)
+    cost_models = np.array([spec.cost_model for spec in channel_list])[:, np.newaxis]
+    unit_costs = _stack_channels([_col(a[spec.cost_key]) for spec in channel_list])
+    # Cost per visit, per subscription, or per month
+    volume = np.where(
+        cost_models == "cpc",
+        traffic["channel_traffic"],
+        np.where(cost_models == "cpa", subscriptions["channel_subscriptions"], 1.0),
+    )
+    return volume * unit_costs
+
+
+def cost_columns(a, traffic, subscriptions, revenue):
+    shape = traffic["SEM - Paid Traffic"].shape
+    marketing = channel_costs(a, traffic, subscriptions)
+    cols = {}
+    cols["Chargebacks"] = revenue["Revenue"] * _col(a["chb_rate"])
+    cols["Refunds"] = revenue["Revenue"] * _col(a["refund_rate"])
+    cols["Income"] = revenue["Revenue"] - cols["Refunds"] - cols["Chargebacks"]
+    cols["Credit Card Processing"] = revenue["Revenue"] * _col(a["ccp_rate"])
+    cols["Web Hosting"] = np.broadcast_to(_col(a["monthly_web_hosting_cost"]), shape)
+    cols["Cost of Goods/Services Sold"] = cols["Credit Card Processing"] + cols["Web Hosting"]
+    cols["Gross Income"] = cols["Income"] - cols["Cost of Goods/Services Sold"]
+    cols["Labor Cost"] = np.broadcast_to(_col(a["monthly_labor_cost"]), shape)
+    cols["am_cpa_month_cost"] = np.broadcast_to(_col(a["affiliate_cpa"]), shape)
+    cols.update((spec.cost_column, marketing[..., row, :]) for row, spec in enumerate(channels(a)))
+    cols["Internet Marketing Cost"] = marketing.sum(axis=-2)
+    cols["Technology & Software"] = np.broadcast_to(_col(a["monthly_techsoft_cost"]), shape)
+    return cols
+
+
+def cash_flow_columns(costs):
+    ebt = costs["Gross Income"] - costs["Labor Cost"] - costs["Internet Marketing Cost"] - costs["Technology & Software"]
+    return {"Earnings Before Taxes": ebt, "Cash Flow Accumulation": np.cumsum(ebt, axis=-1)}
+
+
+def project_months(assumptions, days_count):
+    """Compute the monthly projection columns from the ``form_data`` assumptions.
+
+    Returns a dict mapping the app's column names to arrays over the month axis,
+    in ``monthly_columns`` order. Runs the stages in dependency order; see
+    ``saas_model.stages`` for the memoized version.
+    """
+    a = assumptions
+    horizon = np.shape(days_count)[-1]
+    traffic = traffic_columns(a, horizon)
+    subscriptions = subscription_columns(a, traffic, horizon)
+    transactions = transaction_columns(a, subscriptions, days_count)
+    revenue = revenue_columns(a, traffic, transactions)
+    costs = cost_columns(a, traffic, subscriptions, revenue)
+    cols = {**traffic, **subscriptions, **transactions, **revenue, **costs, **cash_flow_columns(costs)}
+    return {name: cols[name] for name in monthly_columns(channels(a))}
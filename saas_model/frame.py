@@ -0,0 +1,82 @@
+"""Compact projection columns: month-constant columns as scalars, optional float32 storage.
+
+Several projection columns repeat one assumption every month (Web Hosting,
+Labor Cost, ``am_cpa_month_cost``, ...). ``compact`` keeps those as one value
+per scenario and can store the others as float32, which cuts the memory of
+cached results and large batches several-fold; ``expand`` gives back full
+columns, with read-only broadcast views for the constants.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class CompactFrame(NamedTuple):
+    months: np.ndarray  # datetime64[M]
+    columns: dict  # name -> (..., n_months) array, for the columns that change from month to month
+    constants: dict  # name -> value per scenario: a scalar, or an (n_scenarios,) array for a batch
+    names: tuple  # every column name, in the original order
+
+
+def _is_month_constant(values):
+    if values.shape[-1] == 0:
+        return False
+    # Broadcast columns are constant by construction; others are compared with their first month
+    return values.strides[-1] == 0 or bool((values == values[..., :1]).all())
+
+
+def compact(months, columns, dtype=None):
+    """Return the ``CompactFrame`` of ``columns``, each an array over the last (month) axis.
+
+    With ``dtype`` (e.g. ``np.float32``), floating point columns and constants
+    are stored as that type and integer columns (Year, Days Count) as the
+    smallest integer type that holds them.
+    """
+    varying, constants = {}, {}
+    for name, values in columns.items():
+        values = np.asarray(values)
+        store = values.dtype
+        if dtype is not None and values.dtype.kind == "f":
+            store = dtype
+        elif dtype is not None and values.dtype.kind in "iu" and values.size:
+            store = np.result_type(np.min_scalar_type(values.min()), np.min_scalar_type(values.max()))
+        if _is_month_constant(values):
+            constant = values[..., 0].astype(store)
+            constants[name] = constant.item() if constant.ndim == 0 else constant
+        else:
+            varying[name] = cast(values, store)
+    return CompactFrame(np.asarray(months), varying, constants, tuple(columns))
+
+
+def cast(values, dtype):
+    """``values.astype(dtype)`` that keeps broadcast (zero-stride) axes broadcast instead of materializing them."""
+    values = np.asarray(values)
+    if values.dtype == dtype:
+        return values
+    stored = values[tuple(slice(0, 1) if stride == 0 else slice(None) for stride in values.strides)]
+    return np.broadcast_to(stored.astype(dtype), values.shape)
+
+
+def expand(frame):
+    """Return ``{name: (..., n_months) array}`` in the original column order."""
+    n_months = frame.months.shape[-1]
+    columns = {}
+    for name in frame.names:
+        if name in frame.constants:
+            value = np.asarray(frame.constants[name])
+            columns[name] = np.broadcast_to(value[..., np.newaxis], (*value.shape, n_months))
+        else:
+            columns[name] = frame.columns[name]
+    return columns
+
+
+def _held_bytes(array):
+    # Broadcast (zero-stride) axes share their memory
+    return array.itemsize * int(np.prod([size for size, stride in zip(array.shape, array.strides) if stride != 0]))
+
+
+def frame_nbytes(frame):
+    """Bytes held by the frame's arrays."""
+    arrays = [frame.months, *frame.columns.values(), *(np.asarray(value) for value in frame.constants.values())]
+    return sum(_held_bytes(array) for array in arrays)
@@ -0,0 +1,304 @@
+"""Headless entry point: ``project(assumptions) -> Result``."""
+
+from datetime import date
+from typing import NamedTuple
+
+import numpy as np
+
+from .engine import (
+    cash_flow_columns,
+    channels,
+    cost_columns,
+    horizon_months,
+    month_calendar,
+    monthly_columns,
+    revenue_columns,
+    subscription_columns,
+    traffic_columns,
+    transaction_columns,
+)
+from .payback import lifetime_value, payback_months
+from .stages import Stage, StagedModel
+
+# The input form's default values (rates as fractions, like form_data); the
+# kick-off date depends on today, so ``default_assumptions`` adds it per call
+DEFAULT_ASSUMPTIONS = {
+    "horizon_years": 5,
+    "subscription_price": 25.5,
+    "free_trial_days": 7,
+    "daily_trials": False,
+    "trial_to_paid": 0.25,
+    "churn_rate": 0.25,
+    "sem_traffic_m1": 100000,
+    "seo_traffic_m1": 100000,
+    "am_traffic_m1": 10000,
+    **{f"{channel}_traffic_gr_y{year}": 0.02 for channel in ("sem", "seo", "am") for year in range(1, 6)},
+    **{
+        f"{channel}_cr_y{year}": rate
+        for channel in ("sem", "seo", "am")
+        for year, rate in zip(range(1, 6), (0.04, 0.045, 0.05, 0.055, 0.06))
+    },
+    "sem_cpc": 1.0,
+    "affiliate_cpa": 11.0,
+    "monthly_seo_marketing_cost": 300,
+    "ccp_rate": 0.10,
+    "refund_rate": 0.05,
+    "chb_rate": 0.005,
+    "monthly_web_hosting_cost": 300,
+    "monthly_techsoft_cost": 300,
+    "monthly_labor_cost": 10000,
+    "views per visit": 1,
+    "cpm": 0.0,
+    "am_ctr": 0.0,
+    "am_ocr": 0.0,
+    "am_cpa": 0.0,
+}
+
+
+
+def default_kick_off_date():
+    """The form's default kick-off date: January 1st of next year."""
+    return date(date.today().year + 1, 1, 1)
+
+
+def default_assumptions():
+    """``DEFAULT_ASSUMPTIONS`` with the current ``default_kick_off_date``."""
+    return {"kick_off_date": default_kick_off_date(), **DEFAULT_ASSUMPTIONS}
+
+
+# Columns of the annual income statement (summed per calendar year)
+FINANCIAL_COLUMNS = (
+    "Revenue",
+    "Chargebacks",
+    "Refunds",
+    "Income",
+    "Credit Card Processing",
+    "Web Hosting",
+    "Cost of Goods/Services Sold",
+    "Gross Income",
+    "Labor Cost",
+    "SEM Marketing",
+    "Affiliate Marketing",
+    "Internet Marketing Cost",
+    "Technology & Software",
+    "Earnings Before Taxes",
+    "Cash Flow Accumulation",
+)
+
+
+class Result(NamedTuple):
+    assumptions: dict
+    months: np.ndarray  # datetime64[M]
+    columns: dict  # column name -> (n_months,) array, as in the app's monthly DataFrame
+    years: np.ndarray
+    yearly: dict  # FINANCIAL_COLUMNS name -> (n_years,) sums
+    kpis: dict
+    stage_runs: list  # StageRun per stage, in dependency order
+
+
+def calendar_stage(a):
+    months, month_years, days_count = month_calendar(a["kick_off_date"], a["horizon"])
+    return {"months": months, "Year": month_years, "Days Count": days_count}
+
+
+def acquisition_columns(a, calendar, traffic, subscriptions):
+    """Customer acquisition cost, ROI and payback columns."""
+    ltv = float(lifetime_value(a["subscription_price"], a["trial_to_paid"], a["churn_rate"]))
+    affiliate_cpa = a["affiliate_cpa"]
+    cols = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cols["sem_cpa"] = traffic["SEM - Paid Traffic"] * a["sem_cpc"] / subscriptions["SEM Subscriptions"]
+        cols["Internet Marketing CAC Weighted average"] = (
+            subscriptions["SEM Subscriptions"] * cols["sem_cpa"] + subscriptions["AM Subscriptions"] * affiliate_cpa
+        ) / (subscriptions["SEM Subscriptions"] + subscriptions["AM Subscriptions"])
+        cols["sem_roi"] = ltv - cols["sem_cpa"]
+        cols["sem_roi_percent"] = np.where(cols["sem_cpa"] > 0, cols["sem_roi"] / cols["sem_cpa"], np.nan)
+    payback_args = (a["subscription_price"], a["trial_to_paid"], a["churn_rate"], a["free_trial_days"])
+    am_cpa_month_cost = np.broadcast_to(affiliate_cpa, calendar["Days Count"].shape)
+    cols["time_to_recover_AM_cac"] = payback_months(am_cpa_month_cost, *payback_args)
+    cols["time_to_recover_SEM_cac"] = payback_months(cols["sem_cpa"], *payback_args)
+    return cols
+
+
+def kpi_summary(a, calendar, revenue, costs, cash_flow):
+    """Yearly income statement sums and the scalar KPIs."""
+    columns = {**revenue, **costs, **cash_flow}
+    # Months are consecutive, so each calendar year is one contiguous slice
+    years, year_starts = np.unique(calendar["Year"], return_index=True)
+    yearly = {name: np.add.reduceat(columns[name], year_starts) for name in FINANCIAL_COLUMNS}
+
+    ltv = float(lifetime_value(a["subscription_price"], a["trial_to_paid"], a["churn_rate"]))
+    affiliate_cpa = a["affiliate_cpa"]
+    affiliate_roi = ltv - affiliate_cpa
+    cash_flow_accumulation = columns["Cash Flow Accumulation"]
+    kpis = {
+        "renewal_rate": 1 - a["churn_rate"],
+        "ltv": ltv,
+        "affiliate_roi": affiliate_roi,
+        "affiliate_roi_percent": affiliate_roi / affiliate_cpa if affiliate_cpa else np.nan,
+        "total_revenue": float(columns["Revenue"].sum()),
+        "total_ebt": float(columns["Earnings Before Taxes"].sum()),
+        "final_cash_flow_accumulation": float(cash_flow_accumulation[-1]),
+        "break_even_month": float(break_even_month(cash_flow_accumulation)),
+    }
+    return {"years": years, "yearly": yearly, "kpis": kpis}
+
+
+_LTV_INPUTS = ("subscription_price", "trial_to_paid", "churn_rate")
+
+
+def _channel_prefixes(*rates):
+    # Stage.extra_prefixes reading every channel's {key}_{rate} assumptions
+    return lambda a: [f"{spec.key}_{rate}" for spec in channels(a) for rate in rates]
+
+
+# calendar -> traffic -> subscriptions -> transactions -> revenue -> costs -> EBT/cash flow -> KPIs
+STAGES = (
+    Stage("calendar", ("kick_off_date", "horizon"), (), (), calendar_stage),
+    Stage(
+        "traffic",
+        ("extra_channels",),
+        (),
+        ("calendar",),
+        lambda a, calendar: traffic_columns(a, calendar["Days Count"].shape[-1]),
+        _channel_prefixes("traffic_m1", "traffic_gr"),
+    ),
+    Stage(
+        "subscriptions",
+        ("extra_channels",),
+        (),
+        ("calendar", "traffic"),
+        lambda a, calendar, traffic: subscription_columns(a, traffic, calendar["Days Count"].shape[-1]),
+        _channel_prefixes("cr"),
+    ),
+    Stage(
+        "transactions",
+        ("free_trial_days", "trial_to_paid", "churn_rate", "daily_trials", "extra_channels"),
+        (),
+        ("calendar", "subscriptions"),
+        lambda a, calendar, subscriptions: transaction_columns(a, subscriptions, calendar["Days Count"]),
+        # The daily trial simulation spreads trials by traffic growth
+        _channel_prefixes("traffic_gr"),
+    ),
+    Stage(
+        "revenue",
+        ("subscription_price", "views per visit", "cpm", "am_ctr", "am_ocr", "am_cpa"),
+        (),
+        ("traffic", "transactions"),
+        revenue_columns,
+    ),
+    Stage(
+        "costs",
+        (
+            "chb_rate", "refund_rate", "ccp_rate", "monthly_web_hosting_cost", "monthly_labor_cost",
+            "affiliate_cpa", "monthly_techsoft_cost", "extra_channels",
+        ),
+        (),
+        ("traffic", "subscriptions", "revenue"),
+        cost_columns,
+        lambda a: [spec.cost_key for spec in channels(a)],
+    ),
+    Stage("cash_flow", (), (), ("costs",), lambda a, costs: cash_flow_columns(costs)),
+    Stage(
+        "acquisition",
+        (*_LTV_INPUTS, "sem_cpc", "affiliate_cpa", "free_trial_days"),
+        (),
+        ("calendar", "traffic", "subscriptions"),
+        acquisition_columns,
+    ),
+    Stage("kpis", (*_LTV_INPUTS, "affiliate_cpa"), (), ("calendar", "revenue", "costs", "cash_flow"), kpi_summary),
+)
+
+# Shared by every ``project`` call, so an edit only recomputes the stages it affects
+MODEL = StagedModel(STAGES)
+
+
+def project(assumptions, horizon=None):
+    """Project one scenario over ``horizon`` months (default: ``horizon_years`` of the assumptions).
+
+    Keys missing from ``assumptions`` take their form defaults. Growth and
+    conversion rates may be given per year or per month (see ``rate_vector``);
+    periods past the last given rate keep it. Stage outputs are memoized in
+    ``MODEL``; ``Result.stage_runs`` records which stages were reused.
+    """
+    a = {**default_assumptions(), **assumptions}
+    outputs, stage_runs = MODEL.run({**a, "horizon": horizon or horizon_months(a)})
+
+    calendar = outputs["calendar"]
+    monthly = {
+        name: column
+        for stage in ("traffic", "subscriptions", "transactions", "revenue", "costs", "cash_flow")
+        for name, column in outputs[stage].items()
+    }
+    columns = {
+        "Year": calendar["Year"],
+        "Days Count": calendar["Days Count"],
+        **{name: monthly[name] for name in monthly_columns(channels(a))},
+        **outputs["acquisition"],
+    }
+    summary = outputs["kpis"]
+    yearly = dict(summary["yearly"])
+    return Result(a, calendar["months"], columns, summary["years"], yearly, dict(summary["kpis"]), stage_runs)
+
+
+class KeyMetrics(NamedTuple):
+    """The key metrics table as numbers; per-year arrays hold each year's January value.
+
+    Metrics for a channel without traffic (or without a cost) are still
+    computed; ``sem_applicable`` and ``affiliate_applicable`` say whether they
+    mean anything.
+    """
+
+    years: np.ndarray  # calendar years with a January in the projection
+    renewal_rate: float
+    ltv: float
+    sem_cac: np.ndarray
+    sem_roi: np.ndarray
+    sem_roi_percent: np.ndarray
+    sem_payback_months: np.ndarray  # inf when the CAC is never recovered
+    affiliate_cac: float
+    affiliate_roi: float
+    affiliate_roi_percent: float  # NaN when the affiliate CPA is 0
+    affiliate_payback_months: np.ndarray
+    sem_applicable: bool  # SEM traffic with a non-zero cost per click
+    affiliate_applicable: bool  # affiliate traffic
+
+
+def key_metrics(result):
+    """Collect the ``KeyMetrics`` of a ``Result``."""
+    a = result.assumptions
+    columns = result.columns
+    # datetime64[M] counts months from January 1970
+    january = np.flatnonzero(result.months.astype(np.int64) % 12 == 0)
+    kpis = result.kpis
+    return KeyMetrics(
+        years=columns["Year"][january],
+        renewal_rate=float(kpis["renewal_rate"]),
+        ltv=float(kpis["ltv"]),
+        sem_cac=columns["sem_cpa"][january],
+        sem_roi=columns["sem_roi"][january],
+        sem_roi_percent=columns["sem_roi_percent"][january],
+        sem_payback_months=columns["time_to_recover_SEM_cac"][january],
+        affiliate_cac=float(a["affiliate_cpa"]),
+        affiliate_roi=float(kpis["affiliate_roi"]),
+        affiliate_roi_percent=float(kpis["affiliate_roi_percent"]),
+        affiliate_payback_months=columns["time_to_recover_AM_cac"][january],
+        sem_applicable=bool(a["sem_cpc"] != 0 and a["sem_traffic_m1"] != 0),
+        affiliate_applicable=bool(a["am_traffic_m1"] != 0),
+    )
+
+
+def sem_cac_exceeds_ltv(metrics):
+    """Boolean per year of ``metrics.years``: the January SEM CAC is positive and above the LTV."""
+    return metrics.sem_applicable & (metrics.sem_cac > 0) & (metrics.sem_cac > metrics.ltv)
+
+
+def break_even_month(cash_flow):
+    """First month (1-based) from which the accumulated cash flow stays non-negative, along the last axis.
+
+    1 if it is never negative, NaN if it is still negative in the last month.
+    """
+    negative = np.asarray(cash_flow) < 0
+    last_negative = negative.shape[-1] - 1 - np.argmax(negative[..., ::-1], axis=-1)
+    month = np.where(negative.any(axis=-1), last_negative + 2, 1).astype(float)
+    return np.where(negative[..., -1], np.nan, month)
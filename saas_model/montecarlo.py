@@ -0,0 +1,160 @@
+"""Monte Carlo risk simulation over the form_data assumptions.
+
+Runs are split into chunks; each chunk samples its assumptions and projects
+them with one vectorized engine call, and chunks can be fanned out to a
+process pool.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .batch import _engine_keys
+from .bounds import input_bounds
+from .engine import horizon_months, month_calendar, project_months
+from .streaming import PathSpill, SeriesStats
+
+PERCENTILES = (5, 50, 95)
+SIMULATED_SERIES = ("Revenue", "Cash Flow Accumulation")
+
+
+class Distribution(NamedTuple):
+    """Relative uncertainty around a base assumption: sampled as ``value * (1 + noise)``.
+
+    ``kind`` is "normal" or "lognormal" (``spread`` is the standard deviation)
+    or "uniform" or "triangular" (``spread`` is the half-width).
+    """
+
+    kind: str
+    spread: float
+
+
+class MonteCarloResult(NamedTuple):
+    months: np.ndarray
+    n_runs: int
+    percentiles: dict  # series name -> (len(PERCENTILES), n_months) array
+    mean: dict  # series name -> (n_months,) array
+    std: dict
+    prob_negative_cash_flow: np.ndarray  # share of runs with negative Cash Flow Accumulation, per month
+    path_files: Optional[dict] = None  # series name -> .npy file, when raw paths were spilled
+
+
+def sample_multipliers(distribution, size, rng):
+    kind, spread = distribution
+    if kind == "normal":
+        return 1 + spread * rng.standard_normal(size)
+    if kind == "lognormal":
+        return np.exp(spread * rng.standard_normal(size) - spread ** 2 / 2)
+    if kind == "uniform":
+        return 1 + rng.uniform(-spread, spread, size)
+    if kind == "triangular":
+        return 1 + rng.triangular(-spread, 0.0, spread, size) if spread > 0 else np.ones(size)
+    raise ValueError(f"Unknown distribution kind: {kind!r}")
+
+
+def sample_assumptions(base, distributions, size, rng):
+    """Return ``{key: (size,) array}`` with the ``distributions`` keys sampled around ``base``.
+
+    The keys of ``base``'s extra channels are included, and its
+    "extra_channels" is passed through, as ``batch.base_scenarios`` does.
+    """
+    keys, rate_prefixes = _engine_keys(base.get("extra_channels"))
+    assumptions = {"extra_channels": base.get("extra_channels")}
+    for key in keys:
+        if key in distributions:
+            low, high = input_bounds(key)
+            values = base[key] * sample_multipliers(distributions[key], size, rng)
+            assumptions[key] = np.clip(values, low, high)
+        else:
+            assumptions[key] = np.full(size, float(base[key]))
+    # Rates past the form's five years, or given as vectors, are passed through unsampled
+    for key in base:
+        if key.startswith(rate_prefixes) and key not in assumptions:
+            assumptions[key] = np.asarray(base[key], dtype=float)
+    return assumptions
+
+
+def simulate_chunk(base, distributions, size, seed, series=SIMULATED_SERIES):
+    """Sample and project one chunk of runs; returns ``{series: (size, n_months)}``."""
+    rng = np.random.default_rng(seed)
+    _, _, days_count = month_calendar(base["kick_off_date"], horizon_months(base))
+    projection = project_months(sample_assumptions(base, distributions, size, rng), days_count)
+    return {name: projection[name] for name in series}
+
+
+def _chunk_sizes(n_runs, chunk_size):
+    full, rest = divmod(n_runs, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def run_chunks(base, distributions, n_runs, chunk_size=5_000, seed=None, workers=None, series=SIMULATED_SERIES, pool=None):
+    """Yield per-chunk results, using a process pool when ``workers`` > 1.
+
+    Each chunk gets its own child of ``SeedSequence(seed)``, so results are
+    reproducible regardless of the number of workers. At most two chunks per
+    worker are in flight, so finished chunks never pile up in memory. A
+    long-lived ``pool`` (of ``workers`` processes) is used instead of starting
+    one for this call, and is left running.
+    """
+    sizes = _chunk_sizes(n_runs, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = min(workers or os.cpu_count() or 1, len(sizes))
+    if workers <= 1:
+        for size, chunk_seed in zip(sizes, seeds):
+            yield simulate_chunk(base, distributions, size, chunk_seed, series)
+        return
+    if pool is None:
+        with ProcessPoolExecutor(max_workers=workers) as own_pool:
+            yield from _pooled_chunks(own_pool, workers, base, distributions, sizes, seeds, series)
+    else:
+        yield from _pooled_chunks(pool, workers, base, distributions, sizes, seeds, series)
+
+
+def _pooled_chunks(pool, workers, base, distributions, sizes, seeds, series):
+    in_flight = deque()
+    try:
+        for size, chunk_seed in zip(sizes, seeds):
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(simulate_chunk, base, distributions, size, chunk_seed, series))
+        while in_flight:
+            yield in_flight.popleft().result()
+    finally:
+        # A shared pool outlives this call, so leave none of its chunks queued
+        for future in in_flight:
+            future.cancel()
+
+
+def simulate(base, distributions, n_runs=100_000, chunk_size=5_000, seed=None, workers=None, spill_path=None, pool=None):
+    """Run ``n_runs`` simulations and return P5/P50/P95 bands for Revenue and Cash Flow Accumulation.
+
+    Chunks are reduced as they arrive, so peak memory does not depend on
+    ``n_runs``. Pass ``spill_path`` to also keep every raw path in
+    memory-mapped ``.npy`` files named after it, and ``pool`` to run the
+    chunks on an existing process pool (see ``run_chunks``).
+    """
+    months, _, _ = month_calendar(base["kick_off_date"], horizon_months(base))
+    stats = {name: SeriesStats(len(months), seed=seed) for name in SIMULATED_SERIES}
+    spill = PathSpill(spill_path, SIMULATED_SERIES, n_runs, len(months)) if spill_path else None
+    try:
+        for chunk in run_chunks(base, distributions, n_runs, chunk_size, seed, workers, pool=pool):
+            for name in SIMULATED_SERIES:
+                stats[name].update(chunk[name])
+            if spill is not None:
+                spill.write(chunk)
+    finally:
+        if spill is not None:
+            spill.close()
+
+    return MonteCarloResult(
+        months=months,
+        n_runs=n_runs,
+        percentiles={name: stats[name].percentiles(PERCENTILES) for name in SIMULATED_SERIES},
+        mean={name: stats[name].mean for name in SIMULATED_SERIES},
+        std={name: stats[name].std for name in SIMULATED_SERIES},
+        prob_negative_cash_flow=stats["Cash Flow Accumulation"].prob_negative,
+        path_files=spill.paths if spill is not None else None,
+    )
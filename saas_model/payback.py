@@ -0,0 +1,45 @@
+"""CAC payback from the geometric LTV series, in closed form.
+
+A converted trial pays ``subscription_price * trial_to_paid`` in its first
+month and renews with probability ``1 - churn_rate`` every month after, so the
+value accumulated after ``k`` renewals is ``LTV * (1 - r ** (k + 1))``. The
+payback table the app used to build stopped once 99.9% of LTV was reached;
+CACs above that level never pay back.
+"""
+
+import numpy as np
+
+LTV_COVERAGE = 0.999
+
+# Absorbs rounding in the log ratio so exact ties land on the earlier month
+_TIE_TOLERANCE = 1e-9
+
+
+def lifetime_value(subscription_price, trial_to_paid, churn_rate):
+    renewal_rate = 1 - np.asarray(churn_rate, dtype=float)
+    return subscription_price * trial_to_paid / (1 - renewal_rate)
+
+
+def payback_months(cac, subscription_price, trial_to_paid, churn_rate, free_trial_days):
+    """Months until the accumulated LTV of one paying user covers ``cac``.
+
+    All arguments broadcast against each other, so one call covers every
+    month of every scenario. Returns ``inf`` when the CAC is never recovered
+    and ``NaN`` where ``cac`` is NaN.
+    """
+    cac = np.asarray(cac, dtype=float)
+    renewal_rate = 1 - np.asarray(churn_rate, dtype=float)
+    first_value = np.asarray(subscription_price, dtype=float) * trial_to_paid
+    ltv = first_value / (1 - renewal_rate)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_renewal = np.log(renewal_rate)
+        # Smallest k with r ** (k + 1) <= 1 - cac / LTV
+        renewals = np.ceil(np.log1p(-cac / ltv) / log_renewal - 1 - _TIE_TOLERANCE)
+        last_renewal = np.ceil(np.log1p(-LTV_COVERAGE) / log_renewal - 1 - _TIE_TOLERANCE)
+    # The first payment alone covers any CAC up to its own value
+    renewals = np.where(cac <= first_value, 0.0, renewals)
+    last_renewal = np.maximum(last_renewal, 0.0)
+
+    never = (ltv < cac) | (renewals > last_renewal)
+    return np.where(never, np.inf, np.asarray(free_trial_days, dtype=float) / 30 + renewals)
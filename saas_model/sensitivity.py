@@ -0,0 +1,108 @@
+"""Two-way sensitivity grids and tornado swings, each evaluated as one batch.
+
+Every grid point or tornado bar is one scenario of a single ``project_batch``
+call, so a 50 x 50 grid is one (2500, n_months) array computation.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import base_scenarios, project_batch
+from .engine import ASSUMPTION_KEYS, horizon_months
+from .model import break_even_month, default_assumptions
+from .solver import default_bounds
+
+METRICS = ("Total EBT", "Break-even Month", "Final Cash Flow Accumulation")
+
+
+class SensitivityGrid(NamedTuple):
+    x_key: str
+    x_values: np.ndarray
+    y_key: str
+    y_values: np.ndarray
+    metrics: dict  # METRICS name -> (len(y_values), len(x_values)) array
+
+
+class Tornado(NamedTuple):
+    metric: str
+    base_value: float  # metric at the current inputs
+    bars: list  # TornadoBar, widest swing first
+
+
+class TornadoBar(NamedTuple):
+    key: str
+    low_value: float
+    high_value: float
+    low_metric: float
+    high_metric: float
+
+
+def scenario_metrics(projection):
+    """Summary metrics per scenario of a ``project_batch`` result."""
+    cash_flow = projection["Cash Flow Accumulation"]
+    return {
+        "Total EBT": projection["Earnings Before Taxes"].sum(axis=-1),
+        "Break-even Month": break_even_month(cash_flow),
+        "Final Cash Flow Accumulation": cash_flow[..., -1],
+    }
+
+
+def _evaluate(base, overrides, size):
+    columns = base_scenarios(base, size, overrides)
+    projection = project_batch(
+        columns, kick_off_date=base["kick_off_date"], horizon=horizon_months(base), extra_channels=base.get("extra_channels")
+    )
+    return scenario_metrics(projection)
+
+
+def two_way_grid(assumptions, x_key, x_values, y_key, y_values):
+    """Evaluate every combination of ``x_values`` for ``x_key`` and ``y_values`` for ``y_key``."""
+    base = {**default_assumptions(), **assumptions}
+    if x_key == y_key:
+        # The y values would overwrite the x values of every grid point
+        raise ValueError(f"The grid axes must be different inputs, got {x_key!r} twice")
+    for key in (x_key, y_key):
+        if key not in base:
+            raise KeyError(f"No assumption named {key!r}")
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    x_grid, y_grid = np.meshgrid(x_values, y_values)
+    metrics = _evaluate(base, {x_key: x_grid.ravel(), y_key: y_grid.ravel()}, x_grid.size)
+    shape = (len(y_values), len(x_values))
+    return SensitivityGrid(x_key, x_values, y_key, y_values, {name: values.reshape(shape) for name, values in metrics.items()})
+
+
+def tornado(assumptions, keys=None, change=0.1, metric="Total EBT"):
+    """Swing of ``metric`` when each input alone moves by -/+ ``change`` (relative).
+
+    ``keys`` defaults to every numeric assumption with a non-zero value;
+    moved values are kept within the form's valid ranges.
+    """
+    base = {**default_assumptions(), **assumptions}
+    if keys is None:
+        keys = [key for key in ASSUMPTION_KEYS if float(base[key]) != 0]
+    keys = list(keys)
+    # One scenario per moved value, plus the unchanged inputs last
+    size = 2 * len(keys) + 1
+
+    moved = {}
+    for index, key in enumerate(keys):
+        values = np.full(size, float(base[key]))
+        low, high = default_bounds(key, base[key])
+        values[2 * index: 2 * index + 2] = np.clip(float(base[key]) * np.array([1 - change, 1 + change]), low, high)
+        moved[key] = values
+    results = _evaluate(base, moved, size)[metric]
+
+    bars = [
+        TornadoBar(
+            key,
+            float(moved[key][2 * index]),
+            float(moved[key][2 * index + 1]),
+            float(results[2 * index]),
+            float(results[2 * index + 1]),
+        )
+        for index, key in enumerate(keys)
+    ]
+    bars.sort(key=lambda bar: -abs(np.nan_to_num(bar.high_metric - bar.low_metric)))
+    return Tornado(metric, float(results[-1]), bars)
@@ -0,0 +1,383 @@
+"""Local HTTP API: ``python -m saas_model.server --port 8765``.
+
+``POST /project`` takes one assumptions object (``form_data`` keys, rates as
+fractions, missing keys take the form defaults) or ``{"scenarios": [...]}``
+and returns, per scenario, the KPIs, key metrics, yearly income statement and
+monthly columns (``?columns=Revenue,Earnings Before Taxes`` to pick some) as
+JSON, or as an Arrow IPC stream with ``Accept: application/vnd.apache.arrow.stream``
+(or ``?format=arrow``; needs pyarrow). ``GET /health`` and ``GET /metrics``
+(Prometheus text) report the server's state.
+
+Values are checked before any work is queued: numbers must be finite and
+within the input form's ranges (``saas_model.bounds``), ``kick_off_date`` an
+ISO date and the horizon between one month and ``MAX_HORIZON_MONTHS``;
+anything else gets 422. Connections are handled by
+asyncio; projections run in a bounded process pool, which is replaced if a
+worker dies. At most ``max_pending`` projection requests are accepted at once;
+more are refused with 503 and ``Retry-After`` so clients back off. Every response
+carries its latency in ``X-Response-Time-Ms`` and ``Server-Timing`` headers,
+and is logged as a JSON line on the ``saas_model.server`` logger.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from .arrowio import monthly_table
+from .batch import _engine_keys
+from .bounds import input_bounds
+from .cli import kpi_report, monthly_report
+from .engine import horizon_months
+from .model import project
+from .timing import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+ARROW_MIME = "application/vnd.apache.arrow.stream"
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_SCENARIOS = 10_000
+# Longest projection a scenario may ask for, and the most scenario-months per request
+MAX_HORIZON_MONTHS = 50 * 12
+MAX_REQUEST_MONTHS = MAX_SCENARIOS * 60
+# Scenarios per pool task, so a batch is spread over the workers
+CHUNK_SCENARIOS = 64
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    406: "Not Acceptable",
+    411: "Length Required",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def project_scenarios(scenarios, columns=None):
+    """Project each assumptions dict; runs in the pool workers.
+
+    Returns ``[(report, months, columns), ...]``: the JSON-ready ``kpi_report``,
+    the datetime64[M] months and the selected ``{name: monthly array}`` columns.
+    """
+    projected = []
+    for assumptions in scenarios:
+        result = project(assumptions)
+        names = list(result.columns) if columns is None else columns
+        missing = [name for name in names if name not in result.columns]
+        if missing:
+            raise KeyError(f"Unknown columns: {', '.join(missing)}")
+        projected.append((kpi_report(result), result.months, {name: result.columns[name] for name in names}))
+    return projected
+
+
+def _json_body(projected, batched):
+    scenarios = []
+    for report, months, columns in projected:
+        scenarios.append({**report, "monthly": monthly_report(months, columns)})
+    payload = {"scenarios": scenarios} if batched else scenarios[0]
+    return json.dumps(payload).encode(), "application/json"
+
+
+def _arrow_body(projected):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise HTTPError(406, "Arrow output requires pyarrow (pip install pyarrow)")
+    tables = []
+    for scenario, (_, months, columns) in enumerate(projected):
+        table = monthly_table(months, columns)
+        tables.append(table.add_column(0, "scenario", pa.array(np.full(len(months), scenario, dtype=np.int32))))
+    table = pa.concat_tables(tables)
+    # The per-scenario KPIs, key metrics and yearly statements travel as schema metadata
+    table = table.replace_schema_metadata({"reports": json.dumps([report for report, _, _ in projected])})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), ARROW_MIME
+
+
+def parse_scenarios(body):
+    """Return ``(scenarios, batched)`` from a request body."""
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError as error:
+        raise HTTPError(400, f"Invalid JSON: {error}")
+    batched = isinstance(payload, dict) and "scenarios" in payload
+    scenarios = payload["scenarios"] if batched else [payload]
+    if not isinstance(scenarios, list) or not all(isinstance(scenario, dict) for scenario in scenarios):
+        raise HTTPError(400, "Expected an assumptions object or {\"scenarios\": [assumptions objects]}")
+    if not scenarios:
+        raise HTTPError(400, "No scenarios")
+    if len(scenarios) > MAX_SCENARIOS:
+        raise HTTPError(413, f"At most {MAX_SCENARIOS:,} scenarios per request")
+    months = 0
+    for index, scenario in enumerate(scenarios):
+        try:
+            months += check_assumptions(scenario)
+        except (KeyError, ValueError, TypeError) as error:
+            where = f"scenario {index}: " if batched else ""
+            raise HTTPError(422, f"Invalid assumptions: {where}{error}")
+    if months > MAX_REQUEST_MONTHS:
+        raise HTTPError(413, f"At most {MAX_REQUEST_MONTHS:,} scenario-months per request")
+    return scenarios, batched
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value)
+
+
+def _check_range(key, values):
+    low, high = input_bounds(key)
+    for value in values:
+        if not low <= value <= high:
+            limits = f"at least {low:g}" if np.isinf(high) else f"between {low:g} and {high:g}"
+            raise ValueError(f"{key} must be {limits}, got {value!r}")
+
+
+def check_assumptions(assumptions):
+    """Check the values of one assumptions object before it is sent to a worker; returns its horizon in months.
+
+    Raises ValueError (or TypeError) for a non-finite or non-scalar number, a
+    number outside its ``input_bounds``, a rate vector that is not a list of
+    numbers, an unparseable ``kick_off_date`` or a horizon outside
+    1..``MAX_HORIZON_MONTHS`` months.
+    """
+    keys, rate_prefixes = _engine_keys(assumptions.get("extra_channels"))
+    for key, value in assumptions.items():
+        if key == "kick_off_date":
+            try:
+                valid = isinstance(value, str) and not np.isnat(np.datetime64(value, "D"))
+            except ValueError:
+                valid = False
+            if not valid:
+                raise ValueError(f"kick_off_date must be a date such as \"2026-01-01\", got {value!r}")
+        elif key.startswith(rate_prefixes) and key.endswith(("_yearly", "_monthly")):
+            if not isinstance(value, list) or not value or not all(_is_number(v) for v in value):
+                raise ValueError(f"{key} must be a non-empty list of finite numbers")
+            _check_range(key, value)
+        elif key in keys or key == "horizon_years" or key.startswith(rate_prefixes):
+            if not _is_number(value):
+                raise ValueError(f"{key} must be a finite number, got {value!r}")
+            if key != "horizon_years":
+                _check_range(key, [value])
+    try:
+        horizon = horizon_months(assumptions)
+    except OverflowError:
+        # A finite horizon_years too large for a month count
+        horizon = None
+    if horizon is None or horizon > MAX_HORIZON_MONTHS:
+        raise ValueError(f"horizon must be at most {MAX_HORIZON_MONTHS // 12} years")
+    return horizon
+
+
+async def _read_request(reader):
+    # Returns (method, target, headers, body), or None when the client closed the connection
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise HTTPError(411, "Chunked request bodies are not supported; send Content-Length")
+    length = headers.get("content-length") or "0"
+    # Digits only: int() would also take signs, spaces and underscores
+    if not (length.isascii() and length.isdigit()):
+        raise HTTPError(400, f"Invalid Content-Length {length!r}")
+    length = int(length)
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"Request bodies are limited to {MAX_BODY_BYTES:,} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+class ProjectionServer:
+    """Serve projections over HTTP, computing them in a pool of ``workers`` processes."""
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.workers
+        self.pending = 0
+        self.pool = None
+
+    async def project(self, scenarios, columns, pool=None):
+        loop = asyncio.get_running_loop()
+        chunks = [scenarios[start:start + CHUNK_SCENARIOS] for start in range(0, len(scenarios), CHUNK_SCENARIOS)]
+        results = await asyncio.gather(*(
+            loop.run_in_executor(pool or self.pool, project_scenarios, chunk, columns) for chunk in chunks
+        ))
+        return [scenario for chunk in results for scenario in chunk]
+
+    def _restart_pool(self, broken):
+        # Concurrent requests fail on the same broken pool; only the first one replaces it
+        if self.pool is broken:
+            logger.error("Projection worker pool broke; starting a new one")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = ProcessPoolExecutor(self.workers)
+
+    async def respond(self, method, target, headers, body, timings):
+        url = urlsplit(target)
+        if url.path == "/health":
+            status = {"status": "ok", "workers": self.workers, "pending": self.pending, "max_pending": self.max_pending}
+            return 200, json.dumps(status).encode(), "application/json", {}
+        if url.path == "/metrics":
+            return 200, REGISTRY.prometheus_text().encode(), "text/plain; version=0.0.4", {}
+        if url.path != "/project":
+            raise HTTPError(404, f"No route {url.path}")
+        if method != "POST":
+            raise HTTPError(405, "Use POST with an assumptions JSON body")
+
+        query = parse_qs(url.query)
+        columns = [name for value in query.get("columns", []) for name in value.split(",") if name] or None
+        arrow = ARROW_MIME in headers.get("accept", "") or query.get("format") == ["arrow"]
+        scenarios, batched = parse_scenarios(body)
+        # Backpressure: refuse rather than queue without bound
+        if self.pending >= self.max_pending:
+            return 503, b'{"error": "Server busy, retry later"}', "application/json", {"Retry-After": "1"}
+
+        self.pending += 1
+        pool = self.pool
+        started = time.perf_counter()
+        try:
+            projected = await self.project(scenarios, columns, pool)
+        except (KeyError, ValueError, TypeError) as error:
+            raise HTTPError(422, f"Invalid assumptions: {error}")
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); later requests get a fresh pool
+            self._restart_pool(broken=pool)
+            return 503, b'{"error": "Projection worker failed, retry later"}', "application/json", {"Retry-After": "1"}
+        finally:
+            self.pending -= 1
+            timings["compute"] = time.perf_counter() - started
+        timings["scenarios"] = len(scenarios)
+
+        started = time.perf_counter()
+        body, content_type = _arrow_body(projected) if arrow else _json_body(projected, batched)
+        timings["encode"] = time.perf_counter() - started
+        return 200, body, content_type, {}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                started = time.perf_counter()
+                method, target, timings = "-", "-", {}
+                keep_alive = True
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    status, body, content_type, extra = await self.respond(method, target, headers, body, timings)
+                except HTTPError as error:
+                    status, content_type, extra = error.status, "application/json", {}
+                    body = json.dumps({"error": str(error)}).encode()
+                    keep_alive = keep_alive and error.status not in (400, 411, 413)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception:
+                    logger.exception("Error handling %s %s", method, target)
+                    status, content_type, extra = 500, "application/json", {}
+                    body, keep_alive = b'{"error": "Internal server error"}', False
+                seconds = time.perf_counter() - started
+                self._log(method, target, status, seconds, timings)
+                await self._write(writer, status, body, content_type, extra, seconds, timings, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _write(self, writer, status, body, content_type, extra, seconds, timings, keep_alive):
+        server_timing = ", ".join(
+            f"{name};dur={timings[name] * 1000:.3f}" for name in ("compute", "encode") if name in timings
+        )
+        headers = {
+            "Content-Type": content_type,
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            "X-Response-Time-Ms": f"{seconds * 1000:.3f}",
+            **({"Server-Timing": server_timing} if server_timing else {}),
+            **extra,
+        }
+        head = f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+
+    def _log(self, method, target, status, seconds, timings):
+        path = urlsplit(target).path if target != "-" else target
+        REGISTRY.observe(f"api:{method} {path}", seconds)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                "event": "request",
+                "method": method,
+                "path": path,
+                "status": status,
+                "ms": round(seconds * 1000, 3),
+                **{f"{name}_ms": round(value * 1000, 3) for name, value in timings.items() if name != "scenarios"},
+                **({"scenarios": timings["scenarios"]} if "scenarios" in timings else {}),
+            }))
+
+    async def serve(self, host="127.0.0.1", port=8765, ready=None):
+        """Serve until cancelled; ``ready(port)`` is called once listening (port 0 picks a free one)."""
+        self.pool = ProcessPoolExecutor(self.workers)
+        try:
+            server = await asyncio.start_server(self.handle, host, port)
+            async with server:
+                if ready is not None:
+                    ready(server.sockets[0].getsockname()[1])
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="saas_model.server", description="Serve projections as JSON or Arrow over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: localhost only)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="projection processes (default: one per CPU)")
+    parser.add_argument("--max-pending", type=int, help="projection requests accepted at once before answering 503 (default: 4 per worker)")
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s")
+    server = ProjectionServer(args.workers, args.max_pending)
+    # Stop on SIGTERM as on Ctrl+C, so the worker processes are shut down too
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        asyncio.run(server.serve(args.host, args.port, lambda port: print(f"Serving on http://{args.host}:{port}", file=sys.stderr)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
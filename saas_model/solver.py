@@ -0,0 +1,156 @@
+"""Goal seek: find the input value that makes a target metric reach its goal.
+
+A target scores each projected scenario so that the goal is met where the
+score is >= 0. Candidate values are projected together as one batch, the
+grid is narrowed around the sign change, and the search repeats until the
+threshold is pinned down, so a solve costs a handful of batch calls (about
+10 ms). Solves use the monthly engine.
+"""
+
+from fnmatch import fnmatch
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import base_scenarios, project_batch
+from .bounds import input_bounds
+from .engine import horizon_months
+from .model import default_assumptions
+from .payback import lifetime_value
+
+GRID_POINTS = 65
+MAX_ROUNDS = 6
+SCALE_BOUNDS = (0.0, 10.0)
+
+
+class Target(NamedTuple):
+    """``score(projection, assumptions)`` returns one value per scenario; the goal is met where it is >= 0."""
+
+    description: str
+    score: object
+
+
+class Solution(NamedTuple):
+    values: dict  # free variable -> required value
+    scale: float  # multiplier applied to the base values (1.0 for a single variable)
+    met: bool  # False when no value within the bounds meets the target
+    score: float  # target score at the returned values
+    current_score: float  # target score at the current inputs
+    evaluations: int
+
+
+def _check_period(name, value, n_months, months_per_period=1):
+    # Targets are built before the horizon is known, so the upper limit is checked when scoring
+    n_periods = -(-n_months // months_per_period)
+    if not 1 <= value <= n_periods:
+        raise ValueError(f"{name} must be between 1 and {n_periods} for a {n_months}-month horizon, got {value}")
+
+
+def break_even_by(month):
+    """Cash Flow Accumulation non-negative from ``month`` (1-based) to the end of the horizon."""
+    _check_period("month", month, month)
+    def score(projection, assumptions):
+        _check_period("month", month, projection["Cash Flow Accumulation"].shape[-1])
+        return projection["Cash Flow Accumulation"][:, month - 1:].min(axis=1)
+    return Target(f"Cash flow accumulation non-negative from month {month}", score)
+
+
+def year_ebt_at_least(year, amount):
+    """Earnings Before Taxes of projection year ``year`` (1-based) of at least ``amount``."""
+    _check_period("year", year, 12 * year, 12)
+    def score(projection, assumptions):
+        _check_period("year", year, projection["Earnings Before Taxes"].shape[-1], 12)
+        return projection["Earnings Before Taxes"][:, 12 * (year - 1): 12 * year].sum(axis=1) - amount
+    return Target(f"Year {year} EBT of at least {amount:,.2f}", score)
+
+
+def sem_cac_below_ltv(year=None):
+    """SEM CAC at or below LTV in every month, or in every month of ``year`` (1-based)."""
+    if year is not None:
+        _check_period("year", year, 12 * year, 12)
+    def score(projection, assumptions):
+        if year is not None:
+            _check_period("year", year, projection["SEM Marketing"].shape[-1], 12)
+        months = slice(None) if year is None else slice(12 * (year - 1), 12 * year)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sem_cac = projection["SEM Marketing"][:, months] / projection["SEM Subscriptions"][:, months]
+        # Months without SEM subscriptions have no CAC to compare
+        worst = np.where(np.isnan(sem_cac), -np.inf, sem_cac).max(axis=1)
+        ltv = lifetime_value(assumptions["subscription_price"], assumptions["trial_to_paid"], assumptions["churn_rate"])
+        return ltv - worst
+    return Target("SEM CAC at or below LTV" + ("" if year is None else f" in year {year}"), score)
+
+
+def expand_variables(base, patterns):
+    """Resolve variable names and glob patterns such as ``"sem_cr_y*"`` against the assumptions."""
+    keys = []
+    for pattern in patterns:
+        matches = [key for key in base if fnmatch(key, pattern) and key not in keys]
+        if not matches:
+            raise KeyError(f"No assumption matches {pattern!r}")
+        keys.extend(matches)
+    return keys
+
+
+def default_bounds(key, value):
+    """The input's valid range; open-ended ones (amounts, costs) stop at 10x the current value."""
+    low, high = input_bounds(key)
+    if np.isinf(high):
+        high = max(10 * abs(float(value)), low + 1.0)
+    return (low, high)
+
+
+def solve(assumptions, target, variables, bounds=None, tolerance=1e-6):
+    """Return the value(s) of ``variables`` at which ``target`` is just met.
+
+    With one variable, its value is searched within ``bounds`` (default: the
+    form's valid range, or 0 to 10x the current value). With several, they
+    move together: the search is over one multiplier applied to all their
+    current values (``bounds`` then limits the multiplier, 0 to 10 by
+    default), which suits groups such as ``"sem_cr_y*"``. When several values
+    meet the target, the threshold closest to the current input is returned.
+    """
+    base = {**default_assumptions(), **assumptions}
+    keys = expand_variables(base, variables)
+    single = len(keys) == 1
+    start = float(base[keys[0]]) if single else 1.0
+    low, high = bounds or (default_bounds(keys[0], start) if single else SCALE_BOUNDS)
+
+    def values_at(x):
+        if single:
+            return {keys[0]: x}
+        return {key: np.clip(base[key] * x, *default_bounds(key, base[key])) for key in keys}
+
+    horizon = horizon_months(base)
+    evaluations = 0
+
+    def scores(candidates):
+        nonlocal evaluations
+        evaluations += len(candidates)
+        columns = base_scenarios(base, len(candidates), values_at(candidates))
+        projection = project_batch(
+            columns, kick_off_date=base["kick_off_date"], horizon=horizon, extra_channels=base.get("extra_channels")
+        )
+        return target.score(projection, columns)
+
+    grid = np.linspace(low, high, GRID_POINTS)
+    met = scores(grid) >= 0
+    if met.all() or not met.any():
+        # No threshold within the bounds: the target holds everywhere or nowhere
+        x = float(np.clip(start, low, high))
+    else:
+        for _ in range(MAX_ROUNDS):
+            changes = np.flatnonzero(met[1:] != met[:-1])
+            # The crossing nearest the current value
+            nearest = changes[np.argmin(np.abs(grid[changes] - start))]
+            left, right = grid[nearest], grid[nearest + 1]
+            met_side = right if met[nearest + 1] else left
+            if right - left <= tolerance * max(abs(met_side), 1.0):
+                break
+            grid = np.linspace(left, right, GRID_POINTS)
+            met = scores(grid) >= 0
+        x = met_side
+
+    final, current = scores(np.array([x, start]))
+    values = {key: float(np.asarray(value).ravel()[0]) for key, value in values_at(np.array([x])).items()}
+    return Solution(values, 1.0 if single else float(x), bool(final >= 0), float(final), float(current), evaluations)
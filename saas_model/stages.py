@@ -0,0 +1,83 @@
+"""Memoized stage graph: recompute only the stages whose inputs changed.
+
+Each stage reads a subset of the assumptions (exact keys plus any key
+starting with one of its rate prefixes, so ``sem_cr_y1`` .. ``sem_cr_monthly``
+all count) and the outputs of its upstream stages. Its cache key hashes that
+subset together with the upstream keys, so an edit to ``monthly_labor_cost``
+leaves the traffic, subscription and transaction stages' keys unchanged and
+their cached outputs are reused.
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from .cache import LRUCache, assumptions_key
+from .timing import phase
+
+STAGE_CACHE_SIZE = 32
+
+
+class Stage(NamedTuple):
+    name: str
+    inputs: tuple  # assumption keys read by ``compute``
+    prefixes: tuple  # assumption key prefixes read by ``compute`` (rate vectors)
+    upstream: tuple  # names of the stages whose outputs ``compute`` takes, in order
+    compute: object  # compute(assumptions, *upstream_outputs) -> dict
+    extra_prefixes: object = None  # extra_prefixes(assumptions) -> more prefixes read, e.g. for extra channels
+
+
+class StageRun(NamedTuple):
+    name: str
+    reused: bool
+    seconds: float
+
+
+def _freeze(outputs):
+    # Cached outputs are shared between runs, so their arrays must not be modified in place
+    for value in outputs.values():
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+    return outputs
+
+
+class StagedModel:
+    """Run ``stages`` (listed in dependency order) with one LRU cache per stage."""
+
+    def __init__(self, stages, maxsize=STAGE_CACHE_SIZE):
+        self.stages = tuple(stages)
+        self.caches = {stage.name: LRUCache(maxsize) for stage in self.stages}
+
+    def stage_key(self, stage, assumptions, upstream_keys):
+        subset = {key: assumptions.get(key) for key in stage.inputs}
+        prefixes = stage.prefixes + (tuple(stage.extra_prefixes(assumptions)) if stage.extra_prefixes else ())
+        if prefixes:
+            subset.update((key, value) for key, value in assumptions.items() if key.startswith(prefixes))
+        subset["upstream"] = [upstream_keys[name] for name in stage.upstream]
+        return assumptions_key(subset)
+
+    def run(self, assumptions):
+        """Return ``({stage: outputs}, [StageRun])``; outputs come from the cache where the inputs are unchanged."""
+        outputs, keys, runs = {}, {}, []
+        for stage in self.stages:
+            key = self.stage_key(stage, assumptions, keys)
+            cache = self.caches[stage.name]
+            started = time.perf_counter()
+            with phase(f"stage:{stage.name}"):
+                result = cache.get(key)
+                reused = result is not None
+                if not reused:
+                    result = _freeze(stage.compute(assumptions, *(outputs[name] for name in stage.upstream)))
+                    cache.put(key, result)
+            runs.append(StageRun(stage.name, reused, time.perf_counter() - started))
+            keys[stage.name] = key
+            outputs[stage.name] = result
+        return outputs, runs
+
+    def clear(self):
+        for cache in self.caches.values():
+            cache.clear()
+
+    def stats(self):
+        return {name: cache.stats() for name, cache in self.caches.items()}
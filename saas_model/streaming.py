@@ -0,0 +1,130 @@
+"""Streaming reducers for simulation results.
+
+Simulated paths arrive chunk by chunk as ``(n_runs, n_months)`` arrays and are
+reduced on the fly, so memory stays bounded no matter how many runs are made.
+"""
+
+import numpy as np
+
+
+class QuantileSketch:
+    """Mergeable per-month quantile sketch (KLL-style compactor hierarchy).
+
+    Level ``i`` holds rows that each stand for ``2**i`` runs. When a level
+    reaches ``capacity`` rows it is sorted per month and every other row is
+    promoted to the next level, so memory is ``O(capacity * log(n_runs))`` rows.
+    """
+
+    def __init__(self, n_months, capacity=2048, seed=None):
+        self.n_months = n_months
+        self.capacity = capacity
+        self.levels = [np.empty((0, n_months))]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype=float).reshape(-1, self.n_months)])
+        self._compact()
+
+    def merge(self, other):
+        for level, rows in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty((0, self.n_months)))
+            self.levels[level] = np.concatenate([self.levels[level], rows])
+        self._compact()
+
+    def _compact(self):
+        level = 0
+        while level < len(self.levels):
+            rows = self.levels[level]
+            if len(rows) >= self.capacity:
+                # Keep one row behind when the count is odd so no weight is lost
+                keep = len(rows) % 2
+                rows = np.sort(rows, axis=0)
+                promoted = rows[keep + self._rng.integers(2)::2]
+                self.levels[level] = rows[:keep]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty((0, self.n_months)))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, q):
+        """Return a ``(len(q), n_months)`` array of approximate quantiles, ``q`` in [0, 1]."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(rows), 2.0 ** level) for level, rows in enumerate(self.levels)])
+        order = np.argsort(items, axis=0)
+        sorted_items = np.take_along_axis(items, order, axis=0)
+        cumulative = np.cumsum(weights[order], axis=0)
+        targets = np.asarray(q, dtype=float)[:, np.newaxis] * cumulative[-1]
+        idx = np.argmax(cumulative[np.newaxis, :, :] >= targets[:, np.newaxis, :], axis=1)
+        return np.take_along_axis(sorted_items, idx, axis=0)
+
+
+class SeriesStats:
+    """Running count, mean, variance, share of negative values and quantiles per month."""
+
+    def __init__(self, n_months, capacity=2048, seed=None):
+        self.count = 0
+        self.mean = np.zeros(n_months)
+        self._m2 = np.zeros(n_months)
+        self._negatives = np.zeros(n_months)
+        self.sketch = QuantileSketch(n_months, capacity, seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        n = len(values)
+        if n == 0:
+            return
+        # Chan et al. parallel update of the running mean and sum of squared deviations
+        chunk_mean = values.mean(axis=0)
+        chunk_m2 = ((values - chunk_mean) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean = self.mean + delta * n / total
+        self._m2 = self._m2 + chunk_m2 + delta ** 2 * self.count * n / total
+        self.count = total
+        self._negatives += (values < 0).sum(axis=0)
+        self.sketch.update(values)
+
+    @property
+    def variance(self):
+        return self._m2 / max(self.count - 1, 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    @property
+    def prob_negative(self):
+        return self._negatives / max(self.count, 1)
+
+    def percentiles(self, percentiles):
+        return self.sketch.quantiles(np.asarray(percentiles, dtype=float) / 100)
+
+
+class PathSpill:
+    """Write raw simulated paths to a memory-mapped ``.npy`` file, one file per series.
+
+    The files have shape ``(n_runs, n_months)`` and can be reopened later with
+    ``np.load(path, mmap_mode="r")``.
+    """
+
+    def __init__(self, path_prefix, series, n_runs, n_months, dtype=np.float32):
+        self.paths = {name: f"{path_prefix}.{name.lower().replace(' ', '_')}.npy" for name in series}
+        self._arrays = {
+            name: np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n_runs, n_months))
+            for name, path in self.paths.items()
+        }
+        self._offset = 0
+
+    def write(self, chunk):
+        n = None
+        for name, array in self._arrays.items():
+            values = chunk[name]
+            n = len(values)
+            array[self._offset:self._offset + n] = values
+        self._offset += n or 0
+
+    def close(self):
+        for array in self._arrays.values():
+            array.flush()
+        self._arrays = {}
@@ -0,0 +1,209 @@
+"""Lightweight phase timing: per-run breakdowns, JSON log lines and Prometheus text metrics.
+
+Wrap work in ``phase(name)``; every phase is added to the process-wide
+``REGISTRY`` (a histogram per phase name) and, inside ``timed_run``, to that
+run's breakdown. Phases nest, and a ``timed_run`` entered while another is
+active joins it, so a Streamlit script run and its fragments record into one
+run. Finished runs are logged as one JSON line on the ``saas_model.timing``
+logger at INFO level.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, as in Prometheus client defaults but starting at 1 ms
+HISTOGRAM_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_active_run = contextvars.ContextVar("saas_model_timing_run", default=None)
+
+
+class PhaseTiming(NamedTuple):
+    name: str
+    depth: int  # nesting level, 0 for top-level phases
+    start: float  # seconds since the run started
+    seconds: float
+
+
+class RunTimings:
+    """Phase timings of one run, in the order the phases finished."""
+
+    def __init__(self, name):
+        self.name = name
+        self.phases = []
+        self.seconds = 0.0
+        self._started = time.perf_counter()
+        self._depth = 0
+
+    def ordered(self):
+        """Phases in the order they started (parents before their children)."""
+        return sorted(self.phases, key=lambda timing: (timing.start, timing.depth))
+
+    def as_dict(self):
+        return {
+            "event": "timings",
+            "run": self.name,
+            "total_ms": round(self.seconds * 1000, 3),
+            "phases": [
+                {"phase": timing.name, "depth": timing.depth, "ms": round(timing.seconds * 1000, 3)}
+                for timing in self.ordered()
+            ],
+        }
+
+
+class Registry:
+    """Thread-safe run counters and per-phase duration histograms."""
+
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.runs = {}  # run name -> count
+        self.requests = {}  # results request outcome ("cached", "computed", "shared") -> count
+        self.histograms = {}  # phase name -> [bucket counts..., count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, phase_name, seconds):
+        with self._lock:
+            histogram = self.histograms.setdefault(phase_name, [0] * (len(self.buckets) + 1) + [0.0])
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram[index] += 1
+            histogram[-2] += 1
+            histogram[-1] += seconds
+
+    def count_run(self, run_name):
+        with self._lock:
+            self.runs[run_name] = self.runs.get(run_name, 0) + 1
+
+    def count_request(self, outcome):
+        with self._lock:
+            self.requests[outcome] = self.requests.get(outcome, 0) + 1
+
+    def request_counts(self):
+        """A copy of the results request counters, taken under the lock."""
+        with self._lock:
+            return dict(self.requests)
+
+    def clear(self):
+        with self._lock:
+            self.runs.clear()
+            self.requests.clear()
+            self.histograms.clear()
+
+    def prometheus_text(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            runs = dict(self.runs)
+            requests = dict(self.requests)
+            histograms = {name: list(values) for name, values in self.histograms.items()}
+        lines = [
+            "# HELP saas_runs_total Timed runs by kind.",
+            "# TYPE saas_runs_total counter",
+        ]
+        lines += [f'saas_runs_total{{run="{_escape(name)}"}} {count}' for name, count in sorted(runs.items())]
+        lines += [
+            "# HELP saas_results_requests_total Results requests by outcome: cached, computed, or shared with a concurrent computation.",
+            "# TYPE saas_results_requests_total counter",
+        ]
+        lines += [
+            f'saas_results_requests_total{{outcome="{_escape(outcome)}"}} {count}' for outcome, count in sorted(requests.items())
+        ]
+        lines += [
+            "# HELP saas_phase_seconds Time spent in each phase.",
+            "# TYPE saas_phase_seconds histogram",
+        ]
+        for name, values in sorted(histograms.items()):
+            label = f'phase="{_escape(name)}"'
+            for bound, count in zip(self.buckets, values):
+                lines.append(f'saas_phase_seconds_bucket{{{label},le="{bound:g}"}} {count}')
+            lines.append(f'saas_phase_seconds_bucket{{{label},le="+Inf"}} {values[-2]}')
+            lines.append(f"saas_phase_seconds_sum{{{label}}} {values[-1]:.9g}")
+            lines.append(f"saas_phase_seconds_count{{{label}}} {values[-2]}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value):
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Shared by every session served by this process
+REGISTRY = Registry()
+
+
+def current_run():
+    """The ``RunTimings`` being recorded in this context, or None."""
+    return _active_run.get()
+
+
+def record(name, seconds, depth=None, start=None):
+    """Add a phase measured elsewhere (e.g. a model stage) to the registry and the active run."""
+    REGISTRY.observe(name, seconds)
+    run = _active_run.get()
+    if run is not None:
+        now = time.perf_counter() - run._started
+        run.phases.append(PhaseTiming(
+            name,
+            run._depth if depth is None else depth,
+            now - seconds if start is None else start,
+            seconds,
+        ))
+
+
+@contextmanager
+def phase(name):
+    """Time the enclosed block as phase ``name``."""
+    run = _active_run.get()
+    depth = 0
+    if run is not None:
+        depth = run._depth
+        run._depth += 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        if run is not None:
+            run._depth -= 1
+            record(name, seconds, depth=depth, start=started - run._started)
+        else:
+            REGISTRY.observe(name, seconds)
+
+
+@contextmanager
+def timed_run(name, metrics_path=None):
+    """Record the phases of the enclosed block as one run.
+
+    On exit the run is counted, logged as a JSON line and, with
+    ``metrics_path``, the registry is written there in Prometheus text format
+    (for a node exporter textfile collector). Joins the active run if any.
+    """
+    active = _active_run.get()
+    if active is not None:
+        yield active
+        return
+    run = RunTimings(name)
+    token = _active_run.set(run)
+    try:
+        yield run
+    finally:
+        _active_run.reset(token)
+        run.seconds = time.perf_counter() - run._started
+        REGISTRY.count_run(name)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(run.as_dict()))
+        if metrics_path:
+            write_metrics(metrics_path)
+
+
+def write_metrics(path, registry=REGISTRY):
+    """Atomically replace ``path`` with the registry's Prometheus text."""
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary, "w") as f:
+        f.write(registry.prometheus_text())
+    os.replace(temporary, path)
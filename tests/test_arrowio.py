@@ -0,0 +1,82 @@
+"""Arrow IPC and Parquet tables of projections, read back against the projection."""
+
+import json
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from saas_model import default_assumptions, key_metrics, project, project_batch  # noqa: E402
+from saas_model.arrowio import (  # noqa: E402
+    batch_table,
+    column_array,
+    read_table,
+    result_tables,
+    table_bytes,
+    table_format,
+    write_table,
+)
+from saas_model.batch import base_scenarios  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def result():
+    return project({"churn_rate": 0.15})
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_monthly_round_trip(tmp_path, result, suffix):
+    path = str(tmp_path / f"monthly{suffix}")
+    write_table(result_tables(result)["monthly"], path)
+    table = read_table(path)
+    assert table.column_names == ["Month", *[name for name in result.columns if name != "Month"]]
+    # Parquet has no seconds unit and stores them as milliseconds
+    assert pa.types.is_timestamp(table.schema.field("Month").type)
+    np.testing.assert_array_equal(table["Month"].to_numpy().astype("datetime64[M]"), result.months)
+    for name, values in result.columns.items():
+        np.testing.assert_array_equal(table[name].to_numpy(), values, err_msg=name)
+    kpis = json.loads(table.schema.metadata[b"kpis"])
+    assert kpis["ltv"] == pytest.approx(float(result.kpis["ltv"]))
+
+
+def test_payback_stays_numeric(result):
+    tables = result_tables(project({"sem_cpc": 1_000.0}))
+    payback = tables["key_metrics"]["sem_payback_months"].to_numpy()
+    assert tables["key_metrics"].schema.field("sem_payback_months").type == pa.float64()
+    assert np.isinf(payback).all()
+
+
+def test_yearly_and_key_metrics(result):
+    tables = result_tables(result)
+    np.testing.assert_array_equal(tables["yearly"]["Year"].to_numpy(), result.years)
+    np.testing.assert_allclose(tables["yearly"]["Revenue"].to_numpy(), result.yearly["Revenue"])
+    metrics = key_metrics(result)
+    np.testing.assert_array_equal(tables["key_metrics"]["Year"].to_numpy(), metrics.years)
+    assert set(tables["key_metrics"]["ltv"].to_pylist()) == {metrics.ltv}
+
+
+def test_batch_table():
+    scenarios = base_scenarios(default_assumptions(), 3, {"churn_rate": np.array([0.1, 0.2, 0.3])})
+    batch = project_batch(scenarios, kick_off_date=default_assumptions()["kick_off_date"], horizon=12)
+    table = batch_table(batch)
+    assert table.num_rows == 36
+    assert table["scenario"].to_pylist() == [0] * 12 + [1] * 12 + [2] * 12
+    np.testing.assert_array_equal(table["Revenue"].to_numpy(), batch["Revenue"].reshape(-1))
+    # A broadcast constant column is written once per row
+    np.testing.assert_array_equal(table["Labor Cost"].to_numpy(), np.broadcast_to(batch["Labor Cost"], (3, 12)).reshape(-1))
+
+
+def test_in_memory_bytes(result):
+    monthly = result_tables(result)["monthly"]
+    assert pa.ipc.open_file(pa.py_buffer(table_bytes(monthly, "arrow"))).read_all().equals(monthly)
+    assert table_bytes(monthly, "parquet")[:4] == b"PAR1"
+    with pytest.raises(ValueError, match="csv"):
+        table_bytes(monthly, "csv")
+
+
+def test_formats():
+    assert table_format("out.feather") == "arrow" and table_format("out.pq") == "parquet"
+    with pytest.raises(ValueError, match="out.xlsx"):
+        table_format("out.xlsx")
+    assert column_array(np.arange("2026-01", "2026-03", dtype="datetime64[M]")).type == pa.timestamp("s")
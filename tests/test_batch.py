@@ -0,0 +1,69 @@
+"""``project_batch`` against one ``project`` call per scenario."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from saas_model import FINANCIAL_COLUMNS, default_assumptions, project, project_batch, scenario_columns
+from saas_model.batch import base_scenarios
+
+SCENARIOS = [{}, {"churn_rate": 0.1, "subscription_price": 40.0}, {"sem_cpc": 2.0, "trial_to_paid": 0.5, "free_trial_days": 14}]
+
+
+def _scenario_dicts():
+    defaults = default_assumptions()
+    return [{**defaults, **overrides} for overrides in SCENARIOS]
+
+
+def test_batch_matches_project():
+    scenarios = _scenario_dicts()
+    batch = project_batch(scenarios, horizon=60)
+    assert batch["Revenue"].shape == (len(scenarios), 60)
+    for row, assumptions in enumerate(scenarios):
+        result = project(assumptions)
+        for name in FINANCIAL_COLUMNS:
+            np.testing.assert_allclose(batch[name][row], result.columns[name], rtol=1e-12, err_msg=name)
+
+
+def test_input_layouts_agree():
+    scenarios = _scenario_dicts()
+    columns = scenario_columns(scenarios)
+    structured = np.rec.fromarrays(
+        [columns[key] for key in columns if key != "kick_off_date"],
+        names=[key for key in columns if key != "kick_off_date"],
+    )
+    kick_off_date = scenarios[0]["kick_off_date"]
+    expected = project_batch(columns, horizon=24)["Earnings Before Taxes"]
+    np.testing.assert_array_equal(project_batch(structured, kick_off_date=kick_off_date, horizon=24)["Earnings Before Taxes"], expected)
+
+
+def test_kick_off_date_per_scenario():
+    defaults = default_assumptions()
+    kick_off = np.array(["2026-01", "2026-07"], dtype="datetime64[M]")
+    batch = project_batch(base_scenarios(defaults, 2, {"kick_off_date": kick_off}), horizon=12)
+    assert batch["Month"][:, 0].tolist() == [date(2026, 1, 1), date(2026, 7, 1)]
+    assert batch["Year"][1, -1] == 2027
+    single = project({**defaults, "kick_off_date": date(2026, 7, 1)}, horizon=12)
+    np.testing.assert_allclose(batch["Revenue"][1], single.columns["Revenue"], rtol=1e-12)
+
+
+def test_float32_results():
+    batch = project_batch(_scenario_dicts(), horizon=60, dtype=np.float32)
+    full = project_batch(_scenario_dicts(), horizon=60)
+    assert batch["Revenue"].dtype == np.float32
+    np.testing.assert_allclose(batch["Revenue"], full["Revenue"], rtol=1e-6)
+
+
+def test_missing_columns_are_named():
+    scenarios = _scenario_dicts()
+    del scenarios[0]["churn_rate"]
+    with pytest.raises(KeyError, match="churn_rate"):
+        project_batch(scenario_columns([{key: s.get(key, 0) for key in scenarios[0]} for s in scenarios]))
+
+
+def test_kick_off_date_is_required():
+    columns = scenario_columns(_scenario_dicts())
+    del columns["kick_off_date"]
+    with pytest.raises(KeyError, match="kick_off_date"):
+        project_batch(columns)
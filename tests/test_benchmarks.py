@@ -0,0 +1,32 @@
+"""The pipeline benchmark at a tiny size, and its regression check."""
+
+import io
+import json
+
+from benchmarks import pipeline
+
+
+def test_quick_run_and_compare(tmp_path, capsys):
+    output = tmp_path / "benchmark.json"
+    argv = ["-o", str(output), "--horizons", "24", "--scenarios", "1,50", "--repeat", "1"]
+    assert pipeline.main(argv) == 0
+    report = json.loads(output.read_text())
+    stages = {(r["stage"], r["scenarios"]) for r in report["results"]}
+    assert {("recurrences", 1), ("recurrences", 50), ("payback", 50)} <= stages
+    assert all(r["horizon"] == 24 and r["min_s"] >= 0 for r in report["results"])
+    assert "numpy" in json.dumps(report["environment"])
+
+
+def test_compare_flags_slower_stages():
+    baseline = {"results": [
+        {"stage": "payback", "horizon": 60, "scenarios": 1, "min_s": 1.0},
+        {"stage": "calendar", "horizon": 60, "scenarios": 1, "min_s": 1.0},
+    ]}
+    records = [
+        {"stage": "payback", "horizon": 60, "scenarios": 1, "min_s": 1.05},
+        {"stage": "calendar", "horizon": 60, "scenarios": 1, "min_s": 1.5},
+        {"stage": "new_stage", "horizon": 60, "scenarios": 1, "min_s": 9.0},
+    ]
+    out = io.StringIO()
+    assert pipeline.compare(records, baseline, tolerance=0.1, out=out) == [records[1]]
+    assert "REGRESSION" in out.getvalue() and "new_stage" not in out.getvalue()
@@ -0,0 +1,102 @@
+"""Bulk projection of scenario files: CSV and Parquet round trips against ``project``."""
+
+import csv
+
+import numpy as np
+import pytest
+
+from saas_model import FINANCIAL_COLUMNS, project
+from saas_model.bulk import main, project_file, read_scenarios
+
+SCENARIOS = [
+    {"id": "low", "churn_rate": 0.1, "subscription_price": 20.0, "kick_off_date": "2026-01-01"},
+    {"id": "mid", "churn_rate": 0.2, "subscription_price": 30.0, "kick_off_date": "2026-07-01"},
+    {"id": "high", "churn_rate": 0.3, "subscription_price": 45.0, "kick_off_date": "2026-01-01"},
+]
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def _read_table(path):
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        return {name: np.asarray(values) for name, values in pq.read_table(path).to_pydict().items()}
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    return {name: np.array([row[name] for row in rows]) for name in rows[0]}
+
+
+def _expected_yearly(scenario):
+    result = project({key: value for key, value in scenario.items() if key != "id"})
+    years = result.columns["Year"]
+    return {
+        name: np.array([result.columns[name][years == year].sum() for year in np.unique(years)])
+        for name in FINANCIAL_COLUMNS
+    }
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_yearly_round_trip(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    source = _write_csv(tmp_path / "scenarios.csv", SCENARIOS)
+    output = str(tmp_path / f"yearly{suffix}")
+    stats = project_file(source, output, chunk_rows=2, id_column="id")
+    assert (stats.rows, stats.output_rows, stats.ignored) == (3, 16, ())
+    table = _read_table(output)
+    assert table["scenario"].astype(str).tolist() == ["low"] * 5 + ["mid"] * 6 + ["high"] * 5
+    for scenario in SCENARIOS:
+        rows = table["scenario"].astype(str) == scenario["id"]
+        for name, values in _expected_yearly(scenario).items():
+            np.testing.assert_allclose(table[name][rows].astype(float), values, rtol=1e-12, err_msg=name)
+
+
+def test_parquet_input(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    source = str(tmp_path / "scenarios.parquet")
+    pq.write_table(pa.table({"churn_rate": [0.1, 0.25], "Monthly Labor Cost": [5_000, 20_000]}), source)
+    chunks = list(read_scenarios(source, chunk_rows=1))
+    assert [chunk["churn_rate"].tolist() for chunk in chunks] == [[0.1], [0.25]]
+    output = str(tmp_path / "monthly.csv")
+    project_file(source, output, output="monthly", columns=["Labor Cost", "Revenue"])
+    table = _read_table(output)
+    assert list(table) == ["scenario", "Month", "Labor Cost", "Revenue"]
+    np.testing.assert_array_equal(table["Labor Cost"].astype(float), np.repeat([5_000.0, 20_000.0], 60))
+    expected = project({"churn_rate": 0.25, "monthly_labor_cost": 20_000}).columns["Revenue"]
+    np.testing.assert_allclose(table["Revenue"][60:].astype(float), expected, rtol=1e-12)
+
+
+def test_empty_cells_are_missing_values(tmp_path):
+    rows = [{"churn_rate": "0.1", "note": "x"}, {"churn_rate": "0.2", "note": ""}, {"churn_rate": "", "note": "y"}]
+    source = _write_csv(tmp_path / "scenarios.csv", rows)
+    chunk = next(read_scenarios(source))
+    np.testing.assert_array_equal(chunk["churn_rate"], [0.1, 0.2, np.nan])
+    assert chunk["note"].tolist() == ["x", "", "y"]
+    with pytest.raises(ValueError, match="'churn_rate' has no value in row 3"):
+        project_file(source, str(tmp_path / "out.csv"), chunk_rows=2)
+
+
+def test_empty_cells_in_ignored_columns(tmp_path):
+    source = _write_csv(tmp_path / "scenarios.csv", [{"churn_rate": "0.1", "score": "1"}, {"churn_rate": "0.2", "score": ""}])
+    stats = project_file(source, str(tmp_path / "out.csv"))
+    assert stats.ignored == ("score",)
+
+
+def test_float32_output(tmp_path, capsys):
+    source = _write_csv(tmp_path / "scenarios.csv", SCENARIOS[:1])
+    output = str(tmp_path / "monthly.csv")
+    assert main([source, "-o", output, "--monthly", "--float32", "--columns", "Revenue", "--id-column", "id", "--quiet"]) == 0
+    assert "1 scenarios -> 60 rows" in capsys.readouterr().out
+    revenue = _read_table(output)["Revenue"]
+    expected = project({key: value for key, value in SCENARIOS[0].items() if key != "id"}).columns["Revenue"]
+    # Computed in float64, written as float32 values
+    np.testing.assert_array_equal(revenue.astype(np.float32), expected.astype(np.float32))
@@ -0,0 +1,118 @@
+"""Result cache keys, ``LRUCache`` and ``SingleFlight``, including under concurrent threads."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import numpy as np
+import pytest
+
+from saas_model.cache import LRUCache, SingleFlight, assumptions_key
+
+THREADS = 16
+
+
+def test_assumptions_key_ignores_number_types():
+    a = {"kick_off_date": date(2026, 1, 1), "subscription_price": 25, "sem_cr_yearly": np.array([0.04, 0.05])}
+    b = {"subscription_price": np.float64(25.0), "sem_cr_yearly": [0.04, 0.05], "kick_off_date": date(2026, 1, 1)}
+    assert assumptions_key(a) == assumptions_key(b)
+    assert assumptions_key(a) != assumptions_key({**a, "subscription_price": 26})
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_under_threads():
+    cache = LRUCache(maxsize=50)
+    rounds = 2_000
+
+    def worker(seed):
+        rng = np.random.default_rng(seed)
+        for key in rng.integers(0, 100, rounds).tolist():
+            value = cache.get_or_compute(key, lambda: key * 2)
+            assert value == key * 2
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(worker, range(THREADS)))
+
+    stats = cache.stats()
+    assert stats["size"] == len(cache) <= 50
+    assert stats["hits"] + stats["misses"] == THREADS * rounds
+    # Two threads can miss the same key at once; both store it, in one entry
+    assert stats["misses"] - stats["evictions"] >= stats["size"]
+
+
+@pytest.mark.parametrize("maxsize", [1, 8])
+def test_lru_clear(maxsize):
+    cache = LRUCache(maxsize)
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0 and cache.get("a") is None
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("condition not reached")
+        time.sleep(0.001)
+
+
+def test_single_flight_computes_once():
+    flight = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(threading.get_ident())
+        # Hold the computation until every other caller is waiting on it
+        _wait_for(lambda: flight.shared == THREADS - 1)
+        return object()
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(lambda _: flight.do("key", compute), range(THREADS)))
+
+    assert len(calls) == 1
+    assert len({id(value) for value, _ in results}) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * (THREADS - 1)
+    assert flight.stats() == {"in_flight": 0, "computed": 1, "shared": THREADS - 1, "shared_rate": (THREADS - 1) / THREADS}
+
+
+def test_single_flight_shares_errors_and_retries():
+    flight = SingleFlight()
+
+    def compute():
+        _wait_for(lambda: flight.shared == THREADS - 1)
+        raise RuntimeError("boom")
+
+    def call(_):
+        try:
+            flight.do("key", compute)
+        except RuntimeError as error:
+            return str(error)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        assert list(pool.map(call, range(THREADS))) == ["boom"] * THREADS
+    # A failed computation is not remembered: the next call computes again
+    assert flight.do("key", lambda: 42) == (42, False)
+
+
+def test_single_flight_keys_are_independent():
+    flight = SingleFlight()
+    barrier = threading.Barrier(4)
+
+    def compute(key):
+        barrier.wait(timeout=5)
+        return key
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda key: flight.do(key, lambda: compute(key)), range(4)))
+    assert results == [(key, False) for key in range(4)]
+    assert flight.computed == 4
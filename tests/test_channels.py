@@ -0,0 +1,55 @@
+"""Extra acquisition channels along the channel axis, against the form's SEM channel."""
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, project
+from saas_model.engine import channel, channels, monthly_columns
+
+
+def _sem_clone(key="paid"):
+    # A cost-per-click channel with SEM's traffic, growth, conversion and cost
+    a = default_assumptions()
+    extra = {f"{key}_traffic_m1": a["sem_traffic_m1"], f"{key}_cpc": a["sem_cpc"]}
+    for year in range(1, 6):
+        extra[f"{key}_traffic_gr_y{year}"] = a[f"sem_traffic_gr_y{year}"]
+        extra[f"{key}_cr_y{year}"] = a[f"sem_cr_y{year}"]
+    return {"extra_channels": [{"key": key, "cost_model": "cpc"}], **extra}
+
+
+def test_clone_matches_sem():
+    base = project({}).columns
+    columns = project(_sem_clone()).columns
+    for ours, sem in (("PAID Traffic", "SEM - Paid Traffic"), ("PAID Subscriptions", "SEM Subscriptions"), ("PAID Marketing", "SEM Marketing")):
+        np.testing.assert_allclose(columns[ours], base[sem], rtol=1e-12, err_msg=ours)
+    np.testing.assert_allclose(columns["Total Monthly Subscriptions"], base["Total Monthly Subscriptions"] + base["SEM Subscriptions"], rtol=1e-12)
+    np.testing.assert_allclose(columns["Internet Marketing Cost"], base["Internet Marketing Cost"] + base["SEM Marketing"], rtol=1e-12)
+
+
+def test_moving_sem_to_a_channel_keeps_the_totals():
+    base = project({}).columns
+    moved = project({**_sem_clone(), "sem_traffic_m1": 0}).columns
+    for name in ("Total Monthly Subscriptions", "Revenue", "Internet Marketing Cost", "Cash Flow Accumulation"):
+        np.testing.assert_allclose(moved[name], base[name], rtol=1e-9, err_msg=name)
+
+
+def test_cost_models():
+    a = {
+        "extra_channels": [{"key": "social", "cost_model": "fixed"}, {"key": "partner", "cost_model": "cpa", "name": "Partners"}],
+        "social_traffic_m1": 1000, "social_traffic_gr_y1": 0.0, "social_cr_y1": 0.0, "social_fixed": 750,
+        "partner_traffic_m1": 2000, "partner_traffic_gr_y1": 0.01, "partner_cr_y1": 0.05, "partner_cpa": 12.0,
+    }
+    columns = project(a).columns
+    np.testing.assert_array_equal(columns["SOCIAL Marketing"], 750)
+    np.testing.assert_allclose(columns["Partners Marketing"], columns["Partners Subscriptions"] * 12.0)
+    # Later years keep the Year 1 rates
+    np.testing.assert_array_equal(columns["SOCIAL Traffic"], 1000)
+    np.testing.assert_array_equal(columns["SOCIAL Subscriptions"], 0)
+    names = monthly_columns(channels(a))
+    assert names.index("SOCIAL Traffic") == names.index("AM - Paid Traffic") + 1
+    assert names.index("Partners Marketing") == names.index("SEO Marketing Cost") + 2
+
+
+def test_unknown_cost_model():
+    with pytest.raises(ValueError, match="cpm"):
+        channel("display", "cpm")
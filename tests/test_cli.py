@@ -0,0 +1,54 @@
+"""The headless ``python -m saas_model`` command line."""
+
+import csv
+import io
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from saas_model import DEFAULT_ASSUMPTIONS, default_assumptions, default_kick_off_date, project
+from saas_model.cli import main, print_report
+
+
+@pytest.fixture
+def assumptions_file(tmp_path):
+    path = tmp_path / "assumptions.json"
+    path.write_text(json.dumps({"subscription_price": 30, "horizon_years": 2}))
+    return str(path)
+
+
+def test_json_report(assumptions_file, capsys):
+    assert main([assumptions_file, "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    expected = project({"subscription_price": 30, "horizon_years": 2})
+    assert report["kpis"]["total_revenue"] == pytest.approx(expected.kpis["total_revenue"])
+    assert report["yearly"]["Year"] == expected.years.tolist()
+    assert len(report["key_metrics"]["years"]) == 2
+
+
+def test_text_report():
+    out = io.StringIO()
+    print_report(project({"horizon_years": 2}), out)
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith("renewal_rate")
+    assert any(line.startswith("Earnings Before Taxes") for line in lines)
+
+
+def test_monthly_csv(assumptions_file, tmp_path, capsys):
+    output = tmp_path / "monthly.csv"
+    main([assumptions_file, "-o", str(output)])
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    expected = project({"subscription_price": 30, "horizon_years": 2})
+    assert len(rows) == 24
+    assert rows[0]["Month"] == str(expected.months[0])
+    np.testing.assert_allclose([float(row["Revenue"]) for row in rows], expected.columns["Revenue"])
+
+
+def test_default_kick_off_date_is_next_january():
+    assert default_kick_off_date() == date(date.today().year + 1, 1, 1)
+    assert default_assumptions()["kick_off_date"] == default_kick_off_date()
+    assert "kick_off_date" not in DEFAULT_ASSUMPTIONS
+    assert project({}).months[0] == np.datetime64(default_kick_off_date(), "M")
@@ -0,0 +1,57 @@
+"""Cohort matrices against the engine's calendar-month columns."""
+
+import numpy as np
+import pytest
+
+from saas_model import build_cohorts, calendar_totals, headline_series, project
+from saas_model.cohorts import COHORT_TOLERANCE, cohort_payback, cohort_retention, cohort_window
+
+FLAT_GROWTH = {f"{channel}_traffic_gr_y{year}": 0.0 for channel in ("sem", "seo", "am") for year in range(1, 6)}
+CASES = [
+    {},
+    {"churn_rate": 0.05, "free_trial_days": 14},
+    {"horizon_years": 50, **FLAT_GROWTH},
+    {"extra_channels": [{"key": "social", "cost_model": "fixed"}], "social_traffic_m1": 4000, "social_traffic_gr_y1": 0.01, "social_cr_y1": 0.03, "social_fixed": 500},
+]
+
+
+@pytest.mark.parametrize("assumptions", CASES)
+def test_totals_match_engine(assumptions):
+    cohorts = build_cohorts(assumptions)
+    columns = project(assumptions).columns
+    for name, values in headline_series(cohorts).items():
+        np.testing.assert_allclose(values, columns[name], rtol=1e-9, atol=COHORT_TOLERANCE, err_msg=name)
+
+
+def test_window_does_not_grow_with_the_horizon():
+    short = build_cohorts({"horizon_years": 20, **FLAT_GROWTH})
+    long = build_cohorts({"horizon_years": 50, **FLAT_GROWTH})
+    assert short.renewals.shape[-1] == long.renewals.shape[-1] < 100
+    assert long.renewals.shape == (3, 600, long.renewals.shape[-1])
+
+
+def test_window_bound():
+    renewal_rate, peak_value = 0.75, 1e5
+    window = cohort_window(renewal_rate, 10_000, peak_value)
+    dropped = peak_value * renewal_rate ** np.arange(window - 1, 10_000)
+    assert dropped.sum() <= COHORT_TOLERANCE < (peak_value * renewal_rate ** np.arange(window - 2, 10_000)).sum()
+    assert cohort_window(1.0, 24, peak_value) == 24
+    assert cohort_window(0.0, 24, peak_value) == 2
+    assert cohort_window(0.99, 24, peak_value) == 24
+
+
+def test_calendar_totals():
+    band = np.arange(12, dtype=float).reshape(4, 3)
+    # total[t] adds band[c, age] for c + age == t
+    assert calendar_totals(band).tolist() == [0, 1 + 3, 2 + 4 + 6, 5 + 7 + 9]
+
+
+def test_retention_and_payback():
+    cohorts = build_cohorts({"churn_rate": 0.2, "horizon_years": 2})
+    retention = cohort_retention(cohorts)
+    assert np.all(np.diff(retention[:, 2:], axis=-1) <= 1e-12)
+    np.testing.assert_allclose(retention[:, 3] / retention[:, 2], 0.8)
+    payback = cohort_payback(cohorts)
+    assert payback.shape == (3, 24)
+    # SEO has no acquisition cost, so every cohort pays back in its first month
+    assert np.all(payback[cohorts.channels.index("seo")] == 0)
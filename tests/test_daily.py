@@ -0,0 +1,64 @@
+"""Daily free-trial simulation against the monthly within/cross-over split."""
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, month_calendar, project, project_months
+from saas_model.daily import daily_trial_to_paid, daily_trials, day_calendar, trial_conversions
+
+FLAT_GROWTH = {f"{channel}_traffic_gr_y{year}": 0.0 for channel in ("sem", "seo", "am") for year in range(1, 6)}
+
+
+def test_day_calendar():
+    month_index, day_in_month = day_calendar([3, 2])
+    assert month_index.tolist() == [0, 0, 0, 1, 1]
+    assert day_in_month.tolist() == [0, 1, 2, 0, 1]
+
+
+def test_trials_keep_month_totals():
+    _, _, days_count = month_calendar(np.datetime64("2028-01"), 12)
+    subscriptions = np.array([np.linspace(100, 200, 12), np.full(12, 50.0)])
+    growth = np.array([np.full(12, 0.3), np.zeros(12)])
+    trials = daily_trials(subscriptions, growth, days_count)
+    month_index, _ = day_calendar(days_count)
+    np.testing.assert_allclose(np.bincount(month_index, weights=trials), subscriptions.sum(axis=0))
+    # Growing traffic puts more of January's trials near its end
+    assert trials[30] > trials[0]
+
+
+def test_conversions_land_after_the_trial():
+    conversions = trial_conversions(np.array([10.0, 0, 0, 0, 0]), 3, 0.5)
+    assert conversions.tolist() == [0, 0, 0, 5, 0]
+
+
+def test_flat_traffic_matches_monthly_split():
+    # Evenly spread trial starts are exactly what the monthly within/cross-over shares assume
+    assumptions = {**FLAT_GROWTH, "free_trial_days": 10}
+    monthly = project(assumptions).columns
+    daily = project({**assumptions, "daily_trials": True}).columns
+    for name in ("Trial To Paid Transactions Count", "Monthly Renewal Transactions Count", "Revenue"):
+        np.testing.assert_allclose(daily[name], monthly[name], rtol=1e-10, err_msg=name)
+
+
+def test_growth_moves_conversions_later():
+    assumptions = {"sem_traffic_gr_y1": 0.5, "free_trial_days": 14, "horizon_years": 1}
+    monthly = project(assumptions).columns["Trial To Paid Transactions Count"]
+    daily = project({**assumptions, "daily_trials": True}).columns["Trial To Paid Transactions Count"]
+    # More trials start late in each month, so more of them convert in the next one
+    assert daily[0] < monthly[0]
+    assert daily.sum() == pytest.approx(monthly.sum(), rel=0.05)
+
+
+def test_daily_counts_without_growth():
+    _, _, days_count = month_calendar(np.datetime64("2027-01"), 2)
+    counts = daily_trial_to_paid(np.array([310.0, 280.0]), np.zeros(2), days_count, 7, 1.0)
+    # 24 of January's 31 days of trials convert in January, the other 7 in February
+    np.testing.assert_allclose(counts, [240.0, 70.0 + 210.0])
+
+
+def test_batches_are_rejected():
+    defaults = default_assumptions()
+    _, _, days_count = month_calendar(defaults["kick_off_date"], 12)
+    scenarios = {key: np.full(2, float(value)) for key, value in defaults.items() if key != "kick_off_date"}
+    with pytest.raises(ValueError, match="single scenario"):
+        project_months({**scenarios, "daily_trials": True}, days_count)
@@ -0,0 +1,118 @@
+"""The SQLite ``DiskCache``: expiry, size eviction and concurrent writers."""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import results
+from saas_model import default_assumptions, diskcache
+from saas_model.diskcache import DiskCache, pack_columns, unpack_columns
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(diskcache.time, "time", clock)
+    return clock
+
+
+def test_columns_round_trip():
+    columns = {"Month": np.arange("2026-01", "2027-01", dtype="datetime64[M]"), "Revenue": np.linspace(0, 1, 12)}
+    unpacked = unpack_columns(pack_columns(columns))
+    assert unpacked.keys() == columns.keys()
+    for name in columns:
+        np.testing.assert_array_equal(unpacked[name], columns[name])
+        assert unpacked[name].dtype == columns[name].dtype
+
+
+def test_entries_expire(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), ttl_seconds=60)
+    cache.put("a", b"value")
+    clock.now += 59
+    assert cache.get("a") == b"value"
+    clock.now += 2
+    assert cache.get("a") is None
+    # Expired rows are removed on the next write
+    cache.put("b", b"other")
+    assert cache.stats()["entries"] == 1
+
+
+def test_least_recently_used_are_evicted(tmp_path, clock):
+    cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=300)
+    for key in "abc":
+        clock.now += 1
+        cache.put(key, bytes(100))
+    clock.now += 1
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    clock.now += 1
+    cache.put("d", bytes(100))
+    assert [cache.get(key) is not None for key in "abcd"] == [True, False, True, True]
+    assert cache.stats()["bytes"] <= 300
+
+
+def test_replacing_a_key_keeps_one_entry(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.put("a", b"1")
+    cache.put("a", b"22")
+    assert cache.get("a") == b"22"
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"]) == (1, 2)
+
+
+def _write_entries(path, worker, count=25):
+    cache = DiskCache(path)
+    for i in range(count):
+        cache.put(f"{worker}-{i}", bytes([worker]) * 64)
+        assert cache.get(f"{worker}-{i}") == bytes([worker]) * 64
+    return count
+
+
+def test_concurrent_writers(tmp_path):
+    path = str(tmp_path / "cache.db")
+    DiskCache(path)
+    with ProcessPoolExecutor(4, mp_context=multiprocessing.get_context("spawn")) as pool:
+        written = sum(pool.map(_write_entries, [path] * 4, range(4)))
+    with ThreadPoolExecutor(4) as pool:
+        written += sum(pool.map(_write_entries, [path] * 4, range(4, 8)))
+    cache = DiskCache(path)
+    assert cache.stats()["entries"] == written == 200
+    assert cache.get("6-24") == bytes([6]) * 64
+
+
+@pytest.fixture
+def reset_disk_cache(monkeypatch):
+    monkeypatch.setattr(results, "_disk_cache", None)
+    monkeypatch.setattr(results, "_disk_cache_opened", False)
+    monkeypatch.setattr(results, "RESULTS_CACHE", results.LRUCache())
+
+
+def test_unusable_path_disables_the_cache(tmp_path, monkeypatch, reset_disk_cache, caplog):
+    monkeypatch.setenv("SAAS_CACHE_PATH", str(tmp_path / "missing" / "cache.db"))
+    with caplog.at_level(logging.WARNING, logger="results"):
+        assert results.disk_cache() is None
+    assert "disabled" in caplog.text
+    assert results.get_results(default_assumptions()).df is not None
+
+
+def test_disk_hits_have_no_stage_runs(tmp_path, monkeypatch, reset_disk_cache):
+    monkeypatch.setenv("SAAS_CACHE_PATH", str(tmp_path / "cache.db"))
+    form_data = {**default_assumptions(), "monthly_labor_cost": 12_345}
+    computed = results.get_results(form_data)
+    assert computed.stage_runs
+    # Another process: its memory cache is empty, the disk cache has the entry
+    monkeypatch.setattr(results, "RESULTS_CACHE", results.LRUCache())
+    loaded = results.get_results(form_data)
+    assert loaded is not computed
+    assert loaded.stage_runs == []
+    np.testing.assert_array_equal(loaded.df["Revenue"], computed.df["Revenue"])
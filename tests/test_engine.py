@@ -0,0 +1,106 @@
+"""``project`` against the row-by-row loops the app used before the NumPy engine."""
+
+import calendar
+from datetime import date
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, linear_recurrence, project
+
+
+def loop_projection(a):
+    """The original app's 60-month projection, one month at a time (rates per projection year)."""
+
+    def yearly(prefix, month):
+        return a[f"{prefix}_y{min(month // 12, 4) + 1}"]
+
+    kick_off = a["kick_off_date"]
+    months = [date(kick_off.year + (kick_off.month - 1 + i) // 12, (kick_off.month - 1 + i) % 12 + 1, 1) for i in range(60)]
+    days = [calendar.monthrange(month.year, month.month)[1] for month in months]
+    crossover = [a["free_trial_days"] / d for d in days]
+    within = [1 - c for c in crossover]
+
+    traffic = {}
+    for channel, first in (("sem", "sem_traffic_m1"), ("seo", "seo_traffic_m1"), ("am", "am_traffic_m1")):
+        values = [float(a[first])]
+        for i in range(1, 60):
+            values.append(values[i - 1] * (1 + yearly(f"{channel}_traffic_gr", i)))
+        traffic[channel] = values
+    subs = {channel: [traffic[channel][i] * yearly(f"{channel}_cr", i) for i in range(60)] for channel in traffic}
+    total_subs = [subs["sem"][i] + subs["seo"][i] + subs["am"][i] for i in range(60)]
+    views = [(traffic["sem"][i] + traffic["seo"][i] + traffic["am"][i]) * a["views per visit"] for i in range(60)]
+
+    trial_to_paid = [total_subs[0] * within[0] * a["trial_to_paid"]]
+    for i in range(1, 60):
+        trial_to_paid.append(
+            total_subs[i] * within[i] * a["trial_to_paid"] + total_subs[i - 1] * crossover[i - 1] * a["trial_to_paid"]
+        )
+    renewals = [0.0]
+    for i in range(1, 60):
+        renewals.append((trial_to_paid[i - 1] + renewals[i - 1]) * (1 - a["churn_rate"]))
+
+    columns = {"SEM - Paid Traffic": traffic["sem"], "SEO - Organic Traffic": traffic["seo"], "AM - Paid Traffic": traffic["am"]}
+    columns.update({"SEM Subscriptions": subs["sem"], "AM Subscriptions": subs["am"], "Total Monthly Subscriptions": total_subs})
+    columns["Trial To Paid Transactions Count"] = trial_to_paid
+    columns["Monthly Renewal Transactions Count"] = renewals
+    revenue = []
+    for i in range(60):
+        ad_network = views[i] * a["cpm"] / 1000 if a["views per visit"] > 0 else 0
+        ad_affiliate = views[i] * a["am_ctr"] * a["am_ocr"] * a["am_cpa"] / a["views per visit"]
+        revenue.append((renewals[i] + trial_to_paid[i]) * a["subscription_price"] + ad_network + ad_affiliate)
+    columns["Revenue"] = revenue
+    ebt = []
+    for i in range(60):
+        income = revenue[i] * (1 - a["refund_rate"] - a["chb_rate"])
+        cogs = revenue[i] * a["ccp_rate"] + a["monthly_web_hosting_cost"]
+        marketing = subs["am"][i] * a["affiliate_cpa"] + traffic["sem"][i] * a["sem_cpc"] + a["monthly_seo_marketing_cost"]
+        ebt.append(income - cogs - a["monthly_labor_cost"] - marketing - a["monthly_techsoft_cost"])
+    columns["Earnings Before Taxes"] = ebt
+    cash_flow = [ebt[0]]
+    for i in range(1, 60):
+        cash_flow.append(cash_flow[i - 1] + ebt[i])
+    columns["Cash Flow Accumulation"] = cash_flow
+    return [month.year for month in months], columns
+
+
+SCENARIOS = [
+    {},
+    {"kick_off_date": date(2025, 3, 1), "churn_rate": 0.07, "free_trial_days": 14, "sem_traffic_gr_y1": 0.0},
+    {
+        "kick_off_date": date(2024, 11, 1),
+        "sem_traffic_gr_y3": -0.05,
+        "seo_cr_y5": 0.12,
+        "cpm": 2.5,
+        "am_ctr": 0.01,
+        "am_ocr": 0.2,
+        "am_cpa": 40,
+        "views per visit": 3,
+    },
+]
+
+
+@pytest.mark.parametrize("overrides", SCENARIOS)
+def test_project_matches_loop_engine(overrides):
+    a = {**default_assumptions(), **overrides}
+    years, expected = loop_projection(a)
+    result = project(a)
+
+    assert result.columns["Year"].tolist() == years
+    for name, values in expected.items():
+        np.testing.assert_allclose(result.columns[name], values, rtol=1e-9, atol=1e-6, err_msg=name)
+    expected_years = sorted(set(years))
+    assert result.years.tolist() == expected_years
+    for name in ("Revenue", "Earnings Before Taxes"):
+        sums = [sum(value for year, value in zip(years, expected[name]) if year == y) for y in expected_years]
+        np.testing.assert_allclose(result.yearly[name], sums, rtol=1e-9, err_msg=name)
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 60, 129])
+def test_linear_recurrence_matches_loop(n):
+    rng = np.random.default_rng(n)
+    a, b = rng.uniform(0.5, 1.1, (3, n)), rng.normal(size=(3, n))
+    expected = np.zeros_like(b)
+    for t in range(n):
+        expected[:, t] = (a[:, t] * expected[:, t - 1] if t else 0) + b[:, t]
+    np.testing.assert_allclose(linear_recurrence(a, b), expected, rtol=1e-12)
@@ -0,0 +1,55 @@
+"""``CompactFrame``: month-constant columns as scalars and float32 storage."""
+
+from datetime import date
+
+import numpy as np
+
+from saas_model import default_assumptions, project, project_batch
+from saas_model.batch import base_scenarios
+from saas_model.frame import cast, compact, expand, frame_nbytes
+
+
+def test_round_trip_of_a_projection():
+    result = project({})
+    frame = compact(result.months, result.columns)
+    columns = expand(frame)
+    assert list(columns) == list(result.columns)
+    for name, values in result.columns.items():
+        np.testing.assert_array_equal(columns[name], values, err_msg=name)
+    assert "Web Hosting" in frame.constants and "Revenue" in frame.columns
+    # Constants come back as read-only broadcast views
+    assert not columns["Web Hosting"].flags.writeable
+
+
+def test_float32_storage():
+    scenarios = base_scenarios(default_assumptions(), 8, {"churn_rate": np.linspace(0.05, 0.4, 8)})
+    projection = project_batch(scenarios, kick_off_date=date(2026, 1, 1))
+    months = np.arange("2026-01", "2031-01", dtype="datetime64[M]")
+    full = compact(months, projection)
+    small = compact(months, projection, dtype=np.float32)
+    assert frame_nbytes(small) < frame_nbytes(full) / 1.8
+    expanded = expand(small)
+    for name, values in projection.items():
+        values = np.asarray(values)
+        if values.dtype.kind == "f":
+            assert expanded[name].dtype == np.float32
+            np.testing.assert_allclose(expanded[name], values, rtol=1e-6, atol=1e-3, err_msg=name)
+        else:
+            np.testing.assert_array_equal(expanded[name], values, err_msg=name)
+    # Year fits 16 bits
+    assert expanded["Year"].dtype.itemsize == 2
+
+
+def test_constants_per_scenario():
+    values = np.broadcast_to(np.array([[1.0], [2.0]]), (2, 12))
+    frame = compact(np.arange(12), {"constant": values, "varying": np.tile(np.arange(12.0), (2, 1))})
+    assert frame.constants["constant"].tolist() == [1.0, 2.0]
+    assert frame.names == ("constant", "varying")
+    assert expand(frame)["constant"].shape == (2, 12)
+
+
+def test_cast_keeps_broadcast_axes():
+    values = np.broadcast_to(np.arange(60.0), (10_000, 60))
+    stored = cast(values, np.float32)
+    assert stored.strides[0] == 0 and stored.dtype == np.float32
+    assert frame_nbytes(compact(np.arange(60), {"x": stored})) == 60 * 4 + 60 * 8
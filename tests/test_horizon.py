@@ -0,0 +1,66 @@
+"""Configurable horizons and per-period rate vectors."""
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, horizon_months, month_calendar, project, rate_vector
+
+
+def test_horizon_months():
+    assert horizon_months({}) == 60
+    assert horizon_months({"horizon_years": 10}) == 120
+    assert horizon_months({"horizon_years": 1.5}) == 18
+
+
+@pytest.mark.parametrize("horizon_years", [0, -1, 1 / 24])
+def test_horizon_below_one_month_is_rejected(horizon_years):
+    with pytest.raises(ValueError, match="at least one month"):
+        project({"horizon_years": horizon_years})
+
+
+def test_month_calendar_crosses_years():
+    months, years, days = month_calendar(np.datetime64("2027-11"), 4)
+    assert [str(month) for month in months] == ["2027-11", "2027-12", "2028-01", "2028-02"]
+    assert years.tolist() == [2027, 2027, 2028, 2028]
+    assert days.tolist() == [30, 31, 31, 29]
+
+
+def test_rate_sources_agree():
+    yearly = [0.04, 0.05, 0.06]
+    from_keys = rate_vector({"sem_cr_y1": 0.04, "sem_cr_y2": 0.05, "sem_cr_y3": 0.06}, "sem_cr", 48)
+    from_yearly = rate_vector({"sem_cr_yearly": yearly}, "sem_cr", 48)
+    from_monthly = rate_vector({"sem_cr_monthly": np.repeat(yearly, 12)}, "sem_cr", 48)
+    np.testing.assert_array_equal(from_keys, from_yearly)
+    np.testing.assert_array_equal(from_keys, from_monthly)
+    # The last year's value holds past the given periods
+    assert from_keys[36:].tolist() == [0.06] * 12
+
+
+def test_missing_years_keep_the_previous_value():
+    values = rate_vector({"sem_cr_y1": 0.04, "sem_cr_y3": 0.06}, "sem_cr", 36)
+    assert values[12:24].tolist() == [0.04] * 12 and values[24] == 0.06
+
+
+def test_monthly_vector_wins():
+    values = rate_vector({"sem_cr_y1": 0.04, "sem_cr_monthly": [0.1, 0.2]}, "sem_cr", 3)
+    assert values.tolist() == [0.1, 0.2, 0.2]
+
+
+def test_missing_rate_is_named():
+    with pytest.raises(KeyError, match="social_cr"):
+        rate_vector({}, "social_cr", 12)
+
+
+def test_long_horizon_extends_last_rates():
+    result = project({"horizon_years": 7})
+    assert len(result.months) == 84 and len(result.years) == 7
+    growth = result.columns["SEM - Paid Traffic"][1:] / result.columns["SEM - Paid Traffic"][:-1]
+    np.testing.assert_allclose(growth[59:], 1 + default_assumptions()["sem_traffic_gr_y5"])
+
+
+def test_year_six_rates():
+    result = project({"horizon_years": 7, "sem_cr_y6": 0.2})
+    base = project({"horizon_years": 7})
+    ratio = result.columns["SEM Subscriptions"] / base.columns["SEM Subscriptions"]
+    np.testing.assert_allclose(ratio[:60], 1.0)
+    np.testing.assert_allclose(ratio[60:], 0.2 / default_assumptions()["sem_cr_y5"])
@@ -0,0 +1,45 @@
+"""Key metrics stay numeric and match the projection columns they summarize."""
+
+from datetime import date
+
+import numpy as np
+
+from results import format_metrics_table
+from saas_model import key_metrics, project
+from saas_model.model import break_even_month, sem_cac_exceeds_ltv
+
+
+def test_january_values():
+    result = project({"kick_off_date": date(2026, 7, 1)})
+    metrics = key_metrics(result)
+    # July 2026 to June 2031: Januaries of 2027 to 2031
+    assert metrics.years.tolist() == [2027, 2028, 2029, 2030, 2031]
+    january = np.flatnonzero(result.months.astype("datetime64[M]").astype(int) % 12 == 0)
+    np.testing.assert_array_equal(metrics.sem_cac, result.columns["sem_cpa"][january])
+    assert isinstance(metrics.ltv, float) and metrics.ltv > 0
+    assert metrics.sem_applicable and metrics.affiliate_applicable
+
+
+def test_cac_above_ltv_flags():
+    metrics = key_metrics(project({}))
+    flags = sem_cac_exceeds_ltv(metrics)
+    np.testing.assert_array_equal(flags, metrics.sem_cac > metrics.ltv)
+    expensive = key_metrics(project({"sem_cpc": 1_000.0}))
+    assert sem_cac_exceeds_ltv(expensive).all()
+    # Without SEM cost the comparison does not apply
+    assert not sem_cac_exceeds_ltv(key_metrics(project({"sem_cpc": 0.0}))).any()
+
+
+def test_table_is_formatted_at_render_time():
+    metrics = key_metrics(project({}))
+    table = format_metrics_table(metrics).set_index("Metric")
+    assert list(table.columns) == metrics.years.tolist()
+    assert set(table.loc["User Subscription Life Time Value - LTV ($)"]) == {f"${metrics.ltv:,.2f}"}
+    assert table.loc["SEM Paid Customer Acquisition<br>Cost - CAC ($)"].tolist() == [f"${value:,.2f}" for value in metrics.sem_cac]
+    no_sem = format_metrics_table(key_metrics(project({"sem_traffic_m1": 0}))).set_index("Metric")
+    assert set(no_sem.loc["SEM Paid Customer Acquisition<br>Cost - CAC ($)"]) == {"N/A"}
+
+
+def test_break_even_month():
+    cash_flow = np.array([[-3.0, -1.0, 2.0, 4.0], [1.0, 2.0, 3.0, 4.0], [-1.0, 1.0, -1.0, -2.0], [-1.0, 1.0, -1.0, 5.0]])
+    np.testing.assert_array_equal(break_even_month(cash_flow), [3, 1, np.nan, 4])
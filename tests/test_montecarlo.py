@@ -0,0 +1,67 @@
+"""Monte Carlo sampling and percentile bands."""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, project
+from saas_model.montecarlo import Distribution, run_chunks, sample_assumptions, sample_multipliers, simulate
+
+DISTRIBUTIONS = {"churn_rate": Distribution("normal", 0.2), "sem_cpc": Distribution("lognormal", 0.3)}
+
+
+@pytest.mark.parametrize("kind", ["normal", "lognormal", "uniform", "triangular"])
+def test_multipliers_center_on_one(kind):
+    multipliers = sample_multipliers(Distribution(kind, 0.1), 200_000, np.random.default_rng(0))
+    assert multipliers.mean() == pytest.approx(1.0, abs=2e-3)
+
+
+def test_unknown_distribution():
+    with pytest.raises(ValueError, match="beta"):
+        sample_multipliers(Distribution("beta", 0.1), 10, np.random.default_rng(0))
+
+
+def test_samples_stay_in_bounds():
+    base = default_assumptions()
+    sampled = sample_assumptions(base, {"churn_rate": Distribution("normal", 5.0), "sem_cr_y1": Distribution("uniform", 50.0)}, 10_000, np.random.default_rng(1))
+    assert sampled["churn_rate"].min() >= 0.01 and sampled["churn_rate"].max() <= 1.0
+    assert sampled["sem_cr_y1"].min() >= 0.0 and sampled["sem_cr_y1"].max() <= 1.0
+    np.testing.assert_array_equal(sampled["sem_cpc"], base["sem_cpc"])
+
+
+def test_zero_spread_matches_project():
+    base = {
+        **default_assumptions(),
+        "extra_channels": [{"key": "social", "cost_model": "cpc"}],
+        "social_traffic_m1": 5000,
+        "social_traffic_gr_y1": 0.03,
+        "social_cr_y1": 0.02,
+        "social_cpc": 0.5,
+    }
+    result = simulate(base, {"churn_rate": Distribution("normal", 0.0)}, n_runs=50, chunk_size=20, seed=1, workers=1)
+    expected = project(base).columns
+    for name in ("Revenue", "Cash Flow Accumulation"):
+        for band in result.percentiles[name]:
+            np.testing.assert_allclose(band, expected[name], rtol=1e-12)
+        np.testing.assert_allclose(result.std[name], 0.0, atol=1e-6 * np.abs(expected[name]).max())
+
+
+def test_bands_are_ordered():
+    result = simulate(default_assumptions(), DISTRIBUTIONS, n_runs=3_000, chunk_size=1_000, seed=3, workers=1)
+    low, median, high = result.percentiles["Cash Flow Accumulation"]
+    assert np.all(low <= median) and np.all(median <= high)
+    assert result.n_runs == 3_000
+    assert np.all((result.prob_negative_cash_flow >= 0) & (result.prob_negative_cash_flow <= 1))
+
+
+def test_results_do_not_depend_on_workers():
+    base = default_assumptions()
+    in_process = [chunk["Revenue"] for chunk in run_chunks(base, DISTRIBUTIONS, 500, chunk_size=200, seed=7, workers=1)]
+    with ProcessPoolExecutor(2) as pool:
+        pooled = [chunk["Revenue"] for chunk in run_chunks(base, DISTRIBUTIONS, 500, chunk_size=200, seed=7, workers=2, pool=pool)]
+        # The shared pool stays usable after the call
+        assert pool.submit(int, "3").result() == 3
+    assert [len(chunk) for chunk in pooled] == [200, 200, 100]
+    for ours, theirs in zip(in_process, pooled):
+        np.testing.assert_array_equal(ours, theirs)
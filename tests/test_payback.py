@@ -0,0 +1,65 @@
+"""Closed-form ``payback_months`` against the cumulative LTV table lookup the app used to build."""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from saas_model import payback_months
+
+
+def lookup_payback(cac, subscription_price, trial_to_paid, churn_rate, free_trial_days):
+    """The original lookup: months of the first accumulated value >= ``cac``, or inf for "No Pay Back"."""
+    renewal_rate = 1 - churn_rate
+    ltv = subscription_price * trial_to_paid / (1 - renewal_rate)
+    period_values = [subscription_price * trial_to_paid]
+    while sum(period_values) < ltv * 0.999:
+        period_values.append(period_values[-1] * renewal_rate)
+    if ltv < cac:
+        return math.inf
+    accumulated = 0.0
+    for k, value in enumerate(period_values):
+        accumulated += value
+        if accumulated >= cac:
+            return free_trial_days / 30 + k
+    return math.inf
+
+
+PARAMETERS = list(itertools.product((9.99, 25.5, 120.0), (0.1, 0.25, 1.0), (0.03, 0.25, 0.6, 1.0), (0, 7, 30)))
+
+
+@pytest.mark.parametrize("price, trial_to_paid, churn_rate, trial_days", PARAMETERS)
+def test_matches_lookup(price, trial_to_paid, churn_rate, trial_days):
+    ltv = price * trial_to_paid / churn_rate
+    cacs = np.concatenate([[0.0, -5.0, price * trial_to_paid, ltv, ltv * 2], np.linspace(0, ltv * 1.01, 257)])
+    expected = [lookup_payback(cac, price, trial_to_paid, churn_rate, trial_days) for cac in cacs]
+    np.testing.assert_array_equal(payback_months(cacs, price, trial_to_paid, churn_rate, trial_days), expected)
+
+
+def test_exact_accumulated_values_pay_back_that_month():
+    price, trial_to_paid, churn_rate = 25.5, 0.25, 0.25
+    accumulated = np.cumsum(price * trial_to_paid * (1 - churn_rate) ** np.arange(20))
+    expected = [lookup_payback(cac, price, trial_to_paid, churn_rate, 7) for cac in accumulated]
+    np.testing.assert_array_equal(payback_months(accumulated, price, trial_to_paid, churn_rate, 7), expected)
+
+
+def test_infinite_cac_never_pays_back():
+    assert payback_months(np.inf, 25.5, 0.25, 0.25, 7) == np.inf
+    assert lookup_payback(np.inf, 25.5, 0.25, 0.25, 7) == np.inf
+
+
+def test_nan_cac_stays_nan():
+    # sem_cpa is NaN (0 / 0) in months without SEM subscriptions; the lookup called those "No Pay Back"
+    result = payback_months(np.array([np.nan, 1.0]), 25.5, 0.25, 0.25, 7)
+    assert np.isnan(result[0])
+    assert result[1] == 7 / 30
+
+
+def test_broadcasts_over_scenarios():
+    churn = np.array([[0.1], [0.5]])
+    cac = np.array([5.0, 30.0, 500.0])
+    result = payback_months(cac, 25.5, 0.25, churn, 7)
+    assert result.shape == (2, 3)
+    for row, rate in enumerate(churn[:, 0]):
+        np.testing.assert_array_equal(result[row], [lookup_payback(c, 25.5, 0.25, rate, 7) for c in cac])
@@ -0,0 +1,51 @@
+"""The app's results cache (``results.get_results``)."""
+
+import pytest
+
+import results
+from saas_model import default_assumptions
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(results, "RESULTS_CACHE", results.LRUCache(maxsize=4))
+    monkeypatch.setattr(results, "disk_cache", lambda: None)
+
+
+def test_identical_inputs_are_computed_once(monkeypatch):
+    calls = []
+    compute = results.compute_results
+    monkeypatch.setattr(results, "compute_results", lambda form_data: calls.append(1) or compute(form_data))
+    form_data = default_assumptions()
+    first = results.get_results(form_data)
+    second = results.get_results({**form_data, "monthly_labor_cost": float(form_data["monthly_labor_cost"])})
+    assert second is first
+    assert len(calls) == 1
+    assert results.get_results({**form_data, "churn_rate": 0.3}) is not first
+    assert len(calls) == 2
+
+
+class MissOnce(results.LRUCache):
+    """Misses the first lookup, as if another session stored the entry right after it."""
+
+    def __init__(self):
+        super().__init__()
+        self.missed = False
+
+    def get(self, key):
+        if not self.missed:
+            self.missed = True
+            return None
+        return super().get(key)
+
+
+def test_results_stored_during_the_lookup_are_not_recomputed(monkeypatch):
+    form_data = default_assumptions()
+    stored = results.get_results(form_data)
+    cache = MissOnce()
+    cache.put(results.assumptions_key(form_data), stored)
+    monkeypatch.setattr(results, "RESULTS_CACHE", cache)
+    monkeypatch.setattr(results, "compute_results", lambda form_data: pytest.fail("recomputed"))
+    before = results.REGISTRY.request_counts().get("cached", 0)
+    assert results.get_results(form_data) is stored
+    assert results.REGISTRY.request_counts().get("cached", 0) == before + 1
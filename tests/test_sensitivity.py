@@ -0,0 +1,49 @@
+"""Sensitivity grids and tornado swings against one projection per scenario."""
+
+import numpy as np
+import pytest
+
+from saas_model import project
+from saas_model.sensitivity import METRICS, scenario_metrics, tornado, two_way_grid
+
+
+def _metrics(assumptions):
+    columns = project(assumptions).columns
+    projection = {name: np.asarray(values)[np.newaxis] for name, values in columns.items()}
+    return {name: float(values[0]) for name, values in scenario_metrics(projection).items()}
+
+
+def test_grid_matches_single_projections():
+    prices, churns = [10.0, 25.0, 40.0], [0.05, 0.2]
+    grid = two_way_grid({}, "subscription_price", prices, "churn_rate", churns)
+    assert set(grid.metrics) == set(METRICS)
+    for row, churn in enumerate(churns):
+        for column, price in enumerate(prices):
+            expected = _metrics({"subscription_price": price, "churn_rate": churn})
+            for name in METRICS:
+                np.testing.assert_allclose(grid.metrics[name][row, column], expected[name], rtol=1e-12, err_msg=name)
+
+
+def test_grid_axes_must_differ():
+    with pytest.raises(ValueError, match="churn_rate"):
+        two_way_grid({}, "churn_rate", [0.1, 0.2], "churn_rate", [0.3])
+
+
+def test_grid_unknown_input():
+    with pytest.raises(KeyError, match="churn"):
+        two_way_grid({}, "churn", [0.1], "subscription_price", [10.0])
+
+
+def test_tornado_bars():
+    result = tornado({}, keys=["subscription_price", "churn_rate", "seo_cr_y1"], change=0.2)
+    assert result.base_value == pytest.approx(_metrics({})["Total EBT"], rel=1e-12)
+    swings = [abs(bar.high_metric - bar.low_metric) for bar in result.bars]
+    assert swings == sorted(swings, reverse=True)
+    for bar in result.bars:
+        assert bar.low_metric == pytest.approx(_metrics({bar.key: bar.low_value})["Total EBT"], rel=1e-12)
+        assert bar.high_metric == pytest.approx(_metrics({bar.key: bar.high_value})["Total EBT"], rel=1e-12)
+
+
+def test_tornado_keeps_values_in_range():
+    bars = {bar.key: bar for bar in tornado({"sem_cr_y1": 0.95}, keys=["sem_cr_y1"], change=0.5).bars}
+    assert (bars["sem_cr_y1"].low_value, bars["sem_cr_y1"].high_value) == pytest.approx((0.475, 1.0))
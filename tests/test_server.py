@@ -0,0 +1,158 @@
+"""Request validation and error responses of ``saas_model.server``."""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from saas_model.server import (
+    MAX_HORIZON_MONTHS,
+    MAX_SCENARIOS,
+    HTTPError,
+    ProjectionServer,
+    _read_request,
+    check_assumptions,
+    parse_scenarios,
+)
+
+
+def _body(payload):
+    return json.dumps(payload).encode()
+
+
+@pytest.fixture
+def server():
+    # Threads instead of worker processes: the routes and error handling are the same
+    server = ProjectionServer(workers=1)
+    server.pool = ThreadPoolExecutor(1)
+    yield server
+    server.pool.shutdown()
+
+
+def respond(server, method, target, body=b"", headers=None):
+    return asyncio.run(server.respond(method, target, headers or {}, body, {}))
+
+
+def status_of(server, method, target, body=b""):
+    try:
+        return respond(server, method, target, body)[0]
+    except HTTPError as error:
+        return error.status
+
+
+def test_check_assumptions_returns_horizon():
+    assert check_assumptions({}) == 60
+    assert check_assumptions({"horizon_years": 2, "kick_off_date": "2026-03-01", "sem_cr_yearly": [0.04, 0.05]}) == 24
+
+
+@pytest.mark.parametrize("assumptions, message", [
+    ({"horizon_years": 0}, "at least one month"),
+    ({"horizon_years": -1}, "at least one month"),
+    ({"horizon_years": MAX_HORIZON_MONTHS / 12 + 1}, "at most"),
+    ({"horizon_years": 1e308}, "at most"),
+    ({"churn_rate": 0}, "churn_rate must be between 0.01 and 1"),
+    ({"sem_cr_y1": 1.5}, "sem_cr_y1 must be between 0 and 1"),
+    ({"seo_traffic_gr_y6": -0.1}, "seo_traffic_gr_y6 must be between 0 and 1"),
+    ({"am_cr_yearly": [0.02, 2.0]}, "am_cr_yearly must be between 0 and 1"),
+    ({"subscription_price": -5}, "subscription_price must be at least 0"),
+    ({"sem_cpc": -0.5}, "sem_cpc must be at least 0"),
+    ({"free_trial_days": 29}, "free_trial_days must be between 0 and 28"),
+    ({"views per visit": 0.5}, "views per visit must be at least 1"),
+    ({"churn_rate": [0.1, 0.2]}, "finite number"),
+    ({"churn_rate": "0.2"}, "finite number"),
+    ({"churn_rate": True}, "finite number"),
+    ({"churn_rate": None}, "finite number"),
+    ({"sem_cpc": float("nan")}, "finite number"),
+    ({"sem_cr_y6": float("inf")}, "finite number"),
+    ({"sem_cr_yearly": []}, "non-empty list"),
+    ({"sem_cr_monthly": [0.04, "x"]}, "non-empty list"),
+    ({"kick_off_date": None}, "kick_off_date"),
+    ({"kick_off_date": "nonsense"}, "kick_off_date"),
+    ({"kick_off_date": "NaT"}, "kick_off_date"),
+    ({"extra_channels": [{"key": "social", "cost_model": "cpc"}], "social_cpc": "free"}, "social_cpc"),
+    ({"extra_channels": [{"key": "social", "cost_model": "cpc"}], "social_cr_y1": 3}, "social_cr_y1 must be between 0 and 1"),
+])
+def test_invalid_values_are_unprocessable(assumptions, message):
+    with pytest.raises(HTTPError) as error:
+        parse_scenarios(_body(assumptions))
+    assert error.value.status == 422
+    assert message in str(error.value)
+
+
+def test_batch_errors_name_the_scenario():
+    with pytest.raises(HTTPError) as error:
+        parse_scenarios(_body({"scenarios": [{}, {"churn_rate": "high"}]}))
+    assert error.value.status == 422
+    assert "scenario 1:" in str(error.value)
+
+
+@pytest.mark.parametrize("body, status", [
+    (b"{not json", 400),
+    (_body([1, 2]), 400),
+    (_body({"scenarios": []}), 400),
+    (_body({"scenarios": [{}, 3]}), 400),
+    (_body({"scenarios": [{}] * (MAX_SCENARIOS + 1)}), 413),
+    (_body({"scenarios": [{"horizon_years": 50}] * 1_001}), 413),
+])
+def test_malformed_requests(body, status):
+    with pytest.raises(HTTPError) as error:
+        parse_scenarios(body)
+    assert error.value.status == status
+
+
+def test_values_at_the_limits_are_valid():
+    assert check_assumptions({"churn_rate": 0.01, "free_trial_days": 28, "sem_cr_y1": 1.0, "sem_cpc": 0.0, "horizon_years": 50}) == 600
+
+
+def _read(raw):
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await _read_request(reader)
+    return asyncio.run(read())
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", "+2", "1_0", "2.0", "\u00b2"])
+def test_invalid_content_length(length):
+    with pytest.raises(HTTPError) as error:
+        _read(f"POST /project HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}".encode("utf-8"))
+    assert error.value.status == 400
+
+
+def test_request_with_a_body():
+    method, target, headers, body = _read(b"POST /project HTTP/1.1\r\nContent-Length: 2\r\nAccept: */*\r\n\r\n{}")
+    assert (method, target, body) == ("POST", "/project", b"{}")
+    assert headers == {"content-length": "2", "accept": "*/*"}
+
+
+def test_valid_batch():
+    scenarios, batched = parse_scenarios(_body({"scenarios": [{}, {"churn_rate": 0.2}]}))
+    assert batched and scenarios[1] == {"churn_rate": 0.2}
+    assert parse_scenarios(b"") == ([{}], False)
+
+
+def test_routes(server):
+    assert status_of(server, "GET", "/nowhere") == 404
+    assert status_of(server, "GET", "/project") == 405
+    assert status_of(server, "POST", "/project", b"{") == 400
+    assert status_of(server, "POST", "/project", _body({"horizon_years": 0})) == 422
+    assert status_of(server, "POST", "/project", _body({"horizon_years": 1e308})) == 422
+    assert status_of(server, "POST", "/project", _body({"churn_rate": -0.1})) == 422
+    assert status_of(server, "POST", "/project?columns=Nope", b"{}") == 422
+    assert status_of(server, "GET", "/health") == 200
+
+
+def test_project_response(server):
+    status, body, content_type, _ = respond(server, "POST", "/project?columns=Revenue", _body({"horizon_years": 1}))
+    assert (status, content_type) == (200, "application/json")
+    report = json.loads(body)
+    assert len(report["monthly"]["Revenue"]) == 12
+    assert server.pending == 0
+
+
+def test_busy_server_refuses(server):
+    server.pending = server.max_pending
+    status, _, _, headers = respond(server, "POST", "/project", b"{}")
+    assert status == 503 and headers == {"Retry-After": "1"}
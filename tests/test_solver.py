@@ -0,0 +1,79 @@
+"""Goal seek: thresholds found by ``solve`` against direct projections."""
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, project
+from saas_model.bounds import BOUNDS, RATE_BOUNDS, input_bounds
+from saas_model.solver import (
+    break_even_by,
+    default_bounds,
+    expand_variables,
+    sem_cac_below_ltv,
+    solve,
+    year_ebt_at_least,
+)
+
+
+def _break_even_from(assumptions, month):
+    return project(assumptions).columns["Cash Flow Accumulation"][month - 1:].min()
+
+
+def test_price_for_break_even():
+    solution = solve({}, break_even_by(24), ["subscription_price"])
+    assert solution.met
+    price = solution.values["subscription_price"]
+    assert _break_even_from({"subscription_price": price}, 24) >= 0
+    # Just below the threshold the target is missed
+    assert _break_even_from({"subscription_price": price * (1 - 1e-4)}, 24) < 0
+
+
+def test_year_ebt_threshold():
+    goal = project({}).columns["Earnings Before Taxes"][24:36].sum() + 500_000
+    solution = solve({}, year_ebt_at_least(3, goal), ["subscription_price"])
+    price = solution.values["subscription_price"]
+    ebt = project({"subscription_price": price}).columns["Earnings Before Taxes"][24:36].sum()
+    assert goal <= ebt < goal + 1.0
+
+
+def test_variable_groups_move_together():
+    base = default_assumptions()
+    solution = solve({}, break_even_by(36), ["sem_cr_y*"])
+    assert set(solution.values) == set(expand_variables(base, ["sem_cr_y*"]))
+    for key, value in solution.values.items():
+        assert value == pytest.approx(min(base[key] * solution.scale, 1.0))
+    assert _break_even_from(solution.values, 36) >= 0
+
+
+def test_unreachable_target_keeps_current_value():
+    solution = solve({}, year_ebt_at_least(1, 1e12), ["subscription_price"], bounds=(0.0, 100.0))
+    assert not solution.met
+    assert solution.values["subscription_price"] == default_assumptions()["subscription_price"]
+
+
+@pytest.mark.parametrize("make_target", [lambda: break_even_by(0), lambda: year_ebt_at_least(0, 1.0), lambda: sem_cac_below_ltv(-1)])
+def test_periods_before_the_start(make_target):
+    with pytest.raises(ValueError, match="must be between 1"):
+        make_target()
+
+
+@pytest.mark.parametrize("target", [break_even_by(61), year_ebt_at_least(6, 1.0), sem_cac_below_ltv(6)])
+def test_periods_past_the_horizon(target):
+    with pytest.raises(ValueError, match="60-month horizon"):
+        solve({}, target, ["subscription_price"])
+    # A longer horizon covers them
+    solve({"horizon_years": 6}, target, ["subscription_price"])
+
+
+def test_unknown_variable():
+    with pytest.raises(KeyError, match="nonexistent"):
+        solve({}, break_even_by(12), ["nonexistent*"])
+
+
+def test_default_bounds():
+    assert default_bounds("churn_rate", 0.1) == BOUNDS["churn_rate"]
+    assert default_bounds("seo_cr_y2", 0.02) == RATE_BOUNDS
+    assert default_bounds("subscription_price", 20.0) == (0.0, 200.0)
+    assert default_bounds("views per visit", 0.0) == (1.0, 2.0)
+    assert input_bounds("sem_traffic_gr_y3") == RATE_BOUNDS
+    assert input_bounds("subscription_price") == (0.0, np.inf)
@@ -0,0 +1,87 @@
+"""``StagedModel`` reuses the stages whose inputs did not change."""
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions, horizon_months, project
+from saas_model.model import STAGES
+from saas_model.stages import Stage, StagedModel
+
+
+def _inputs(**overrides):
+    a = {**default_assumptions(), **overrides}
+    return {**a, "horizon": horizon_months(a)}
+
+
+def _reused(runs):
+    return {run.name: run.reused for run in runs}
+
+
+def test_cost_edit_reuses_upstream_stages():
+    model = StagedModel(STAGES)
+    first, runs = model.run(_inputs())
+    assert not any(_reused(runs).values())
+
+    second, runs = model.run(_inputs(monthly_labor_cost=12_000))
+    reused = _reused(runs)
+    assert reused["calendar"] and reused["traffic"] and reused["subscriptions"] and reused["transactions"]
+    assert not reused["costs"] and not reused["cash_flow"]
+    assert second["traffic"] is first["traffic"]
+
+    fresh, _ = StagedModel(STAGES).run(_inputs(monthly_labor_cost=12_000))
+    for stage in ("costs", "cash_flow"):
+        for name, values in fresh[stage].items():
+            np.testing.assert_array_equal(second[stage][name], values, err_msg=name)
+
+
+def test_rate_vector_edit_invalidates_its_stage():
+    model = StagedModel(STAGES)
+    model.run(_inputs())
+    _, runs = model.run(_inputs(sem_cr_y3=0.07))
+    reused = _reused(runs)
+    assert reused["traffic"]
+    assert not reused["subscriptions"] and not reused["transactions"]
+
+
+def test_identical_inputs_reuse_everything():
+    model = StagedModel(STAGES)
+    model.run(_inputs(subscription_price=31.0))
+    _, runs = model.run(_inputs(subscription_price=31))
+    assert all(_reused(runs).values())
+    assert model.stats()["kpis"]["hits"] == 1
+
+
+def test_cached_outputs_are_read_only():
+    outputs, _ = StagedModel(STAGES).run(_inputs())
+    with pytest.raises(ValueError):
+        outputs["traffic"]["SEM - Paid Traffic"][0] = 0.0
+
+
+def test_stage_computes_only_on_key_change():
+    calls = []
+
+    def double(a):
+        calls.append(a["x"])
+        return {"value": np.array([2 * a["x"]])}
+
+    def plus_y(a, upstream):
+        return {"value": upstream["value"] + a["y"]}
+
+    model = StagedModel([
+        Stage("double", ("x",), (), (), double),
+        Stage("plus_y", ("y",), (), ("double",), plus_y),
+    ], maxsize=2)
+    assert model.run({"x": 1, "y": 1})[0]["plus_y"]["value"].tolist() == [3]
+    assert model.run({"x": 1, "y": 5})[0]["plus_y"]["value"].tolist() == [7]
+    assert model.run({"x": 2, "y": 5})[0]["plus_y"]["value"].tolist() == [9]
+    assert model.run({"x": 1, "y": 5, "unused": 0})[0]["plus_y"]["value"].tolist() == [7]
+    assert calls == [1, 2]
+
+
+def test_project_reports_stage_runs():
+    price = 27.125  # not used by other tests, so the shared model has to compute it
+    first = project({"subscription_price": price})
+    second = project({"subscription_price": price})
+    assert [run.name for run in first.stage_runs] == [stage.name for stage in STAGES]
+    assert all(run.reused for run in second.stage_runs)
+    np.testing.assert_array_equal(first.columns["Revenue"], second.columns["Revenue"])
@@ -0,0 +1,41 @@
+"""Lazy imports: the package and the input form load without the results' dependencies."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from benchmarks.startup import DEFERRED_MODULES
+
+
+def _loaded_by(code, setup=""):
+    # Modules imported by ``code`` in a fresh interpreter, after running ``setup``
+    script = f"import sys\n{setup}\npreloaded = set(sys.modules)\n{code}\nprint(' '.join(sorted(set(sys.modules) - preloaded)))"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_package_import_defers_numpy():
+    loaded = _loaded_by("import saas_model, saas_model.timing")
+    assert not {"numpy", "saas_model.model", "saas_model.engine"} & loaded
+
+
+def test_lazy_export_loads_on_first_use():
+    loaded = _loaded_by("from saas_model import project")
+    assert {"numpy", "saas_model.model"} <= loaded
+
+
+def test_unknown_export():
+    import saas_model
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+        saas_model.no_such_name
+
+
+def test_first_paint_defers_the_results():
+    pytest.importorskip("streamlit")
+    app = Path(__file__).resolve().parent.parent / "app.py"
+    loaded = _loaded_by(f"AppTest.from_file({str(app)!r}, default_timeout=300).run()", setup="from streamlit.testing.v1 import AppTest")
+    assert "saas_model.timing" in loaded
+    assert not set(DEFERRED_MODULES) & loaded
@@ -0,0 +1,91 @@
+"""Streaming reducers against the exact statistics of all runs at once."""
+
+import numpy as np
+import pytest
+
+from saas_model import default_assumptions
+from saas_model.montecarlo import Distribution, simulate
+from saas_model.streaming import PathSpill, QuantileSketch, SeriesStats
+
+QUANTILES = np.array([0.05, 0.5, 0.95])
+
+
+def _rank_error(sketch_values, data, q):
+    # Distance between the requested rank and the rank of the returned value, as a share of the runs
+    ranks = (data[:, np.newaxis, :] <= sketch_values[np.newaxis, :, :]).mean(axis=0)
+    return np.abs(ranks - q[:, np.newaxis]).max()
+
+
+@pytest.mark.parametrize("chunk", [1, 333, 5_000])
+def test_sketch_quantiles_close_to_exact(chunk):
+    rng = np.random.default_rng(0)
+    data = np.column_stack([rng.normal(size=50_000), rng.lognormal(size=50_000), rng.uniform(size=50_000)])
+    sketch = QuantileSketch(3, capacity=512, seed=1)
+    for start in range(0, len(data), chunk):
+        sketch.update(data[start:start + chunk])
+    estimate = sketch.quantiles(QUANTILES)
+    assert _rank_error(estimate, data, QUANTILES) < 0.01
+    np.testing.assert_allclose(estimate[1], np.quantile(data, 0.5, axis=0), atol=0.05)
+    # Memory is a few levels of at most ``capacity`` rows, not the 50,000 runs
+    assert sum(len(rows) for rows in sketch.levels) < 512 * len(sketch.levels)
+
+
+def test_small_input_is_exact():
+    data = np.arange(101, dtype=float)[:, np.newaxis]
+    sketch = QuantileSketch(1)
+    sketch.update(data)
+    assert sketch.quantiles([0.0, 0.5, 1.0])[:, 0].tolist() == [0.0, 50.0, 100.0]
+
+
+def test_merged_sketches():
+    rng = np.random.default_rng(2)
+    parts = [rng.normal(loc, size=(20_000, 2)) for loc in (0.0, 3.0)]
+    first, second = QuantileSketch(2, capacity=256, seed=3), QuantileSketch(2, capacity=256, seed=4)
+    first.update(parts[0])
+    second.update(parts[1])
+    first.merge(second)
+    assert _rank_error(first.quantiles(QUANTILES), np.concatenate(parts), QUANTILES) < 0.02
+
+
+def test_series_stats_match_numpy():
+    rng = np.random.default_rng(5)
+    # With a 1e9 offset the naive E[x**2] - E[x]**2 variance is off by ~100; the chunked update is not
+    data = 1e9 + rng.normal(size=(10_001, 4))
+    stats = SeriesStats(4)
+    for start in range(0, len(data), 997):
+        stats.update(data[start:start + 997])
+    stats.update(np.empty((0, 4)))
+    assert stats.count == len(data)
+    np.testing.assert_allclose(stats.mean, data.mean(axis=0), rtol=1e-14)
+    np.testing.assert_allclose(stats.variance, data.var(axis=0, ddof=1), rtol=1e-6)
+    np.testing.assert_array_equal(stats.prob_negative, np.zeros(4))
+
+
+def test_prob_negative():
+    stats = SeriesStats(2)
+    stats.update(np.array([[-1.0, 1.0], [2.0, -3.0], [-4.0, -5.0], [1.0, 1.0]]))
+    np.testing.assert_array_equal(stats.prob_negative, [0.5, 0.5])
+
+
+def test_spilled_paths_round_trip(tmp_path):
+    prefix = str(tmp_path / "paths")
+    spill = PathSpill(prefix, ("Revenue", "Cash Flow Accumulation"), n_runs=5, n_months=3)
+    spill.write({"Revenue": np.ones((2, 3)), "Cash Flow Accumulation": np.zeros((2, 3))})
+    spill.write({"Revenue": np.full((3, 3), 2.0), "Cash Flow Accumulation": -np.ones((3, 3))})
+    spill.close()
+    assert spill.paths["Revenue"] == f"{prefix}.revenue.npy"
+    revenue = np.load(spill.paths["Revenue"], mmap_mode="r")
+    assert revenue.shape == (5, 3) and revenue.dtype == np.float32
+    assert revenue[:, 0].tolist() == [1, 1, 2, 2, 2]
+    assert np.load(spill.paths["Cash Flow Accumulation"])[4, 2] == -1
+
+
+def test_simulate_spills_every_run(tmp_path):
+    distributions = {"churn_rate": Distribution("normal", 0.2)}
+    result = simulate(default_assumptions(), distributions, n_runs=2_500, chunk_size=1_000, seed=1, workers=1, spill_path=str(tmp_path / "run"))
+    paths = np.load(result.path_files["Cash Flow Accumulation"], mmap_mode="r")
+    assert paths.shape == (2_500, 60)
+    np.testing.assert_allclose(result.mean["Cash Flow Accumulation"], paths.mean(axis=0, dtype=np.float64), rtol=1e-5)
+    exact = np.quantile(paths, [0.05, 0.5, 0.95], axis=0)
+    scale = np.abs(exact).max()
+    np.testing.assert_allclose(result.percentiles["Cash Flow Accumulation"], exact, atol=0.02 * scale)
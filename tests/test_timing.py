@@ -0,0 +1,98 @@
+"""Phase timing: run breakdowns, the shared registry and its Prometheus text."""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from saas_model import timing
+from saas_model.timing import Registry, current_run, phase, record, timed_run, write_metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    timing.REGISTRY.clear()
+    yield
+    timing.REGISTRY.clear()
+
+
+def test_nested_phases_in_a_run():
+    with timed_run("test") as run:
+        assert current_run() is run
+        with phase("outer"):
+            with phase("inner"):
+                pass
+            # Measured elsewhere, ending now
+            record("stage", 0.0)
+    assert current_run() is None
+    assert [(entry.name, entry.depth) for entry in run.ordered()] == [("outer", 0), ("inner", 1), ("stage", 1)]
+    assert run.seconds >= max(entry.seconds for entry in run.phases)
+    assert timing.REGISTRY.runs == {"test": 1}
+    assert timing.REGISTRY.histograms["stage"][-2:] == [1, 0.0]
+
+
+def test_inner_run_joins_the_active_one():
+    with timed_run("app") as outer:
+        with timed_run("live") as inner:
+            with phase("work"):
+                pass
+    assert inner is outer
+    assert [entry.name for entry in outer.phases] == ["work"]
+    assert timing.REGISTRY.runs == {"app": 1}
+
+
+def test_phase_outside_a_run_still_counts():
+    with phase("lonely"):
+        pass
+    assert timing.REGISTRY.histograms["lonely"][-2] == 1
+
+
+def test_runs_are_logged_as_json(caplog):
+    with caplog.at_level(logging.INFO, logger="saas_model.timing"):
+        with timed_run("logged"):
+            with phase("step"):
+                pass
+    line = json.loads(caplog.records[-1].getMessage())
+    assert line["run"] == "logged" and [entry["phase"] for entry in line["phases"]] == ["step"]
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry(buckets=(0.01, 0.1))
+    for seconds in (0.005, 0.05, 0.5):
+        registry.observe('a"b', seconds)
+    text = registry.prometheus_text()
+    assert 'saas_phase_seconds_bucket{phase="a\\"b",le="0.01"} 1' in text
+    assert 'saas_phase_seconds_bucket{phase="a\\"b",le="0.1"} 2' in text
+    assert 'saas_phase_seconds_bucket{phase="a\\"b",le="+Inf"} 3' in text
+    assert 'saas_phase_seconds_count{phase="a\\"b"} 3' in text
+
+
+def test_request_counts_under_concurrent_updates():
+    registry = Registry()
+
+    def count():
+        for _ in range(2_000):
+            registry.count_request("computed")
+            registry.request_counts()
+
+    threads = [threading.Thread(target=count) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counts = registry.request_counts()
+    assert counts == {"computed": 8_000}
+    # A copy: later updates do not change it
+    registry.count_request("cached")
+    assert counts == {"computed": 8_000}
+    assert 'saas_results_requests_total{outcome="cached"} 1' in registry.prometheus_text()
+
+
+def test_write_metrics(tmp_path):
+    registry = Registry()
+    registry.count_run("app")
+    path = tmp_path / "saas.prom"
+    write_metrics(str(path), registry)
+    assert 'saas_runs_total{run="app"} 1' in path.read_text()
+    assert [entry.name for entry in tmp_path.iterdir()] == ["saas.prom"]